@@ -1,13 +1,19 @@
 """Package for creating simple reliability block diagrams using LaTeX TikZ."""
 
 from . import config
-from .block import Block, Group, Series
+from .batch import CompileResult, compile_many
+from .block import Block, Group, KofN, Series
 from .diagram import Diagram
+from .distributions import Weibull
 
 __all__ = [
     "config",
     "Block",
     "Series",
     "Group",
+    "KofN",
     "Diagram",
+    "Weibull",
+    "compile_many",
+    "CompileResult",
 ]
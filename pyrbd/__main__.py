@@ -0,0 +1,7 @@
+"""Run the `pyrbd` command-line tool with `python -m pyrbd`."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
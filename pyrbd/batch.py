@@ -0,0 +1,125 @@
+"""Module containing parallel compilation of many diagrams."""
+
+from __future__ import annotations
+
+import copy
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+
+from .diagram import Diagram
+
+
+class CompileResult(NamedTuple):
+    """Result of compiling a single diagram with `compile_many`.
+
+    Attributes
+    ----------
+    diagram : Diagram
+        compiled `Diagram` instance
+    files : list[str]
+        list of output filenames, empty if compilation failed
+    error : Exception | None
+        exception raised during compilation, `None` if compilation succeeded
+    """
+
+    diagram: Diagram
+    files: list[str]
+    error: Exception | None
+
+
+def _compile_isolated(
+    diagram: Diagram, output: str | list[str], clear_source: bool, precompiled_preamble: bool
+) -> list[str]:
+    """Write and compile diagram in private working directory and move output files.
+
+    Returns
+    -------
+    list[str]
+        list of output filenames
+    """
+
+    with tempfile.TemporaryDirectory(prefix="pyrbd-") as working_dir:
+        job = copy.copy(diagram)
+        job.filename = os.path.join(working_dir, os.path.basename(diagram.filename))
+        job.write()
+        job.stats.name = diagram.filename
+        diagram.stats = job.stats
+        working_files = job.compile(
+            output, clear_source=clear_source, precompiled_preamble=precompiled_preamble
+        )
+        if not clear_source:
+            working_files.append(f"{job.filename}.tex")
+            working_files.extend(job._subtree_files())  # pylint: disable=protected-access
+
+        output_files: list[str] = []
+        for working_file in working_files:
+            # Keep the full suffix, e.g. `_144dpi.png` of png files in many sizes
+            suffix = working_file.removeprefix(job.filename)
+            shutil.move(working_file, output_file := f"{diagram.filename}{suffix}")
+            output_files.append(output_file)
+
+    return output_files
+
+
+def _compile_result(
+    diagram: Diagram, output: str | list[str], clear_source: bool, precompiled_preamble: bool
+) -> CompileResult:
+    """Compile diagram and catch compilation errors.
+
+    Returns
+    -------
+    CompileResult
+        output filenames or compilation error
+    """
+
+    try:
+        files = _compile_isolated(diagram, output, clear_source, precompiled_preamble)
+        return CompileResult(diagram, files, None)
+    except Exception as err:  # pylint: disable=broad-exception-caught
+        return CompileResult(diagram, [], err)
+
+
+def compile_many(
+    diagrams: list[Diagram],
+    output: str | list[str] = "pdf",
+    max_workers: int | None = None,
+    clear_source: bool = True,
+    precompiled_preamble: bool = False,
+) -> list[CompileResult]:
+    """Write and compile many diagrams concurrently.
+
+    Each diagram is written and compiled in its own temporary working directory, so
+    concurrent LaTeX jobs never share auxiliary files. Conversion of the compiled .pdf
+    files to other formats is serialized, as pymupdf is not thread-safe. Output files are
+    then moved to the same location as `Diagram.compile()` would have written them, and
+    the stage timings are recorded in `Diagram.stats` of each diagram.
+
+    Parameters
+    ----------
+    diagrams : list[Diagram]
+        list of `Diagram` instances
+    output : str | list[str], default='pdf'
+        output format string or list of output formats, see `Diagram.compile()`
+    max_workers : int | None, default=None
+        maximum number of concurrent LaTeX jobs. Defaults to the number of processors
+    clear_source : bool, default=True
+        .tex source files are deleted after compilation if `True`
+    precompiled_preamble : bool, default=False
+        compile with precompiled preamble format if `True`, see `Diagram.compile()`
+
+    Returns
+    -------
+    list[CompileResult]
+        compilation result for each diagram, in the order of `diagrams`
+    """
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(
+            lambda diagram: _compile_result(diagram, output, clear_source, precompiled_preamble),
+            diagrams,
+        )
+
+        return list(results)
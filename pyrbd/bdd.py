@@ -0,0 +1,386 @@
+"""Module containing exact evaluation of block structures with binary decision diagrams.
+
+Leaf blocks of shared components, see `Block.shared_copy()`, make a block structure
+depend on the same component in several places, so it can no longer be evaluated as a
+series/parallel structure of independent blocks. The structure function is instead
+built as a reduced ordered binary decision diagram (BDD) with one variable per component,
+in order of first appearance. Nodes are made unique by a unique table, and combining
+two nodes is memoized, so each pair of nodes is combined at most once. The reliability
+is then the probability of reaching the `1` terminal, computed in a single pass over the
+nodes from the terminals up.
+"""
+
+from __future__ import annotations
+
+import itertools
+from typing import Literal
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .block import Block, Group, KofN, Series
+
+_FALSE = 0
+_TRUE = 1
+
+
+class BDD:
+    """Reduced ordered binary decision diagram of component states.
+
+    Nodes are integers, with `0` and `1` the terminal nodes of failed and functioning
+    structures. Each other node decides on the state of a single component variable.
+
+    Parameters
+    ----------
+    n_variables : int
+        number of component variables
+
+    Attributes
+    ----------
+    variables : list[int]
+        variable of each node, `n_variables` for the terminal nodes
+    lows : list[int]
+        node of each node if its variable component is failed
+    highs : list[int]
+        node of each node if its variable component is functioning
+    """
+
+    def __init__(self, n_variables: int) -> None:
+        self.n_variables = n_variables
+        self.variables = [n_variables, n_variables]
+        self.lows = [_FALSE, _TRUE]
+        self.highs = [_FALSE, _TRUE]
+        self._unique: dict[tuple[int, int, int], int] = {}
+        self._computed: dict[tuple[str, int, int], int] = {}
+
+    def __len__(self) -> int:
+        return len(self.variables)
+
+    def node(self, variable: int, low: int, high: int) -> int:
+        """Get unique node deciding on `variable`, reduced if both branches are equal.
+
+        Parameters
+        ----------
+        variable : int
+            component variable
+        low : int
+            node if the component is failed
+        high : int
+            node if the component is functioning
+
+        Returns
+        -------
+        int
+            node
+        """
+
+        if low == high:
+            return low
+
+        key = (variable, low, high)
+        node = self._unique.get(key)
+        if node is None:
+            node = self._unique[key] = len(self.variables)
+            self.variables.append(variable)
+            self.lows.append(low)
+            self.highs.append(high)
+
+        return node
+
+    def variable(self, variable: int) -> int:
+        """Get node of functioning component `variable`.
+
+        Parameters
+        ----------
+        variable : int
+            component variable
+
+        Returns
+        -------
+        int
+            node
+        """
+
+        return self.node(variable, _FALSE, _TRUE)
+
+    def _lookup(self, operator: str, u: int, v: int) -> int | None:
+        """Get result of terminal cases or computed result, `None` if not computed."""
+
+        if u == v:
+            return u
+        if operator == "and":
+            if _FALSE in (u, v):
+                return _FALSE
+            if _TRUE in (u, v):
+                return v if u == _TRUE else u
+        else:
+            if _TRUE in (u, v):
+                return _TRUE
+            if _FALSE in (u, v):
+                return v if u == _FALSE else u
+
+        return self._computed.get((operator, u, v))
+
+    def _split(self, u: int, v: int) -> tuple[int, tuple[int, int], tuple[int, int]]:
+        """Get top variable of nodes `u` and `v`, and pairs of their low and high nodes."""
+
+        variable = min(self.variables[u], self.variables[v])
+        lows, highs = [], []
+        for node in (u, v):
+            if self.variables[node] == variable:
+                lows.append(self.lows[node])
+                highs.append(self.highs[node])
+            else:
+                lows.append(node)
+                highs.append(node)
+
+        return variable, (min(lows), max(lows)), (min(highs), max(highs))
+
+    def apply(self, operator: Literal["and", "or"], u: int, v: int) -> int:
+        """Combine nodes `u` and `v` with `'and'` or `'or'` operator.
+
+        Pairs of nodes are combined with an explicit stack, not by recursion, and results
+        are memoized across calls.
+
+        Parameters
+        ----------
+        operator : Literal["and", "or"]
+            `'and'` for structures functioning if both structures function, `'or'` for
+            structures functioning if any of the structures functions
+        u : int
+            node
+        v : int
+            node
+
+        Returns
+        -------
+        int
+            combined node
+        """
+
+        # Pairs of nodes are ordered, as both operators are commutative
+        stack = [((min(u, v), max(u, v)), False)]
+        while stack:
+            pair, expanded = stack.pop()
+            if self._lookup(operator, *pair) is not None:
+                continue
+
+            variable, lows, highs = self._split(*pair)
+            low = self._lookup(operator, *lows)
+            high = self._lookup(operator, *highs)
+            if low is not None and high is not None:
+                self._computed[(operator, *pair)] = self.node(variable, low, high)
+            elif not expanded:
+                stack.extend([(pair, True), (lows, False), (highs, False)])
+
+        result = self._lookup(operator, min(u, v), max(u, v))
+        assert result is not None
+
+        return result
+
+    def at_least(self, k: int, nodes: list[int]) -> int:
+        """Get node of structures functioning if at least `k` of `nodes` are functioning.
+
+        Parameters
+        ----------
+        k : int
+            minimum number of functioning structures
+        nodes : list[int]
+            nodes
+
+        Returns
+        -------
+        int
+            node
+        """
+
+        # Nodes of at least 0, ..., k of the nodes so far functioning
+        counts = [_TRUE] + [_FALSE] * k
+        for node in nodes:
+            for j in range(k, 0, -1):
+                counts[j] = self.apply("or", counts[j], self.apply("and", node, counts[j - 1]))
+
+        return counts[k]
+
+    def probability(
+        self, root: int, probabilities: list[NDArray[np.float64]]
+    ) -> NDArray[np.float64]:
+        """Get probability of reaching the `1` terminal from `root`.
+
+        Parameters
+        ----------
+        root : int
+            root node
+        probabilities : list[NDArray[np.float64]]
+            probability arrays of functioning components, one for each variable
+
+        Returns
+        -------
+        NDArray[np.float64]
+            probability array
+        """
+
+        shape = np.broadcast_shapes(*(np.shape(p) for p in probabilities))
+        values = {_FALSE: np.zeros(shape), _TRUE: np.ones(shape)}
+
+        reachable: set[int] = set()
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if node not in reachable and node not in values:
+                reachable.add(node)
+                stack.extend((self.lows[node], self.highs[node]))
+
+        # Child nodes are always created before their parent nodes
+        for node in sorted(reachable):
+            low = values[self.lows[node]]
+            values[node] = low + probabilities[self.variables[node]] * (
+                values[self.highs[node]] - low
+            )
+
+        return values[root].copy()
+
+
+def has_shared_components(blocks: list[Block]) -> bool:
+    """Check if any leaf blocks of `blocks` are the same component.
+
+    Parameters
+    ----------
+    blocks : list[Block]
+        list of `Block` instances
+
+    Returns
+    -------
+    bool
+        `True` if any two leaf blocks have the same `component`
+    """
+
+    components: set[int] = set()
+    for leaf in itertools.chain.from_iterable(block.get_blocks() for block in blocks):
+        if id(leaf.component) in components:
+            return True
+        components.add(id(leaf.component))
+
+    return False
+
+
+def _leaf_order(blocks: list[Block]) -> list[Block]:
+    """Get leaf blocks in depth-first order, visiting blocks with fewer leaf blocks first.
+
+    Any depth-first order keeps decision diagrams of series/parallel structures small.
+    Visiting smaller blocks first orders the variables of larger blocks below them, so
+    combining a large block with smaller blocks only adds nodes above it, also in deeply
+    nested structures.
+    """
+
+    sizes: dict[int, int] = {}
+    stack: list[tuple[Block, bool]] = [(block, False) for block in blocks]
+    while stack:
+        block, visited = stack.pop()
+        if not isinstance(block, (Series, Group)):
+            sizes[id(block)] = 1
+        elif visited:
+            sizes[id(block)] = sum(sizes[id(child)] for child in block.blocks)
+        else:
+            stack.append((block, True))
+            stack.extend((child, False) for child in block.blocks)
+
+    leaves: list[Block] = []
+    pending = sorted(blocks, key=lambda block: sizes[id(block)], reverse=True)
+    while pending:
+        block = pending.pop()
+        if isinstance(block, (Series, Group)):
+            pending.extend(sorted(block.blocks, key=lambda child: sizes[id(child)], reverse=True))
+        else:
+            leaves.append(block)
+
+    return leaves
+
+
+def build(blocks: list[Block]) -> tuple[BDD, int, list[Block]]:
+    """Build binary decision diagram of blocks in series.
+
+    Parameters
+    ----------
+    blocks : list[Block]
+        list of `Block` instances in series
+
+    Returns
+    -------
+    tuple[BDD, int, list[Block]]
+        binary decision diagram, root node, and a leaf block of each component variable
+    """
+
+    components: dict[int, Block] = {}
+    for leaf in _leaf_order(blocks):
+        components.setdefault(id(leaf.component), leaf)
+    variables = {key: variable for variable, key in enumerate(components)}
+    bdd = BDD(len(variables))
+
+    # Post-order traversal with an explicit stack, combining nodes of child blocks
+    nodes: list[int] = []
+    stack: list[tuple[Block, bool]] = [(block, False) for block in reversed(blocks)]
+    while stack:
+        block, visited = stack.pop()
+        if not isinstance(block, (Series, Group)):
+            nodes.append(bdd.variable(variables[id(block.component)]))
+        elif not visited:
+            stack.append((block, True))
+            stack.extend((child, False) for child in reversed(block.blocks))
+        else:
+            children = nodes[-len(block.blocks) :]
+            del nodes[-len(block.blocks) :]
+            nodes.append(_combine(bdd, block, children))
+
+    return bdd, _reduce(bdd, "and", nodes), list(components.values())
+
+
+def _combine(bdd: BDD, block: Series | Group, nodes: list[int]) -> int:
+    """Combine nodes of the child blocks of `block`."""
+
+    if isinstance(block, KofN):
+        return bdd.at_least(block.k, nodes)
+
+    return _reduce(bdd, "and" if isinstance(block, Series) else "or", nodes)
+
+
+def _reduce(bdd: BDD, operator: Literal["and", "or"], nodes: list[int]) -> int:
+    """Combine all `nodes` with `operator`, pairwise in a balanced tree.
+
+    Combining pairs of nodes of similar size keeps intermediate nodes small, where
+    combining each node with the combination of all previous nodes would rebuild the
+    growing combination for each node.
+    """
+
+    identity = _TRUE if operator == "and" else _FALSE
+    while len(nodes) > 1:
+        pairs = itertools.zip_longest(nodes[::2], nodes[1::2], fillvalue=identity)
+        nodes = [bdd.apply(operator, u, v) for u, v in pairs]
+
+    return nodes[0] if nodes else identity
+
+
+def exact_reliability(blocks: list[Block], t: ArrayLike) -> NDArray[np.float64]:
+    """Get exact reliability of blocks in series with shared components.
+
+    Parameters
+    ----------
+    blocks : list[Block]
+        list of `Block` instances in series
+    t : ArrayLike
+        mission time or array of mission times
+
+    Returns
+    -------
+    NDArray[np.float64]
+        reliability with the same shape as `t`
+    """
+
+    t = np.asarray(t, dtype=np.float64)
+    bdd, root, components = build(blocks)
+
+    probabilities = [component.reliability(t) for component in components]
+    if not probabilities:
+        return np.ones(t.shape)
+
+    return bdd.probability(root, probabilities)
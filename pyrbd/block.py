@@ -2,18 +2,88 @@
 
 from __future__ import annotations
 
+import copy
 import itertools
 from collections import namedtuple
-from collections.abc import Generator
-from copy import deepcopy
-from typing import Literal, overload
+from collections.abc import Callable, Generator, Mapping
+from typing import Literal, TypeVar, cast, overload
 
-from .templates import JINJA_ENV
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from . import config
+from .distributions import Distribution
+from .emitter import emit_block, emit_group, emit_series
+from .templates import get_template
 
 Padding = namedtuple("Padding", ["n", "e", "s", "w"])
+_BlockT = TypeVar("_BlockT", bound="Block")
+
+_CHILD_NODE = "\0child node\0"
+"""Placeholder for child nodes in rendered templates."""
+
+_Fragments = tuple[list[str], list[tuple["Block", float | None]]]
+
+
+def _leaf_reliability(block: Block, t: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Get reliability of leaf `Block` instance from its failure data."""
+
+    if block.fixed_reliability is not None:
+        return np.full(t.shape, block.fixed_reliability)
+    if block.failure_rate is not None:
+        return np.exp(-block.failure_rate * t)
+    if block.distribution is not None:
+        return np.broadcast_to(
+            np.asarray(block.distribution.sf(t), dtype=np.float64), t.shape
+        ).copy()
+
+    return np.ones(t.shape)
+
+
+def _count_distributions(values: list[NDArray[np.float64]], k: int) -> list[NDArray[np.float64]]:
+    """Get distributions of the number of functioning blocks, truncated at `k`.
+
+    The distribution after each block is an array of probabilities that exactly
+    `0, ..., k - 1` and at least `k` of the blocks so far are functioning, with shape
+    `(k + 1, *value.shape)`. Each block updates the distribution in a single vectorized
+    step, i.e. `n` blocks take `O(n·k)` operations.
+
+    Returns
+    -------
+    list[NDArray[np.float64]]
+        distributions before the first block and after each block
+    """
 
+    distribution = np.zeros((k + 1, *np.shape(values[0])))
+    distribution[0] = 1.0
+    distributions = [distribution]
+    for value in values:
+        updated = distribution * (1.0 - value)
+        updated[1:] += distribution[:-1] * value
+        updated[k] += distribution[k] * value
+        distributions.append(distribution := updated)
 
-class Block:
+    return distributions
+
+
+def _series_length(series: Series) -> int:
+    """Get length of `Series` instance, counting nested groups as their number of blocks."""
+
+    length = 0
+    stack: list[Block] = list(series.blocks)
+    while stack:
+        block = stack.pop()
+        if isinstance(block, Series):
+            stack.extend(block.blocks)
+        elif isinstance(block, Group):
+            length += len(block.blocks)
+        else:
+            length += 1
+
+    return length
+
+
+class Block:  # pylint: disable=too-many-instance-attributes
     """Block entering a reliability block diagram.
 
     Parameters
@@ -26,6 +96,15 @@ class Block:
         parent `Block` instance
     shift : tuple[float, float], default=(0.0, 0.0)
         additional position shift `(x, y)` relative to `parent` `Block` instance
+    fixed_reliability : float | None, default=None
+        time independent block reliability (optional)
+    failure_rate : float | None, default=None
+        constant block failure rate (optional)
+    distribution : Distribution | None, default=None
+        block failure time distribution (optional)
+    repair_rate : float | None, default=None
+        constant block repair rate used in availability simulations (optional).
+        Blocks without repair rate are not repaired
 
     Attributes
     ----------
@@ -34,7 +113,17 @@ class Block:
     arrow_options : str, default="arrowcolor, thick"
         TikZ arrow formatting options
     arrow_length : float, default=0.5
-        default arrow length between nodes (in cm)
+        arrow length between nodes (in cm)
+    component : Block
+        block representing the physical component of a leaf block, the block itself by
+        default. Leaf blocks with the same `component`, e.g. a shared power supply drawn
+        in several branches, are evaluated as a single component, see `shared_copy()`
+
+    Raises
+    ------
+    ValueError
+        If more than one of `fixed_reliability`, `failure_rate` and `distribution` is given,
+        or if the given failure or repair data is out of range
     """
 
     _template = "block.tex.jinja"
@@ -57,12 +146,37 @@ class Block:
 
     _block_count = itertools.count(start=1)
 
-    def __init__(
+    # Instance attributes are stored in slots, which reduces the memory footprint of
+    # diagrams with many blocks. The `__dict__` slot keeps class attributes such as
+    # `node_options` and `arrow_length` settable per instance, and is only allocated
+    # for instances with such overrides
+    __slots__ = (
+        "text",
+        "color",
+        "parent",
+        "shift",
+        "last",
+        "id",
+        "fixed_reliability",
+        "failure_rate",
+        "distribution",
+        "repair_rate",
+        "component",
+        "_rendered",
+        "__dict__",
+    )
+
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         text: str,
         color: str,
         parent: Block | None = None,
         shift: tuple[float, float] = (0.0, 0.0),
+        *,
+        fixed_reliability: float | None = None,
+        failure_rate: float | None = None,
+        distribution: Distribution | None = None,
+        repair_rate: float | None = None,
     ) -> None:
         self.text = text
         self.color = color
@@ -70,14 +184,39 @@ class Block:
         self.shift = shift
         self.last = self
         self.id = str(next(self._block_count))
-
-    def get_node(self, connector_position: float | None = None) -> str:
+        self.component: Block = self
+        self._rendered: tuple[tuple[object, ...], list[str]] | None = None
+
+        failure_data = (fixed_reliability, failure_rate, distribution)
+        if len(failure_data) - failure_data.count(None) > 1:
+            raise ValueError(
+                "Specify at most one of `fixed_reliability`, `failure_rate` and `distribution`"
+            )
+        if fixed_reliability is not None and not 0.0 <= fixed_reliability <= 1.0:
+            raise ValueError("`fixed_reliability` must be in the interval [0, 1]")
+        if failure_rate is not None and failure_rate < 0.0:
+            raise ValueError("`failure_rate` must be non-negative")
+        if repair_rate is not None and repair_rate <= 0.0:
+            raise ValueError("`repair_rate` must be positive")
+
+        self.fixed_reliability = fixed_reliability
+        self.failure_rate = failure_rate
+        self.distribution = distribution
+        self.repair_rate = repair_rate
+
+    def get_node(
+        self, connector_position: float | None = None, images: Mapping[int, str] | None = None
+    ) -> str:
         """Get TikZ node string.
 
         Parameters
         ----------
         connector_position : float | None, default=None
-            distance in cm to right angle bend in connector. Defaults to `0.5*arrow_length`.
+            distance in cm to right angle bend in connector. Defaults to `0.5*arrow_length`,
+            locked to 0.0 for `Group` class.
+        images : Mapping[int, str] | None, default=None
+            paths of precompiled .pdf images by `id()` of `Group` instances, included
+            instead of rendering the blocks of the group
 
         Returns
         -------
@@ -85,11 +224,135 @@ class Block:
             TikZ string for rendering block
         """
 
+        return "".join(self.iter_node(connector_position, images))
+
+    def iter_node(
+        self, connector_position: float | None = None, images: Mapping[int, str] | None = None
+    ) -> Generator[str, None, None]:
+        """Yield TikZ node string in fragments.
+
+        Nested blocks are rendered iteratively, one block template at a time, so
+        rendering time is linear in output size and not limited by the recursion limit.
+        Each fragment is part of the rendered template of a single block.
+
+        Parameters
+        ----------
+        connector_position : float | None, default=None
+            distance in cm to right angle bend in connector, see `get_node()`
+        images : Mapping[int, str] | None, default=None
+            paths of precompiled group images, see `get_node()`
+
+        Yields
+        ------
+        str
+            TikZ string fragment
+        """
+
+        if images is None:
+            images = {}
+
+        stack: list[str | tuple[Block, float | None]] = [(self, connector_position)]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                yield item
+                continue
+
+            block, position = item
+            block_fragments, children = block._cached_fragments(  # pylint: disable=protected-access
+                position, images.get(id(block))
+            )
+            yield block_fragments[0]
+            for child, fragment in zip(
+                reversed(children), reversed(block_fragments[1:]), strict=True
+            ):
+                stack.extend([fragment, child])
+
+    def _cached_fragments(
+        self,
+        connector_position: float | None,
+        image: str | None,  # pylint: disable=unused-argument
+    ) -> _Fragments:
+        """Get block fragments, re-rendered only if the render key of the block changed.
+
+        If `config.INCREMENTAL_RENDER` is `True`, the rendered fragments of each block are
+        cached together with its render key, so writing a diagram again only re-renders
+        the blocks whose text, color, shift, parent, id or TikZ options changed since the
+        previous render. Otherwise, blocks are always rendered and nothing is kept.
+
+        Parameters
+        ----------
+        connector_position : float | None
+            distance in cm to right angle bend in connector, see `get_node()`
+        image : str | None
+            path of precompiled .pdf image included instead of the block, only used by
+            `Group` instances
+
+        Returns
+        -------
+        tuple[list[str], list[tuple[Block, float | None]]]
+            TikZ string fragments and child `Block` instances, see `_fragments()`
+        """
+
+        if not config.INCREMENTAL_RENDER:
+            self._rendered = None
+            return self._fragments(connector_position)
+
+        key = self._render_key(connector_position)
+        if self._rendered is not None and self._rendered[0] == key:
+            return self._rendered[1], self._children(connector_position)
+
+        block_fragments, children = self._fragments(connector_position)
+        self._rendered = (key, block_fragments)
+
+        return block_fragments, children
+
+    def _render_key(self, connector_position: float | None) -> tuple[object, ...]:
+        """Get tuple of all attributes the rendered fragments of the block depend on."""
+
+        return (
+            type(self),
+            connector_position,
+            self.text,
+            self.color,
+            self.shift,
+            self.arrow_length,
+            self.id,
+            None if self.parent is None else self.parent.last.id,
+            self.node_options,
+            self.arrow_options,
+        )
+
+    def _children(
+        self,
+        connector_position: float | None,  # pylint: disable=unused-argument
+    ) -> list[tuple[Block, float | None]]:
+        """Get child `Block` instances with their connector positions."""
+
+        return []
+
+    def _fragments(self, connector_position: float | None) -> _Fragments:
+        """Render block template with placeholders for child nodes.
+
+        Parameters
+        ----------
+        connector_position : float | None
+            distance in cm to right angle bend in connector, see `get_node()`
+
+        Returns
+        -------
+        tuple[list[str], list[tuple[Block, float | None]]]
+            TikZ string fragments before, between and after child nodes, and child
+            `Block` instances with their connector positions
+        """
+
         if connector_position is None:
             connector_position = self.arrow_length / 2
 
-        environment = JINJA_ENV
-        template = environment.get_template(self._template)
+        if config.FAST_RENDER:
+            return [emit_block(self, connector_position)], []
+
+        template = get_template(self._template)
         context = {
             "type": "Block",
             "block": self,
@@ -97,12 +360,144 @@ class Block:
             "connector_position": connector_position,
         }
 
-        return template.render(context)
+        return [template.render(context)], []
 
     def get_blocks(self) -> Generator[Block, None, None]:
-        """Yield child `Block` istances."""
+        """Yield leaf `Block` instances.
+
+        Nested blocks are traversed with an explicit stack, not by recursion.
+        """
+
+        stack: list[Block] = [self]
+        while stack:
+            block = stack.pop()
+            if isinstance(block, (Series, Group)):
+                stack.extend(reversed(block.blocks))
+            else:
+                yield block
+
+    def copy(self: _BlockT) -> _BlockT:
+        """Get lightweight copy of block.
+
+        Only the block tree is copied, i.e. the block and its child blocks with their ids,
+        parents and shifts. Text, color and failure data are shared with `self`. Unlike
+        `copy.deepcopy`, the parent blocks outside the copied tree are not copied.
+
+        Copied leaf blocks are new components, except leaf blocks of components outside
+        the copied tree, which remain shared with the blocks outside the tree.
+
+        Returns
+        -------
+        Block
+            copy of block
+        """
+
+        copies: dict[int, Block] = {}
+        block = self._copy(copies)
+        for copied in copies.values():
+            copied.component = copies.get(id(copied.component), copied.component)
+
+        return block
+
+    def shared_copy(self: _BlockT) -> _BlockT:
+        """Get lightweight copy of block representing the same physical components.
+
+        Use shared copies to draw a component in several places of a diagram, e.g. a
+        power supply shared by redundant branches. Shared copies are evaluated as a single
+        component, instead of as independent blocks, see `Diagram.evaluate()`.
+
+        Returns
+        -------
+        Block
+            copy of block with leaf blocks sharing the components of the leaf blocks of
+            `self`
+        """
+
+        return self._copy({})
+
+    def _copy(self: _BlockT, copies: dict[int, Block]) -> _BlockT:
+        """Copy block tree and record copies in `copies`, keyed by `id()` of the originals.
+
+        Nested blocks are copied with an explicit stack, not by recursion. Blocks are
+        copied before the blocks following them in a series and before their child blocks,
+        so the parents of copied blocks are already copied.
+        """
+
+        copied: list[tuple[Block, Block]] = []
+        stack: list[Block] = [self]
+        while stack:
+            original = stack.pop()
+            block = copy.copy(original)
+            copies[id(original)] = block
+            if original.parent is not None:
+                block.parent = copies.get(id(original.parent), original.parent)
+            block.last = block
+            copied.append((original, block))
+            if isinstance(original, (Series, Group)):
+                stack.extend(reversed(original.blocks))
+
+        for original, block in copied:
+            if isinstance(block, (Series, Group)):
+                block.blocks = [copies[id(child)] for child in block.blocks]
+                block.last = copies[id(original.last)]
+
+        return cast(_BlockT, copies[id(self)])
+
+    def structure(self, values: Callable[[Block], NDArray[np.float64]]) -> NDArray[np.float64]:
+        """Propagate leaf block values through the series/parallel block structure.
+
+        Leaf values are probabilities of functioning blocks, e.g. reliabilities,
+        or sampled block states given as arrays of zeros and ones. Nested blocks are
+        traversed with an explicit stack, not by recursion, and the values of the blocks
+        of each `Series` or `Group` instance are combined by its `_combine()` method.
+
+        Parameters
+        ----------
+        values : Callable[[Block], NDArray[np.float64]]
+            function returning the value array of a leaf `Block` instance
+
+        Returns
+        -------
+        NDArray[np.float64]
+            value array of block
+        """
+
+        # Value arrays of blocks whose parent series or group is not yet combined
+        results: list[NDArray[np.float64]] = []
+        stack: list[tuple[Block, bool]] = [(self, False)]
+        while stack:
+            block, combine = stack.pop()
+            if not isinstance(block, (Series, Group)):
+                results.append(values(block))
+            elif combine:
+                block_values = results[-len(block.blocks) :]
+                del results[-len(block.blocks) :]
+                results.append(block._combine(block_values))  # pylint: disable=protected-access
+            else:
+                stack.append((block, True))
+                stack.extend((child, False) for child in reversed(block.blocks))
 
-        yield self
+        return results[0]
+
+    def reliability(self, t: ArrayLike) -> NDArray[np.float64]:
+        """Get block reliability at mission time(s) `t`.
+
+        Blocks without failure data never fail, i.e. have unit reliability.
+
+        Parameters
+        ----------
+        t : ArrayLike
+            mission time or array of mission times
+
+        Returns
+        -------
+        NDArray[np.float64]
+            block reliability with the same shape as `t`
+        """
+
+        t = np.asarray(t, dtype=np.float64)
+
+        return self.structure(lambda block: _leaf_reliability(block, t))
 
     def __add__(self, block: Block) -> Series:
         """Add two `Block` instances to make a `Series` instance.
@@ -159,7 +554,7 @@ class Block:
         if value == 1:
             return self
 
-        blocks: list[Block] = [deepcopy(self) for _ in range(value)]
+        blocks: list[Block] = [self.copy() for _ in range(value)]
 
         return Group(blocks, parent=self.parent)
 
@@ -194,7 +589,7 @@ class Block:
         if value == 1:
             return self
 
-        blocks: list[Block] = [deepcopy(self) for _ in range(value)]
+        blocks: list[Block] = [self.copy() for _ in range(value)]
 
         return Series(blocks, parent=self.parent)
 
@@ -240,6 +635,8 @@ class Series(Block):
     pad: Padding = Padding(1, 1, 1, 2.5)
     label_height: float = 5.0
 
+    __slots__ = ("blocks",)
+
     def __init__(
         self,
         blocks: list[Block],
@@ -261,44 +658,53 @@ class Series(Block):
             if not isinstance(block, Series):
                 block.arrow_length = self.internal_arrow_length
 
-        if True in [isinstance(block, Series) for block in self.blocks]:
+        if any(isinstance(block, Series) for block in self.blocks):
             self.shift = (0, 0.25)
 
-    def get_node(self, connector_position: float | None = None) -> str:
-        """Get TikZ node string.
+    def _render_key(self, connector_position: float | None) -> tuple[object, ...]:
+        return (
+            *super()._render_key(connector_position),
+            self.pad,
+            self.label_height,
+            len(self.blocks),
+            self.blocks[0].id,
+        )
 
-        Parameters
-        ----------
-        connector_position : float | None, default=None
-            distance in cm to right angle bend in connector. Defaults to `0.5 * arrow_length`
+    def _children(self, connector_position: float | None) -> list[tuple[Block, float | None]]:
+        if connector_position is None:
+            connector_position = self.arrow_length / 2
 
-        Returns
-        -------
-        str
-            TikZ string for rendering series
+        return [(block, connector_position) for block in self.blocks]
 
-        """
+    def _fragments(self, connector_position: float | None) -> _Fragments:
+        children = self._children(connector_position)
         if connector_position is None:
             connector_position = self.arrow_length / 2
 
-        block_nodes = [block.get_node(connector_position) for block in self.blocks]
+        if config.FAST_RENDER:
+            return emit_series(self, connector_position), children
 
-        environment = JINJA_ENV
-        template = environment.get_template(self._template)
+        template = get_template(self._template)
         context = {
             "type": "Series",
             "block": self,
             "node_options": self.node_options,
             "connector_position": connector_position,
             "pad": self.pad,
-            "block_nodes": block_nodes,
+            "block_nodes": [_CHILD_NODE] * len(self.blocks),
             "first": self.blocks[0],
         }
 
-        return template.render(context)
+        return template.render(context).split(_CHILD_NODE), children
 
-    def get_blocks(self) -> Generator[Block, None, None]:
-        yield from [children for block in self.blocks for children in block.get_blocks()]
+    def _combine(self, values: list[NDArray[np.float64]]) -> NDArray[np.float64]:
+        """Get series value, the product of the values of all blocks in series."""
+
+        result = values[0].copy()
+        for value in values[1:]:
+            result *= value
+
+        return result
 
 
 class Group(Block):
@@ -347,6 +753,8 @@ class Group(Block):
     pad: Padding = Padding(1, 1, 1, 1)
     label_height: float = 5.0
 
+    __slots__ = ("blocks", "_sorted_blocks")
+
     def __init__(
         self,
         blocks: list[Block],
@@ -364,6 +772,8 @@ class Group(Block):
             block.arrow_length = self.internal_arrow_length
             # block.draw_arrow = False
 
+        self._sorted_blocks: tuple[tuple[int, ...], list[Block]] | None = None
+
     @property
     def shifts(self) -> list[float]:
         """List of vertical position shifts for each `Block` instance in group.
@@ -380,50 +790,185 @@ class Group(Block):
 
     @property
     def sorted_blocks(self) -> list[Block]:
-        """Get TikZ string for arrow connecting stacked blocks."""
+        """List of blocks in group with the longest `Series` instance first.
 
-        # scaling = 0.75
+        Nested groups count as their number of blocks in the length of a series. The list
+        is cached until the blocks of the group are replaced.
 
-        series_blocks = [block for block in self.blocks if isinstance(block, Series)]
-        series_blocks.sort(key=lambda block: len(list(block.get_blocks())), reverse=True)
+        Returns
+        -------
+        list[Block]
+            list of blocks in group, starting with the block connecting the group arrows
+        """
 
-        longest_series_index = self.blocks.index(series_blocks[0]) if len(series_blocks) > 0 else 0
-        blocks = deepcopy(self.blocks)
-        longest_series = blocks.pop(longest_series_index)
+        key = tuple(id(block) for block in self.blocks)
+        if self._sorted_blocks is None or self._sorted_blocks[0] != key:
+            series_blocks = [block for block in self.blocks if isinstance(block, Series)]
+            series_blocks.sort(key=_series_length, reverse=True)
 
-        return [longest_series, *blocks]
+            longest_series_index = (
+                self.blocks.index(series_blocks[0]) if len(series_blocks) > 0 else 0
+            )
+            blocks = list(self.blocks)
+            longest_series = blocks.pop(longest_series_index)
+            self._sorted_blocks = (key, [longest_series, *blocks])
 
-    def get_node(self, connector_position: float | None = None) -> str:
-        """Get TikZ node string.
+        return list(self._sorted_blocks[1])
 
-        Parameters
-        ----------
-        connector_position : float | None, default=None
-            distance in cm to right angle bend in connector.
-            Locked to 0.0 for `Group` class
+    @property
+    def label(self) -> str:
+        """Group label text.
 
         Returns
         -------
         str
-            TikZ string for rendering group
+            group label text
         """
 
+        return self.text
+
+    def _render_key(self, connector_position: float | None) -> tuple[object, ...]:
+        return (
+            *super()._render_key(0.0),
+            self.pad,
+            self.label_height,
+            self.end_arrow_scaling,
+            self.internal_arrow_length,
+            tuple(block.id for block in self.sorted_blocks),
+        )
+
+    def _cached_fragments(self, connector_position: float | None, image: str | None) -> _Fragments:
+        if image is None:
+            return super()._cached_fragments(connector_position, image)
+
+        # Group included as precompiled image, without child nodes
+        if not config.INCREMENTAL_RENDER:
+            self._rendered = None
+            return self._image_fragments(image), []
+
+        key = (*self._render_key(connector_position), image)
+        if self._rendered is None or self._rendered[0] != key:
+            self._rendered = (key, self._image_fragments(image))
+
+        return self._rendered[1], []
+
+    def _children(self, connector_position: float | None) -> list[tuple[Block, float | None]]:
+        return [(block, 0.0) for block in self.blocks]
+
+    def _image_fragments(self, image: str) -> list[str]:
+        """Render group included as precompiled .pdf image `image`."""
+
+        if config.FAST_RENDER:
+            return emit_group(self, self.sorted_blocks, image)
+
+        template = get_template(self._template)
+        context = {
+            "type": "Group",
+            "block": self,
+            "node_options": self.node_options,
+            "connector_position": 0.0,
+            "pad": self.pad,
+            "image": image,
+        }
+
+        return [template.render(context)]
+
+    def _fragments(self, connector_position: float | None) -> _Fragments:
         connector_position = 0.0
 
-        block_nodes = [block.get_node(connector_position) for block in self.blocks]
+        children = self._children(connector_position)
+        if config.FAST_RENDER:
+            return emit_group(self, self.sorted_blocks), children
 
-        environment = JINJA_ENV
-        template = environment.get_template(self._template)
+        template = get_template(self._template)
         context = {
             "type": "Group",
             "block": self,
             "node_options": self.node_options,
             "connector_position": connector_position,
             "pad": self.pad,
-            "block_nodes": block_nodes,
+            "block_nodes": [_CHILD_NODE] * len(children),
+            "sorted_blocks": self.sorted_blocks,
+            "image": None,
         }
 
-        return template.render(context)
+        return template.render(context).split(_CHILD_NODE), children
 
-    def get_blocks(self) -> Generator[Block, None, None]:
-        yield from self.blocks
+    def _combine(self, values: list[NDArray[np.float64]]) -> NDArray[np.float64]:
+        """Get group value of redundant blocks, i.e. failing only if all blocks fail."""
+
+        all_failed = 1.0 - values[0]
+        for value in values[1:]:
+            all_failed *= 1.0 - value
+
+        return 1.0 - all_failed
+
+
+class KofN(Group):
+    """Group of `Block` instances functioning if at least `k` blocks are functioning.
+
+    Drawn as a `Group` with a `k/n` label, e.g. for 2-out-of-3 voting. `KofN` with `k=1`
+    is equivalent to `Group`, and with `k=n` to `Series` blocks.
+
+    Parameters
+    ----------
+    blocks : list[Block]
+        list of `Block` instances
+    k : int
+        minimum number of functioning blocks
+    text : str, default=""
+        group label text, shown before the `k/n` label
+    color : str, default="white"
+        group color
+    parent : Block | None, default=None
+        parent `Block` instance
+
+    Raises
+    ------
+    ValueError
+        If `k` is not in the interval `[1, len(blocks)]`
+    """
+
+    __slots__ = ("k",)
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        blocks: list[Block],
+        k: int,
+        text: str = "",
+        color: str = "white",
+        parent: Block | None = None,
+    ) -> None:
+        if not 1 <= k <= len(blocks):
+            raise ValueError(f"`k` must be in the interval [1, {len(blocks)}], got {k=}")
+
+        super().__init__(blocks, text, color, parent)
+        self.k = k
+
+    @property
+    def label(self) -> str:
+        """Group label text with `k/n` label.
+
+        Returns
+        -------
+        str
+            group label text
+        """
+
+        voting = f"{self.k}/{len(self.blocks)}"
+
+        return f"{self.text} ({voting})" if self.text else voting
+
+    def _render_key(self, connector_position: float | None) -> tuple[object, ...]:
+        return (*super()._render_key(connector_position), self.k)
+
+    def _combine(self, values: list[NDArray[np.float64]]) -> NDArray[np.float64]:
+        """Get group value, the probability that at least `k` blocks are functioning.
+
+        The probability is computed with a dynamic programming recurrence over the number
+        of functioning blocks instead of enumerating combinations of blocks.
+        """
+
+        result: NDArray[np.float64] = _count_distributions(values, self.k)[-1][self.k]
+
+        return result
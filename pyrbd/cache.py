@@ -0,0 +1,182 @@
+"""Module containing content-addressed cache for compiled diagram files."""
+
+import contextlib
+import hashlib
+import os
+import shutil
+import tempfile
+
+
+class RenderCache:
+    """Content-addressed cache of compiled diagram files with LRU eviction.
+
+    Each cache entry is a subdirectory of `directory` named by its key, holding the output
+    files of one compilation. Entries are evicted in least recently used order when the total
+    cache size exceeds `max_size`.
+
+    Parameters
+    ----------
+    directory : str
+        cache directory, created if missing
+    max_size : int, default=256 * 2**20
+        maximum total size of cached files (in bytes)
+    """
+
+    _formats: tuple[str, ...] = ("svg", "png", "pdf")
+
+    def __init__(self, directory: str, max_size: int = 256 * 2**20) -> None:
+        self.directory = directory
+        self.max_size = max_size
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def key(*parts: str) -> str:
+        """Get cache key from content strings.
+
+        Parameters
+        ----------
+        *parts : str
+            strings identifying the cached content
+
+        Returns
+        -------
+        str
+            hex digest of `parts`
+        """
+
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+
+        return digest.hexdigest()
+
+    def get(self, key: str, filename: str) -> list[str] | None:
+        """Copy cached files to `filename` with format extensions.
+
+        Parameters
+        ----------
+        key : str
+            cache key
+        filename : str
+            output filename without extension
+
+        Returns
+        -------
+        list[str] | None
+            list of output filenames, `None` if `key` is not cached
+        """
+
+        entry = os.path.join(self.directory, key)
+        if not os.path.isdir(entry):
+            return None
+
+        try:
+            cached_files = sorted(os.listdir(entry), key=self._format_order)
+        except FileNotFoundError:
+            # Entry evicted by concurrent process
+            return None
+
+        output_files: list[str] = []
+        for cached_file in cached_files:
+            suffix = cached_file.removeprefix("output")
+            try:
+                shutil.copyfile(os.path.join(entry, cached_file), output_file := filename + suffix)
+            except FileNotFoundError:
+                if os.path.isdir(entry):
+                    raise
+                # Entry evicted by concurrent process
+                return None
+            output_files.append(output_file)
+
+        # Mark entry as recently used
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(entry)
+
+        return output_files
+
+    def path(self, key: str, suffix: str) -> str | None:
+        """Get path of cached file in place, without copying it.
+
+        Parameters
+        ----------
+        key : str
+            cache key
+        suffix : str
+            filename suffix of cached file, e.g. `'.pdf'`
+
+        Returns
+        -------
+        str | None
+            path of cached file, `None` if `key` is not cached
+        """
+
+        cached_file = os.path.join(self.directory, key, f"output{suffix}")
+        if not os.path.isfile(cached_file):
+            return None
+
+        # Mark entry as recently used
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(os.path.dirname(cached_file))
+
+        return cached_file
+
+    def put(self, key: str, files: list[str], filename: str) -> None:
+        """Store files in cache and evict least recently used entries.
+
+        Parameters
+        ----------
+        key : str
+            cache key
+        files : list[str]
+            list of filenames to cache, each starting with `filename`
+        filename : str
+            output filename without extension
+        """
+
+        entry = os.path.join(self.directory, key)
+        if os.path.isdir(entry):
+            return
+
+        # Populate a temporary directory first, so concurrent readers never see partial entries
+        staging = tempfile.mkdtemp(dir=self.directory, prefix=".tmp-")
+        try:
+            for file in files:
+                suffix = file.removeprefix(filename)
+                shutil.copyfile(file, os.path.join(staging, f"output{suffix}"))
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        try:
+            os.rename(staging, entry)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        self.evict()
+
+    def _format_order(self, cached_file: str) -> tuple[int, str]:
+        """Get sort key ordering cached files by output format."""
+
+        fmt = os.path.splitext(cached_file)[1].lstrip(".")
+        order = self._formats.index(fmt) if fmt in self._formats else len(self._formats)
+
+        return order, cached_file
+
+    def evict(self) -> None:
+        """Remove least recently used entries until cache size is below `max_size`."""
+
+        entries = []
+        for name in os.listdir(self.directory):
+            entry = os.path.join(self.directory, name)
+            if name.startswith(".") or not os.path.isdir(entry):
+                continue
+            size = sum(file.stat().st_size for file in os.scandir(entry))
+            entries.append((os.stat(entry).st_mtime, size, entry))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total_size -= size
@@ -0,0 +1,219 @@
+"""Module containing the `pyrbd` command-line tool.
+
+The tool builds all diagrams of a manifest, see the `manifest` module, concurrently and
+with cached output files, in a single Python process:
+
+```console
+$ pyrbd diagrams.toml --output svg png --jobs 4
+$ pyrbd diagrams.toml --watch
+```
+
+In watch mode, the manifest and factory modules are polled for changes, and only the
+diagrams whose definition, factory source or manifest `config` changed are rebuilt.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from itertools import groupby
+
+from . import config
+from .batch import compile_many
+from .manifest import ManifestEntry, read_manifest
+
+# Options are reset before each manifest read, so options removed from a watched
+# manifest fall back to their defaults
+_DEFAULT_CONFIG = {name: value for name, value in vars(config).items() if name.isupper()}
+
+
+def _parser() -> argparse.ArgumentParser:
+    """Get command-line argument parser."""
+
+    parser = argparse.ArgumentParser(
+        prog="pyrbd", description="Build reliability block diagrams defined in a manifest."
+    )
+    parser.add_argument("manifest", help="manifest file (.json, .toml, .yaml or .yml)")
+    parser.add_argument(
+        "-o",
+        "--output",
+        nargs="+",
+        choices=["pdf", "svg", "png"],
+        default=["pdf"],
+        help="output formats of diagrams without `output` in the manifest (default: pdf)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="maximum number of concurrent LaTeX jobs (default: number of processors)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="cache directory (default: manifest `cache_dir` or .pyrbd-cache next to manifest)",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="disable output file caching")
+    parser.add_argument(
+        "--precompiled-preamble",
+        action="store_true",
+        help="compile with precompiled preamble format",
+    )
+    parser.add_argument(
+        "-w", "--watch", action="store_true", help="rebuild changed diagrams until interrupted"
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        help="polling interval of watch mode in seconds (default: 1.0)",
+    )
+
+    return parser
+
+
+def _read(args: argparse.Namespace, reload: bool = False) -> list[ManifestEntry]:
+    """Read manifest and set cache directory from command-line arguments."""
+
+    for name, value in _DEFAULT_CONFIG.items():
+        setattr(config, name, value)
+    entries = read_manifest(args.manifest, args.output, reload=reload)
+    if args.no_cache:
+        config.CACHE_DIR = None
+    elif args.cache_dir is not None:
+        config.CACHE_DIR = args.cache_dir
+    elif config.CACHE_DIR is None:
+        config.CACHE_DIR = os.path.join(os.path.dirname(args.manifest), ".pyrbd-cache")
+
+    return entries
+
+
+def build(
+    entries: list[ManifestEntry], jobs: int | None = None, precompiled_preamble: bool = False
+) -> list[ManifestEntry]:
+    """Compile manifest diagrams concurrently and report results.
+
+    Output filenames are printed to `stdout` and compilation errors to `stderr`.
+
+    Parameters
+    ----------
+    entries : list[ManifestEntry]
+        diagrams to compile
+    jobs : int | None, default=None
+        maximum number of concurrent LaTeX jobs, see `compile_many()`
+    precompiled_preamble : bool, default=False
+        compile with precompiled preamble format if `True`, see `Diagram.compile()`
+
+    Returns
+    -------
+    list[ManifestEntry]
+        successfully compiled diagrams
+    """
+
+    compiled: list[ManifestEntry] = []
+    by_output = sorted(entries, key=lambda entry: entry.output)
+    for output, output_entries in groupby(by_output, key=lambda entry: entry.output):
+        batch = list(output_entries)
+        results = compile_many(
+            [entry.diagram for entry in batch],
+            output,
+            max_workers=jobs,
+            precompiled_preamble=precompiled_preamble,
+        )
+        for entry, result in zip(batch, results, strict=True):
+            if result.error is None:
+                print(f"{result.diagram.filename}: {', '.join(result.files)}")
+                compiled.append(entry)
+            else:
+                print(f"{result.diagram.filename}: {result.error}", file=sys.stderr)
+
+    return compiled
+
+
+def watch(args: argparse.Namespace) -> None:
+    """Rebuild diagrams with changed inputs whenever the manifest or its sources change.
+
+    Runs until interrupted, e.g. by `Ctrl+C`. Errors reading the manifest or running its
+    factory functions are printed to `stderr`, and the diagrams are rebuilt once the
+    inputs change again.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        parsed command-line arguments
+    """
+
+    signatures: dict[str, str] = {}
+    files = [args.manifest]
+    modified: list[tuple[int, int] | None] = []
+    print(f"Watching {args.manifest} for changes, press Ctrl+C to stop")
+    try:
+        while True:
+            current = [_modified(file) for file in files]
+            if current != modified:
+                modified = current
+                try:
+                    entries = _read(args, reload=True)
+                except (OSError, ValueError, ImportError) as err:
+                    print(f"{args.manifest}: {err}", file=sys.stderr)
+                except Exception as err:  # pylint: disable=broad-exception-caught
+                    # Errors in factory modules being edited, e.g. syntax errors or
+                    # exceptions raised by factory functions, must not stop watching
+                    print(f"{args.manifest}: {type(err).__name__}: {err}", file=sys.stderr)
+                else:
+                    files = [args.manifest, *{file for entry in entries for file in entry.sources}]
+                    modified = [_modified(file) for file in files]
+                    changed = [
+                        entry
+                        for entry in entries
+                        if signatures.get(entry.diagram.filename) != entry.signature
+                    ]
+                    for entry in build(changed, args.jobs, args.precompiled_preamble):
+                        signatures[entry.diagram.filename] = entry.signature
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        pass
+
+
+def _modified(filename: str) -> tuple[int, int] | None:
+    """Get file modification time and size, `None` if the file is missing."""
+
+    try:
+        status = os.stat(filename)
+    except FileNotFoundError:
+        return None
+
+    return status.st_mtime_ns, status.st_size
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run `pyrbd` command-line tool.
+
+    Parameters
+    ----------
+    argv : list[str] | None, default=None
+        command-line arguments. Defaults to `sys.argv[1:]`
+
+    Returns
+    -------
+    int
+        exit status, `1` if the manifest is invalid or any diagram failed to compile
+    """
+
+    args = _parser().parse_args(argv)
+    if args.watch:
+        watch(args)
+        return 0
+
+    try:
+        entries = _read(args)
+    except (OSError, ValueError, ImportError) as err:
+        print(f"{args.manifest}: {err}", file=sys.stderr)
+        return 1
+
+    compiled = build(entries, args.jobs, args.precompiled_preamble)
+
+    return 0 if len(compiled) == len(entries) else 1
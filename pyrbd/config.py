@@ -8,8 +8,73 @@ ARROW_STYLE : str
     arrow head.
 SERIF_FONT : bool
     `False` to use sans-serif font (default), `True` to use serif fonts
+FAST_RENDER : bool
+    `True` to emit TikZ strings of blocks directly with Python format strings instead of
+    rendering a Jinja template per block. The output is identical, but ignores any
+    customized block templates. Defaults to `False`
+INCREMENTAL_RENDER : bool
+    `True` to keep the rendered TikZ fragments of each block, so writing a diagram again
+    only re-renders the blocks that changed since the previous write. Speeds up repeated
+    writes of edited diagrams, at the cost of keeping the rendered output in memory.
+    Defaults to `False`
+CACHE_DIR : str | None
+    directory for caching compiled diagram files. Diagrams with unchanged .tex source,
+    styles and output formats are copied from the cache instead of compiled.
+    The default `None` disables caching
+CACHE_SIZE_LIMIT : int
+    maximum total size of cached files (in bytes). Least recently used files are
+    evicted first
+SUBTREE_CACHE : bool
+    `True` to compile each outermost `Group` of a diagram, i.e. each group not nested in
+    another group, to a standalone .pdf image cached in `CACHE_DIR`, which is copied next
+    to the .tex file and included by `Diagram.write()` instead of the group blocks.
+    Groups shared by many diagrams are then typeset once per content version. Requires
+    `CACHE_DIR`. Defaults to `False`
+PNG_DPI : int | list[int]
+    resolution of .png output files (in dots per inch). A list of resolutions gives one
+    .png file per resolution, named `<name>_<dpi>dpi.png`, e.g. for thumbnails and
+    full size images from a single compilation
+PNG_ALPHA : bool
+    `True` for transparent .png background, `False` for white background (default)
+STAGE_HOOK : Callable[[StageTiming], None] | None
+    function called with the `StageTiming` of each completed pipeline stage, see the
+    `stats` module. The default `None` disables the hook
+FORMAT_DIR : str
+    directory for precompiled LaTeX preamble formats, used by
+    `Diagram.compile(precompiled_preamble=True)`. Must be owned by the current user and
+    not writable by other users. Defaults to `pyrbd/formats` in the per-user cache
+    directory `$XDG_CACHE_HOME`, or `~/.cache` if unset
 """
 
+import os
+from os.path import expanduser, join
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .stats import StageTiming
+
 ARROW_STYLE: str = ""
 
 SERIF_FONT: bool = False
+
+FAST_RENDER: bool = False
+
+INCREMENTAL_RENDER: bool = False
+
+CACHE_DIR: str | None = None
+
+CACHE_SIZE_LIMIT: int = 256 * 2**20
+
+SUBTREE_CACHE: bool = False
+
+PNG_DPI: int | list[int] = 300
+
+PNG_ALPHA: bool = False
+
+STAGE_HOOK: "Callable[[StageTiming], None] | None" = None
+
+FORMAT_DIR: str = join(
+    os.environ.get("XDG_CACHE_HOME") or join(expanduser("~"), ".cache"), "pyrbd", "formats"
+)
@@ -0,0 +1,232 @@
+"""Module containing minimal cut set and path set computation of block structures.
+
+Sets of leaf blocks are represented as integer bitsets, with one bit per leaf block in
+`get_blocks()` order. Minimal sets are derived bottom-up from the `Series` and `Group`
+structure: the cut sets of a series are the union of the cut sets of its blocks, and the
+cut sets of a group are all combinations of one cut set of each of its blocks. Path sets
+are derived likewise with the roles of series and groups swapped. The cut sets of a
+k-out-of-n group are combinations of one cut set of each of `n - k + 1` of its blocks,
+and its path sets combinations of one path set of each of `k` of its blocks.
+
+Blocks that never fail, i.e. without failure data or with unit fixed reliability, are not
+part of any cut or path set.
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Iterable
+from typing import Literal
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .block import Block, Group, KofN, Series
+
+_CHUNK_SIZE = 2**22
+"""Maximum number of signatures or words compared at once in bulk minimization."""
+
+
+def _can_fail(block: Block) -> bool:
+    """Check if leaf `Block` instance has failure data allowing it to fail."""
+
+    if block.fixed_reliability is not None:
+        return block.fixed_reliability < 1.0
+    if block.failure_rate is not None:
+        return block.failure_rate > 0.0
+
+    return block.distribution is not None
+
+
+def _order(bitset: int) -> int:
+    """Get number of blocks in bitset."""
+
+    return bitset.bit_count()
+
+
+def _to_words(bitsets: list[int], n_words: int) -> NDArray[np.uint64]:
+    """Convert bitsets to array of 64 bit words with shape `(len(bitsets), n_words)`."""
+
+    content = b"".join(bitset.to_bytes(8 * n_words, "little") for bitset in bitsets)
+
+    return np.frombuffer(content, dtype="<u8").reshape(len(bitsets), n_words)
+
+
+def minimize(bitsets: Iterable[int], n_bits: int) -> list[int]:
+    """Remove duplicates and supersets of other bitsets.
+
+    Bitsets are compared in bulk as arrays of 64 bit words, one order at a time against
+    all kept bitsets of lower order. Pairs are first filtered by comparing bitsets folded
+    to a single word.
+
+    Parameters
+    ----------
+    bitsets : Iterable[int]
+        integer bitsets
+    n_bits : int
+        number of bits of the largest bitset
+
+    Returns
+    -------
+    list[int]
+        minimal bitsets, ordered by number of set bits
+    """
+
+    unique = sorted(set(bitsets), key=lambda bitset: (_order(bitset), bitset))
+    if not unique or unique[0] == 0:
+        return unique[:1]
+
+    n_words = max(1, -(-n_bits // 64))
+    words = _to_words(unique, n_words)
+    # Folded 64 bit signatures of subsets are subsets of folded signatures of supersets
+    signatures = np.bitwise_or.reduce(words, axis=1)
+    orders = np.array([_order(bitset) for bitset in unique])
+    keep = np.ones(len(unique), dtype=bool)
+    for order in np.unique(orders)[1:]:
+        lower = np.flatnonzero(keep & (orders < order))
+        candidates = np.flatnonzero(orders == order)
+        chunk = max(1, _CHUNK_SIZE // len(lower))
+        for start in range(0, len(candidates), chunk):
+            indices = candidates[start : start + chunk]
+            keep[_supersets(words, signatures, indices, lower)] = False
+
+    return [bitset for bitset, kept in zip(unique, keep, strict=True) if kept]
+
+
+def _leaf_family(
+    block: Block, bit: int, kind: Literal["cut", "path"], max_order: int | None
+) -> list[int]:
+    """Get minimal cut or path sets of leaf `Block` instance with bit index `bit`."""
+
+    if not _can_fail(block):
+        # Blocks that never fail are never cut, and always on a path
+        return [] if kind == "cut" else [0]
+
+    return [] if max_order == 0 else [1 << bit]
+
+
+def _supersets(
+    words: NDArray[np.uint64],
+    signatures: NDArray[np.uint64],
+    candidates: NDArray[np.intp],
+    subsets: NDArray[np.intp],
+) -> NDArray[np.intp]:
+    """Get indices of candidate bitsets that are supersets of any of `subsets`."""
+
+    rows, columns = np.nonzero(
+        signatures[subsets][None, :] & ~signatures[candidates][:, None] == 0
+    )
+    pairs = max(1, _CHUNK_SIZE // words.shape[1])
+    found: list[NDArray[np.intp]] = []
+    for start in range(0, len(rows), pairs):
+        supersets = candidates[rows[start : start + pairs]]
+        subset_words = words[subsets[columns[start : start + pairs]]]
+        found.append(supersets[(words[supersets] & subset_words == subset_words).all(axis=1)])
+
+    return np.concatenate(found) if found else np.empty(0, dtype=np.intp)
+
+
+def _product(families: list[list[int]], max_order: int | None) -> list[int]:
+    """Get all unions of one bitset of each family, up to `max_order` set bits."""
+
+    result = [0]
+    for family in families:
+        if max_order is None:
+            result = [a | b for a in result for b in family]
+        else:
+            result = [a | b for a in result for b in family if _order(a | b) <= max_order]
+        if not result:
+            break
+
+    return result
+
+
+def minimal_sets(
+    blocks: list[Block], kind: Literal["cut", "path"], max_order: int | None = None
+) -> list[list[Block]]:
+    """Get minimal cut sets or path sets of blocks in series.
+
+    Parameters
+    ----------
+    blocks : list[Block]
+        list of `Block` instances in series
+    kind : Literal["cut", "path"]
+        `'cut'` for sets of blocks whose failure fails the series, `'path'` for sets of
+        blocks whose functioning keeps the series functioning
+    max_order : int | None, default=None
+        maximum number of blocks in each set. Defaults to no limit
+
+    Returns
+    -------
+    list[list[Block]]
+        minimal sets of leaf blocks, ordered by number of blocks
+
+    Raises
+    ------
+    ValueError
+        If `kind` is invalid or `max_order` is negative
+    """
+
+    if kind not in ("cut", "path"):
+        raise ValueError(f"Invalid {kind=}, expected 'cut' or 'path'")
+    if max_order is not None and max_order < 0:
+        raise ValueError("`max_order` must be non-negative")
+
+    # Leaf blocks of shared components have a single bit
+    leaves = list(itertools.chain.from_iterable(block.get_blocks() for block in blocks))
+    bits = {id(leaf.component): bit for bit, leaf in reversed(list(enumerate(leaves)))}
+    shared = len(bits) < len(leaves)
+    unions = Series if kind == "cut" else Group
+
+    def combine(block: Block | None, families: list[list[int]]) -> list[int]:
+        """Combine families of child blocks, `block=None` for the blocks in series."""
+
+        if isinstance(block, KofN):
+            # A k-out-of-n group fails if n - k + 1 blocks fail, and functions if k do
+            size = len(families) - block.k + 1 if kind == "cut" else block.k
+            family = [
+                bitset
+                for combination in itertools.combinations(families, size)
+                for bitset in _product(list(combination), max_order)
+            ]
+        elif isinstance(block, unions) or (block is None and kind == "cut"):
+            family = [bitset for child_family in families for bitset in child_family]
+            if 0 in family:
+                family = [0]
+        else:
+            family = _product(families, max_order)
+
+        # Sets of blocks that never fail in k-out-of-n groups may contain each other
+        return minimize(family, len(leaves)) if shared or isinstance(block, KofN) else family
+
+    # Post-order traversal with an explicit stack, combining families of child blocks
+    values: list[list[int]] = []
+    stack: list[tuple[Block, bool]] = [(block, False) for block in reversed(blocks)]
+    while stack:
+        block, visited = stack.pop()
+        if not isinstance(block, (Series, Group)):
+            values.append(_leaf_family(block, bits[id(block.component)], kind, max_order))
+        elif not visited:
+            stack.append((block, True))
+            stack.extend((child, False) for child in reversed(block.blocks))
+        else:
+            n_children = len(block.blocks)
+            families = values[-n_children:]
+            del values[-n_children:]
+            values.append(combine(block, families))
+
+    result = sorted(combine(None, values), key=lambda bitset: (_order(bitset), bitset))
+
+    return [[leaves[bit] for bit in _bits(bitset)] for bitset in result]
+
+
+def _bits(bitset: int) -> list[int]:
+    """Get indices of set bits in ascending order."""
+
+    indices: list[int] = []
+    while bitset:
+        lowest = bitset & -bitset
+        indices.append(lowest.bit_length() - 1)
+        bitset ^= lowest
+
+    return indices
@@ -1,12 +1,100 @@
 """Module containing Diagram class definition."""
 
+import contextlib
+import glob
+import itertools
+import json
+import os
+import shutil
 import subprocess
+import tempfile
+import threading
+from collections.abc import Iterator, Mapping
+from typing import TextIO
 
+import numpy as np
 import pymupdf
+from numpy.typing import ArrayLike, NDArray
 
 from . import config
-from .block import Block, Group
-from .templates import JINJA_ENV
+from .bdd import exact_reliability, has_shared_components
+from .block import Block, Group, Series
+from .cache import RenderCache
+from .cutsets import minimal_sets
+from .importance import Importance, importance
+from .preamble import latexmk_options
+from .simulation import SimulationResult, simulate
+from .stats import Stats
+from .svg import render_svg
+from .sweep import sweep
+from .templates import get_template
+
+_SUBTREE_INFIX = "-subtree-"
+"""Filename infix of copies of cached group images next to the diagram .tex file."""
+
+_PYMUPDF_LOCK = threading.Lock()
+"""Lock serializing pymupdf document access, as pymupdf is not thread-safe."""
+
+
+def _run_latexmk(
+    filename: str,
+    clear_source: bool,
+    precompiled_preamble: bool,
+    clean_up: bool = True,
+    stats: Stats | None = None,
+) -> None:
+    """Compile .tex file to .pdf using `latexmk` and clean up auxiliary files.
+
+    Parameters
+    ----------
+    filename : str
+        .tex filename without extension
+    clear_source : bool
+        .tex source file is deleted after compilation if `True`
+    precompiled_preamble : bool
+        compile with precompiled preamble format if `True`
+    clean_up : bool, default=True
+        auxiliary files are deleted after compilation if `True`
+    stats : Stats | None, default=None
+        recorder of `latexmk` and cleanup stage timings
+
+    Raises
+    ------
+    FileNotFoundError
+        If .tex file is not found
+    """
+
+    not_found_message = (
+        f"File {filename} not found. Check if call to Class method write() is missing."
+    )
+
+    if stats is None:
+        stats = Stats(filename)
+
+    options: list[str] = []
+    environment = None
+    if precompiled_preamble:
+        try:
+            with stats.stage("format"):
+                options, environment = latexmk_options(f"{filename}.tex", config.FORMAT_DIR)
+        except FileNotFoundError as err:
+            raise FileNotFoundError(not_found_message) from err
+
+    try:
+        with stats.stage("latexmk", precompiled_preamble=precompiled_preamble) as details:
+            subprocess.check_call(
+                ["latexmk", "-cd", "--lualatex", *options, f"{filename}.tex", "--silent"],
+                env=environment,
+            )
+            details["pdf_size"] = os.path.getsize(f"{filename}.pdf")
+        if clean_up:
+            with stats.stage("cleanup"):
+                subprocess.check_call(["latexmk", "-cd", "-c", f"{filename}.tex"])
+        if clear_source:
+            os.remove(f"{filename}.tex")
+    except subprocess.CalledProcessError as err:
+        if err.returncode == 11:
+            raise FileNotFoundError(not_found_message) from err
 
 
 class Diagram:
@@ -28,6 +116,8 @@ class Diagram:
     ----------
     colors : dict[str, str], default={"arrowcolor": "4c4d4c", "hazardcolor": "ff6666"}
         default diagram color definitions
+    stats : Stats
+        timings of the pipeline stages since the last call to `Diagram.write()`
     """
 
     _template: str = "diagram.tex.jinja"
@@ -53,26 +143,514 @@ class Diagram:
         if colors is not None:
             self.colors = self.colors | colors
 
-    def write(self) -> None:
-        """Write diagram to .tex file."""
+        self.stats = Stats(self.filename)
+
+    def evaluate(self, t: ArrayLike) -> NDArray[np.float64]:
+        """Evaluate system reliability at mission time(s) `t`.
+
+        The head block and all diagram blocks are evaluated as blocks in series.
+        Blocks without failure data never fail. Diagrams with shared components, see
+        `Block.shared_copy()`, are evaluated exactly with a binary decision diagram, see
+        the `bdd` module.
+
+        Parameters
+        ----------
+        t : ArrayLike
+            mission time or array of mission times
+
+        Returns
+        -------
+        NDArray[np.float64]
+            system reliability with the same shape as `t`
+        """
+
+        t = np.asarray(t, dtype=np.float64)
+        if has_shared_components([self.head, *self.blocks]):
+            return exact_reliability([self.head, *self.blocks], t)
+
+        result = np.ones(t.shape)
+        for block in [self.head, *self.blocks]:
+            result *= block.reliability(t)
+
+        return result
+
+    def cut_sets(self, max_order: int | None = None) -> list[list[Block]]:
+        """Get minimal cut sets of diagram.
+
+        A cut set is a set of leaf blocks whose failure fails the system, i.e. the head
+        block and all diagram blocks in series. Minimal cut sets have no cut set as subset.
+        Blocks that never fail, e.g. blocks without failure data, are not in any cut set.
+
+        Parameters
+        ----------
+        max_order : int | None, default=None
+            maximum number of blocks in each cut set. Defaults to no limit
+
+        Returns
+        -------
+        list[list[Block]]
+            minimal cut sets, ordered by number of blocks
+        """
+
+        return minimal_sets([self.head, *self.blocks], "cut", max_order)
+
+    def path_sets(self, max_order: int | None = None) -> list[list[Block]]:
+        """Get minimal path sets of diagram.
+
+        A path set is a set of leaf blocks whose functioning keeps the system functioning.
+        Minimal path sets have no path set as subset. Blocks that never fail, e.g. blocks
+        without failure data, are not in any path set.
+
+        Parameters
+        ----------
+        max_order : int | None, default=None
+            maximum number of blocks in each path set. Defaults to no limit
+
+        Returns
+        -------
+        list[list[Block]]
+            minimal path sets, ordered by number of blocks
+        """
+
+        return minimal_sets([self.head, *self.blocks], "path", max_order)
+
+    def importance(self, t: ArrayLike) -> dict[str, Importance]:
+        """Get importance measures of all leaf blocks at mission time(s) `t`.
+
+        Birnbaum, criticality and Fussell–Vesely importance of all leaf blocks are
+        computed at once from the series/group structure of their parent blocks, without
+        re-evaluating the system once per block.
+
+        Parameters
+        ----------
+        t : ArrayLike
+            mission time or array of mission times
+
+        Returns
+        -------
+        dict[str, Importance]
+            importance measures by leaf block id, each with the same shape as `t`
+        """
+
+        return importance([self.head, *self.blocks], t)
+
+    def sweep(
+        self,
+        params: Mapping[str, ArrayLike],
+        t: ArrayLike,
+        *,
+        chunk_size: int | None = None,
+        max_workers: int = 1,
+    ) -> NDArray[np.float64]:
+        """Evaluate system reliability over a grid of leaf block failure rates.
+
+        Each parameter array adds its own axes to the grid of all combinations of
+        parameter values, and the grid is evaluated in batches of broadcast arrays
+        instead of one diagram evaluation per grid point, see the `sweep` module.
+
+        Parameters
+        ----------
+        params : Mapping[str, ArrayLike]
+            failure rate values by leaf block id
+        t : ArrayLike
+            mission time or array of mission times
+        chunk_size : int | None, default=None
+            maximum number of grid points evaluated at once. Defaults to all grid points
+        max_workers : int, default=1
+            number of worker processes. Chunks are evaluated in the current process if `1`
+
+        Returns
+        -------
+        NDArray[np.float64]
+            system reliability with shape `(*shape_1, ..., *shape_n, *t.shape)`, where
+            `shape_i` is the shape of the `i`-th parameter array
+        """
+
+        return sweep(
+            [self.head, *self.blocks],
+            params,
+            t,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+        )
+
+    def simulate(  # pylint: disable=too-many-arguments
+        self,
+        n_samples: int,
+        horizon: float,
+        seed: int | None = None,
+        *,
+        batch_size: int = 100_000,
+        max_workers: int = 1,
+    ) -> SimulationResult:
+        """Estimate system reliability and availability by Monte Carlo simulation.
+
+        Failure and repair times of all leaf blocks are sampled in batches of arrays.
+        Each batch has its own random generator spawned from `seed`, so results are
+        reproducible regardless of `max_workers`.
+
+        Parameters
+        ----------
+        n_samples : int
+            number of samples
+        horizon : float
+            mission time
+        seed : int | None, default=None
+            random seed for reproducible results
+        batch_size : int, default=100_000
+            number of samples per batch
+        max_workers : int, default=1
+            number of worker processes. Batches are simulated in the current process if `1`
+
+        Returns
+        -------
+        SimulationResult
+            estimated system reliability and availability
+        """
+
+        return simulate(
+            [self.head, *self.blocks],
+            n_samples,
+            horizon,
+            seed,
+            batch_size=batch_size,
+            max_workers=max_workers,
+        )
+
+    def write(self, stream: TextIO | None = None) -> None:
+        """Write diagram to .tex file.
+
+        The .tex content is rendered and written in fragments as they are produced, so
+        the whole document is never held in memory. If `config.SUBTREE_CACHE` is `True`,
+        the outermost groups are first compiled to cached standalone .pdf images, which
+        are included instead of the group blocks. The images are copied next to
+        `<name>.tex`, so they cannot be evicted from the cache before compilation, and
+        are deleted with the .tex file by `Diagram.compile()`. Images written to `stream`
+        are included from the cache directory in place.
+
+        Parameters
+        ----------
+        stream : TextIO | None, default=None
+            text stream to write to instead of `<name>.tex`, e.g. an open file or a socket
+            wrapped by `socket.makefile('w')`
+
+        Raises
+        ------
+        ValueError
+            If `config.SUBTREE_CACHE` is `True` and `config.CACHE_DIR` is not set
+        """
+
+        self._write(stream, None if stream is not None else self.filename)
+
+    def _write(self, stream: TextIO | None, image_prefix: str | None) -> None:
+        """Write diagram to .tex file or `stream`, see `Diagram.write()`.
+
+        Parameters
+        ----------
+        stream : TextIO | None
+            text stream to write to instead of `<name>.tex`
+        image_prefix : str | None
+            filename prefix of copies of cached group images next to the .tex file,
+            `None` to include the images from the cache directory
+        """
+
+        self.stats = Stats(self.filename)
+        n_nodes = sum(1 for block in [self.head, *self.blocks] for _ in block.get_blocks())
+
+        images = self._subtree_images(image_prefix)
+        with contextlib.ExitStack() as contexts:
+            details = contexts.enter_context(self.stats.stage("write", nodes=n_nodes))
+            if stream is None:
+                stream = contexts.enter_context(
+                    open(f"{self.filename}.tex", mode="w", encoding="utf-8")
+                )
+
+            details["tex_chars"] = 0
+            for fragment in self._tex_fragments(images):
+                stream.write(fragment)
+                details["tex_chars"] += len(fragment)
+
+    def _outermost_groups(self) -> list[Group]:
+        """Get groups of diagram not nested in another group.
+
+        Returns
+        -------
+        list[Group]
+            list of outermost `Group` instances
+        """
+
+        groups: list[Group] = []
+        stack: list[Block] = [self.head, *self.blocks]
+        while stack:
+            block = stack.pop()
+            if isinstance(block, Group):
+                groups.append(block)
+            elif isinstance(block, Series):
+                stack.extend(reversed(block.blocks))
+
+        return groups
+
+    def _subtree_images(self, image_prefix: str | None) -> dict[int, str]:
+        """Get cached standalone images of outermost groups.
+
+        The images are passed to rendering instead of being set on the groups, so groups
+        shared between diagrams can be rendered concurrently. Returns no images unless
+        `config.SUBTREE_CACHE` is `True`.
 
-        environment = JINJA_ENV
-        template = environment.get_template(self._template)
+        Parameters
+        ----------
+        image_prefix : str | None
+            filename prefix of image copies, see `_subtree_image()`
+
+        Returns
+        -------
+        dict[int, str]
+            paths of .pdf images by `id()` of `Group` instance
+
+        Raises
+        ------
+        ValueError
+            If `config.SUBTREE_CACHE` is `True` and `config.CACHE_DIR` is not set
+        """
+
+        if not config.SUBTREE_CACHE:
+            return {}
+        if config.CACHE_DIR is None:
+            raise ValueError("`config.SUBTREE_CACHE` requires `config.CACHE_DIR` to be set")
+
+        cache = RenderCache(config.CACHE_DIR, config.CACHE_SIZE_LIMIT)
+        images: dict[int, str] = {}
+        for group in self._outermost_groups():
+            if (image := self._subtree_image(group, cache, image_prefix)) is not None:
+                images[id(group)] = image
+
+        return images
+
+    def _subtree_image(
+        self, group: Group, cache: RenderCache, image_prefix: str | None
+    ) -> str | None:
+        """Compile group to standalone .pdf image, or get it from the cache.
+
+        Parameters
+        ----------
+        group : Group
+            `Group` instance
+        cache : RenderCache
+            cache of compiled group images
+        image_prefix : str | None
+            copy the cached image to `<image_prefix>-subtree-<key>.pdf` and return its
+            filename relative to the .tex file if given, else return the cached path
+
+        Returns
+        -------
+        str | None
+            path of .pdf image, `None` if the group failed to compile or the image was
+            evicted from the cache, in which case the group is rendered in place
+        """
+
+        content = self._subtree_content(group)
+        key = RenderCache.key(content)
+
+        with self.stats.stage("subtree", group=group.id, key=key) as details:
+            image = cache.path(key, ".pdf")
+            details["hit"] = image is not None
+            if image is None:
+                with tempfile.TemporaryDirectory(prefix="pyrbd-") as working_dir:
+                    tex_file = os.path.join(working_dir, "subtree")
+                    with open(f"{tex_file}.tex", mode="w", encoding="utf-8") as file:
+                        file.write(content)
+                    # Stages of the subtree compilation are nested in the subtree stage,
+                    # so they are recorded separately to not count them twice in the total
+                    subtree_stats = Stats(self.filename)
+                    _run_latexmk(tex_file, False, False, clean_up=False, stats=subtree_stats)
+                    details["stages"] = subtree_stats.as_dicts()
+                    # LaTeX errors are reported when compiling the diagram itself
+                    if not os.path.isfile(f"{tex_file}.pdf"):
+                        return None
+                    cache.put(key, [f"{tex_file}.pdf"], tex_file)
+                image = cache.path(key, ".pdf")
+
+        if image is None:
+            return None
+        if image_prefix is None:
+            return os.path.abspath(image).replace(os.sep, "/")
+
+        # `latexmk -cd` compiles in the directory of the .tex file
+        local_image = f"{image_prefix}{_SUBTREE_INFIX}{key[:16]}.pdf"
+        try:
+            shutil.copyfile(image, local_image)
+        except FileNotFoundError:
+            # Entry evicted by concurrent process
+            return None
+
+        return os.path.basename(local_image)
+
+    def _subtree_files(self) -> list[str]:
+        """Get copies of cached group images written next to the .tex file."""
+
+        return sorted(glob.glob(f"{glob.escape(self.filename)}{_SUBTREE_INFIX}*.pdf"))
+
+    def _subtree_content(self, group: Group) -> str:
+        """Render standalone .tex document of group.
+
+        The group is rendered without parent, label and frame, and with its blocks
+        renumbered, so equal groups in different diagrams give the same document.
+
+        Parameters
+        ----------
+        group : Group
+            `Group` instance
+
+        Returns
+        -------
+        str
+            .tex file content
+        """
+
+        subtree = group.copy()
+        subtree.parent, subtree.text, subtree.color = None, "", ""
+        ids = itertools.count()
+        stack: list[Block] = [subtree]
+        while stack:
+            block = stack.pop()
+            block.id = f"n{next(ids)}"
+            if isinstance(block, (Series, Group)):
+                stack.extend(reversed(block.blocks))
+
+        template = get_template("subtree.tex.jinja")
+        context = {
+            "serif_font": config.SERIF_FONT,
+            "arrow_style": config.ARROW_STYLE,
+            "color_defs": self._picture_context()["color_defs"],
+            "blocks": [subtree.iter_node()],
+            "final_block": None,
+        }
+
+        return template.render(context)
+
+    def _tex_fragments(self, images: dict[int, str] | None = None) -> Iterator[str]:
+        """Render diagram .tex file content in fragments.
+
+        Parameters
+        ----------
+        images : dict[int, str] | None, default=None
+            paths of precompiled .pdf images by `id()` of `Group` instance, see
+            `Block.get_node()`
+
+        Returns
+        -------
+        Iterator[str]
+            .tex file content fragments
+        """
+
+        template = get_template(self._template)
 
         context = {
             "serif_font": config.SERIF_FONT,
             "arrow_style": config.ARROW_STYLE,
+            **self._picture_context(images),
+        }
+
+        return template.generate(context)
+
+    def _picture_context(self, images: dict[int, str] | None = None) -> dict:
+        """Get template context for diagram color definitions and TikZ picture.
+
+        Parameters
+        ----------
+        images : dict[int, str] | None, default=None
+            paths of precompiled .pdf images by `id()` of `Group` instance, see
+            `Block.get_node()`
+
+        Returns
+        -------
+        dict
+            template context
+        """
+
+        return {
             "color_defs": [{"name": name, "hex_code": code} for name, code in self.colors.items()],
-            "blocks": list(block.get_node() for block in [self.head, *self.blocks]),
+            "blocks": (block.iter_node(images=images) for block in [self.head, *self.blocks]),
             "final_block": self.blocks[-1] if isinstance(self.blocks[-1], Group) else None,
         }
-        content = template.render(context)
 
-        with open(f"{self.filename}.tex", mode="w", encoding="utf-8") as file:
-            file.write(content)
+    def render(
+        self, fmt: str = "pdf", precompiled_preamble: bool = False, dpi: int | None = None
+    ) -> bytes:
+        """Render diagram and return output file content.
+
+        The diagram is written and compiled in a private temporary directory, and the
+        compiled pdf is converted in memory. Nothing is written to the working directory,
+        and the conversion is serialized with the exports of `Diagram.compile()`, as
+        pymupdf is not thread-safe, so calls from concurrent threads are safe.
+
+        Parameters
+        ----------
+        fmt : str, default='pdf'
+            output format, `'pdf'`, `'svg'` or `'png'`
+        precompiled_preamble : bool, default=False
+            compile with precompiled preamble format if `True`, see `Diagram.compile()`
+        dpi : int | None, default=None
+            resolution of png output. Defaults to the largest resolution in `config.PNG_DPI`
+
+        Returns
+        -------
+        bytes
+            output file content
+
+        Raises
+        ------
+        ValueError
+            If `fmt` is not a valid output format
+        """
+
+        if fmt not in ("pdf", "svg", "png"):
+            raise ValueError(f"Invalid output format {fmt=}, expected 'pdf', 'svg' or 'png'")
+
+        with tempfile.TemporaryDirectory(prefix="pyrbd-") as working_dir:
+            tex_file = os.path.join(working_dir, "diagram")
+            with open(f"{tex_file}.tex", mode="w", encoding="utf-8") as file:
+                self._write(file, tex_file)
+
+            _run_latexmk(tex_file, False, precompiled_preamble, clean_up=False, stats=self.stats)
+
+            with open(f"{tex_file}.pdf", mode="rb") as file:
+                pdf_content = file.read()
+
+        if fmt == "pdf":
+            return pdf_content
+
+        with _PYMUPDF_LOCK, pymupdf.open(stream=pdf_content, filetype="pdf") as pdf_document:
+            page = pdf_document[0]
+            if fmt == "svg":
+                return self._svg_content(page).encode("utf-8")
+            if dpi is None:
+                dpi = config.PNG_DPI if isinstance(config.PNG_DPI, int) else max(config.PNG_DPI)
+            image: bytes = page.get_pixmap(dpi=dpi, alpha=config.PNG_ALPHA).tobytes("png")
+            return image
+
+    def render_svg(self) -> str:
+        """Render diagram as SVG image without LaTeX.
+
+        Node sizes and positions are computed in Python from the block layout attributes,
+        with text sizes estimated from the number of characters. The image closely
+        resembles the compiled LaTeX diagram, and requires no TeX installation.
 
-    def _to_svg(self) -> str:
-        """Convert diagram file from pdf to svg.
+        Returns
+        -------
+        str
+            SVG image
+        """
+
+        return render_svg(self)
+
+    def _page_to_svg(self, page: pymupdf.Page) -> str:
+        """Convert pdf page to svg file.
+
+        Parameters
+        ----------
+        page : pymupdf.Page
+            pdf page of compiled diagram
 
         Returns
         -------
@@ -80,8 +658,26 @@ class Diagram:
             filename of .svg file
         """
 
-        pdf_document = pymupdf.open(f"{self.filename}.pdf")
-        page = pdf_document[0]
+        # Save to file
+        with open(output_file := f"{self.filename}.svg", "w", encoding="utf-8") as file:
+            file.write(self._svg_content(page))
+
+        return output_file
+
+    @staticmethod
+    def _svg_content(page: pymupdf.Page) -> str:
+        """Convert pdf page to svg image with light and dark mode arrow colors.
+
+        Parameters
+        ----------
+        page : pymupdf.Page
+            pdf page of compiled diagram
+
+        Returns
+        -------
+        str
+            svg image
+        """
 
         # Get and convert page to svg image
         svg_content = page.get_svg_image().splitlines()
@@ -98,39 +694,47 @@ class Diagram:
         )
         svg_content = "\n".join(svg_content).replace(r"#4c4d4c", "var(--color)")
 
-        # Save to file
-        with open(output_file := f"{self.filename}.svg", "w", encoding="utf-8") as file:
-            file.write(svg_content)
+        return svg_content
 
-        pdf_document.close()
+    def _page_to_png(self, page: pymupdf.Page) -> list[str]:
+        """Convert pdf page to png file for each resolution in `config.PNG_DPI`.
 
-        return output_file
-
-    def _to_png(self) -> str:
-        """Convert diagram file from pdf to png.
+        Parameters
+        ----------
+        page : pymupdf.Page
+            pdf page of compiled diagram
 
         Returns
         -------
-        str
-            filename of .png file
+        list[str]
+            filenames of .png files
         """
 
-        pdf_document = pymupdf.open(f"{self.filename}.pdf")
-        page = pdf_document[0]
-
-        # Get image
-        image = page.get_pixmap(dpi=300)
-
-        # Save to file
-        image.save(output_file := f"{self.filename}.png")
+        resolutions = config.PNG_DPI
+        if isinstance(resolutions, int):
+            filenames = {resolutions: f"{self.filename}.png"}
+        else:
+            filenames = {dpi: f"{self.filename}_{dpi}dpi.png" for dpi in resolutions}
 
-        pdf_document.close()
+        output_files: list[str] = []
+        for dpi, output_file in filenames.items():
+            image = page.get_pixmap(dpi=dpi, alpha=config.PNG_ALPHA)
+            image.save(output_file)
+            output_files.append(output_file)
 
-        return output_file
+        return output_files
 
-    def compile(self, output: str | list[str] = "pdf", clear_source: bool = True) -> list[str]:
+    def compile(
+        self,
+        output: str | list[str] = "pdf",
+        clear_source: bool = True,
+        precompiled_preamble: bool = False,
+    ) -> list[str]:
         """Compile diagram .tex file.
 
+        If `config.CACHE_DIR` is set, output files are copied from the cache when the .tex
+        source, styles and output formats are unchanged since a previous compilation.
+
         Parameters
         ----------
         output : str | list[str], default='pdf'
@@ -142,6 +746,10 @@ class Diagram:
 
         clear_source : bool, default=True
             .tex source file is deleted after compilation if `True`
+        precompiled_preamble : bool, default=False
+            compile with the fixed preamble precompiled to a LuaLaTeX format in
+            `config.FORMAT_DIR` if `True`, which skips loading TikZ and other packages.
+            The format is built on first use and requires the `mylatexformat` package
 
         Returns
         -------
@@ -155,30 +763,197 @@ class Diagram:
             before `Diagram.compile()`.
         """
 
-        try:
-            subprocess.check_call(["latexmk", "--lualatex", f"{self.filename}.tex", "--silent"])
-            subprocess.check_call(["latexmk", "-c", f"{self.filename}.tex"])
-            if clear_source:
-                subprocess.check_call(["rm", f"{self.filename}.tex"])
-        except subprocess.CalledProcessError as err:
-            if err.returncode == 11:
-                raise FileNotFoundError(
-                    f"File {self.filename} not found. "
-                    "Check if call to Class method write() is missing."
-                ) from err
+        if not isinstance(output, list):
+            output = [output]
+
+        cache, cache_key = None, ""
+        if config.CACHE_DIR is not None:
+            cache = RenderCache(config.CACHE_DIR, config.CACHE_SIZE_LIMIT)
+            with self.stats.stage("cache_get") as details:
+                cache_key = self._cache_key(output)
+                cached_files = cache.get(cache_key, self.filename)
+                details["hit"] = cached_files is not None
+            if cached_files is not None:
+                if clear_source:
+                    os.remove(f"{self.filename}.tex")
+                    self._remove_subtree_files()
+                return cached_files
+
+        _run_latexmk(self.filename, clear_source, precompiled_preamble, stats=self.stats)
+        if clear_source:
+            self._remove_subtree_files()
+
+        # Open pdf document once for all output formats
+        with _PYMUPDF_LOCK, pymupdf.open(f"{self.filename}.pdf") as pdf_document:
+            output_files = self._export_page(pdf_document[0], output)
+        if "pdf" in output:
+            output_files.append(f"{self.filename}.pdf")
+
+        if cache is not None:
+            with self.stats.stage("cache_put"):
+                cache.put(cache_key, output_files, self.filename)
+
+        if "pdf" not in output:
+            os.remove(f"{self.filename}.pdf")
+
+        return output_files
+
+    def _remove_subtree_files(self) -> None:
+        """Delete copies of cached group images written next to the .tex file."""
+
+        for subtree_file in self._subtree_files():
+            os.remove(subtree_file)
+
+    def _export_page(self, page: pymupdf.Page, output: list[str]) -> list[str]:
+        """Convert pdf page to svg and png output files.
+
+        Parameters
+        ----------
+        page : pymupdf.Page
+            pdf page of compiled diagram
+        output : list[str]
+            list of output formats, `'pdf'` is ignored
+
+        Returns
+        -------
+        list[str]
+            list of output filenames
+        """
 
         output_files: list[str] = []
 
+        if "svg" in output:
+            with self.stats.stage("export_svg") as details:
+                output_files.append(svg_file := self._page_to_svg(page))
+                details["size"] = os.path.getsize(svg_file)
+        if "png" in output:
+            with self.stats.stage("export_png", dpi=config.PNG_DPI) as details:
+                png_files = self._page_to_png(page)
+                details["size"] = sum(os.path.getsize(png_file) for png_file in png_files)
+            output_files.extend(png_files)
+
+        return output_files
+
+    def _split_page(
+        self, pdf_document: pymupdf.Document, page_number: int, output: list[str]
+    ) -> list[str]:
+        """Convert single page of multi-page pdf document to diagram output files.
+
+        Parameters
+        ----------
+        pdf_document : pymupdf.Document
+            compiled multi-page pdf document
+        page_number : int
+            page number of diagram in `pdf_document`
+        output : list[str]
+            list of output formats
+
+        Returns
+        -------
+        list[str]
+            list of output filenames
+        """
+
+        output_files = self._export_page(pdf_document[page_number], output)
+        if "pdf" in output:
+            page_document = pymupdf.open()
+            page_document.insert_pdf(pdf_document, from_page=page_number, to_page=page_number)
+            page_document.save(pdf_file := f"{self.filename}.pdf")
+            page_document.close()
+            output_files.append(pdf_file)
+
+        return output_files
+
+    def _cache_key(self, output: list[str]) -> str:
+        """Get cache key from .tex file content, global styles, colors and output formats.
+
+        Parameters
+        ----------
+        output : list[str]
+            list of output formats
+
+        Returns
+        -------
+        str
+            cache key
+
+        Raises
+        ------
+        FileNotFoundError
+            If .tex file is not found, e.g. because `Diagram.write()` has not been called
+            before `Diagram.compile()`.
+        """
+
+        try:
+            with open(f"{self.filename}.tex", encoding="utf-8") as file:
+                content = file.read()
+        except FileNotFoundError as err:
+            raise FileNotFoundError(
+                f"File {self.filename} not found. "
+                "Check if call to Class method write() is missing."
+            ) from err
+
+        return RenderCache.key(
+            content,
+            config.ARROW_STYLE,
+            str(config.SERIF_FONT),
+            json.dumps(self.colors, sort_keys=True),
+            ",".join(sorted(set(output))),
+            json.dumps([config.PNG_DPI, config.PNG_ALPHA]),
+        )
+
+    @staticmethod
+    def compile_combined(
+        diagrams: list["Diagram"],
+        output: str | list[str] = "pdf",
+        precompiled_preamble: bool = False,
+    ) -> list[list[str]]:
+        """Compile many diagrams in a single LaTeX run.
+
+        All diagrams are written to one multi-page standalone document, one page per
+        diagram, which is compiled once in a temporary working directory. The pages are
+        then split into per-diagram output files, named as by `Diagram.compile()`.
+        This amortizes LaTeX startup over all diagrams.
+
+        Parameters
+        ----------
+        diagrams : list[Diagram]
+            list of `Diagram` instances
+        output : str | list[str], default='pdf'
+            output format string or list of output formats, see `Diagram.compile()`
+        precompiled_preamble : bool, default=False
+            compile with precompiled preamble format if `True`, see `Diagram.compile()`
+
+        Returns
+        -------
+        list[list[str]]
+            list of output filenames for each diagram, in the order of `diagrams`
+        """
+
         if not isinstance(output, list):
             output = [output]
 
-        if "svg" in output:
-            output_files.append(self._to_svg())
-        if "png" in output:
-            output_files.append(self._to_png())
-        if "pdf" not in output:
-            subprocess.check_call(["rm", f"{self.filename}.pdf"])
-        else:
-            output_files.append(f"{self.filename}.pdf")
+        template = get_template("document.tex.jinja")
+        context = {
+            "serif_font": config.SERIF_FONT,
+            "arrow_style": config.ARROW_STYLE,
+            "pages": [
+                diagram._picture_context()  # pylint: disable=protected-access
+                for diagram in diagrams
+            ],
+        }
+
+        with tempfile.TemporaryDirectory(prefix="pyrbd-") as working_dir:
+            document = os.path.join(working_dir, "diagrams")
+            with open(f"{document}.tex", mode="w", encoding="utf-8") as file:
+                file.writelines(template.generate(context))
+
+            _run_latexmk(document, True, precompiled_preamble)
+
+            with _PYMUPDF_LOCK, pymupdf.open(f"{document}.pdf") as pdf_document:
+                output_files = [
+                    diagram._split_page(pdf_document, i, output)  # pylint: disable=protected-access
+                    for i, diagram in enumerate(diagrams)
+                ]
 
         return output_files
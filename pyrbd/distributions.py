@@ -0,0 +1,79 @@
+"""Module containing failure time distributions for `Block` instances."""
+
+from __future__ import annotations
+
+from typing import Protocol
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+
+class Distribution(Protocol):
+    """Protocol for failure time distributions.
+
+    Any object with a vectorized survival function `sf` and inverse survival function `isf`
+    is a valid distribution, e.g. frozen `scipy.stats` distributions like
+    `scipy.stats.lognorm(s=0.5, scale=1e4)`.
+    """
+
+    def sf(self, t: ArrayLike) -> ArrayLike:
+        """Survival function, i.e. probability of no failure before time `t`."""
+
+    def isf(self, q: ArrayLike) -> ArrayLike:
+        """Inverse survival function, used for sampling failure times."""
+
+
+class Weibull:
+    """Two-parameter Weibull failure time distribution.
+
+    Parameters
+    ----------
+    shape : float
+        Weibull shape parameter (`beta`)
+    scale : float
+        Weibull scale parameter (`eta`), i.e. characteristic life
+
+    Raises
+    ------
+    ValueError
+        If `shape` or `scale` is not positive
+    """
+
+    def __init__(self, shape: float, scale: float) -> None:
+        if shape <= 0 or scale <= 0:
+            raise ValueError("Weibull `shape` and `scale` must be positive")
+
+        self.shape = shape
+        self.scale = scale
+
+    def sf(self, t: ArrayLike) -> NDArray[np.float64]:
+        """Survival function `exp(-(t/scale)**shape)`.
+
+        Parameters
+        ----------
+        t : ArrayLike
+            time or array of times
+
+        Returns
+        -------
+        NDArray[np.float64]
+            probability of no failure before `t`
+        """
+
+        return np.exp(-((np.asarray(t, dtype=np.float64) / self.scale) ** self.shape))
+
+    def isf(self, q: ArrayLike) -> NDArray[np.float64]:
+        """Inverse survival function `scale*(-log(q))**(1/shape)`.
+
+        Parameters
+        ----------
+        q : ArrayLike
+            survival probability or array of survival probabilities
+
+        Returns
+        -------
+        NDArray[np.float64]
+            time(s) with survival probability `q`
+        """
+
+        return self.scale * (-np.log(np.asarray(q, dtype=np.float64))) ** (1.0 / self.shape)
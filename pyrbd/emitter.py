@@ -0,0 +1,163 @@
+"""Module containing direct TikZ string emission without Jinja templates.
+
+The functions emit exactly the same TikZ strings as the `block.tex.jinja`,
+`series.tex.jinja` and `group.tex.jinja` templates, using Python format strings instead
+of a template render call per node. They are used instead of the templates when
+`config.FAST_RENDER` is `True`.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .block import Block, Group, Series
+
+
+def _position(block: Block) -> str:
+    """Get TikZ node position relative to parent block, empty if block has no parent."""
+
+    if block.parent is None:
+        return ""
+
+    return (
+        f"[right={block.arrow_length + block.shift[0]}cm of {block.parent.last.id}, "
+        f"yshift={block.shift[1]}cm]\n"
+    )
+
+
+def _frame(block: Series | Group, label: str) -> str:
+    """Get TikZ string for colored frame and `label` of series or group."""
+
+    pad = block.pad
+    frame = ""
+    if block.color not in ("white", ""):
+        frame += (
+            "\\begin{pgfonlayer}{background}\n"
+            f"\\coordinate (sw) at ($({block.id}.south west)+(-{pad.w}mm, -{pad.s}mm)$);\n"
+            f"\\coordinate (ne) at ($({block.id}.north east)+({pad.e}mm, {pad.n}mm)$);\n"
+            f"\\draw[{block.color}, thick] (sw) rectangle (ne);\n"
+            "\\end{pgfonlayer}\n"
+        )
+    frame += "\n"
+    if label:
+        frame += (
+            f"\\coordinate (nw) at ($({block.id}.north west)+(-{pad.w}mm, {pad.n}mm)$);\n"
+            f"\\coordinate (ne) at ($({block.id}.north east)+({pad.e}mm, {pad.n}mm)$);\n"
+            f"\\coordinate (n) at ($({block.id}.north)+"
+            f"(0mm, {block.label_height / 2 + pad.n}mm)$);\n"
+            f"\\draw[{block.color}, fill={block.color}!50, thick] (nw) rectangle "
+            f"($(ne)+(0, {block.label_height}mm)$);\n"
+            "\\node[anchor=center, inner sep=0pt, outer sep=0pt] at (n) "
+            f"{{{label}}}; % label text\n"
+        )
+
+    return frame
+
+
+def _group_tail(group: Group) -> str:
+    """Get TikZ string for incoming arrow, frame and label of group."""
+
+    tail = "\n"
+    if group.parent is not None:
+        tail += (
+            f"\\draw[{group.arrow_options}] ({group.parent.last.id}.east) to ({group.id}.west);\n"
+        )
+
+    return tail + "\n" + _frame(group, group.label)
+
+
+def emit_block(block: Block, connector_position: float) -> str:
+    """Emit TikZ string of leaf block.
+
+    Parameters
+    ----------
+    block : Block
+        leaf `Block` instance
+    connector_position : float
+        distance in cm to right angle bend in connector
+
+    Returns
+    -------
+    str
+        TikZ string for rendering block
+    """
+
+    node_options = block.node_options.format(fill_color=block.color)
+    node = f"% Block\n\\node[{node_options}] ({block.id})\n{_position(block)}{{{block.text}}};\n"
+    if block.parent is not None:
+        node += (
+            f"\\draw[{block.arrow_options}, rectangle connector={connector_position}cm] "
+            f"({block.parent.last.id}.east) to ({block.id}.west);\n"
+        )
+
+    return node
+
+
+def emit_series(series: Series, connector_position: float) -> list[str]:
+    """Emit TikZ string fragments of series around its child nodes.
+
+    Parameters
+    ----------
+    series : Series
+        `Series` instance
+    connector_position : float
+        distance in cm to right angle bend in connector
+
+    Returns
+    -------
+    list[str]
+        TikZ string fragments before, between and after child nodes
+    """
+
+    head = (
+        f"\n% Series\n\\node[{series.node_options}] ({series.id})\n{_position(series)}"
+        "{\\begin{tikzpicture}[remember picture]\n"
+    )
+    tail = "\n\\end{tikzpicture}};\n\n"
+    if series.parent is not None:
+        tail += (
+            f"\\draw[{series.arrow_options}, rectangle connector={connector_position}cm] "
+            f"({series.parent.last.id}.east) to ({series.blocks[0].id}.west);\n"
+        )
+    tail += "\n" + _frame(series, series.text)
+
+    return [head, *["\n"] * (len(series.blocks) - 1), tail]
+
+
+def emit_group(group: Group, sorted_blocks: list[Block], image: str | None = None) -> list[str]:
+    """Emit TikZ string fragments of group around its child nodes.
+
+    Parameters
+    ----------
+    group : Group
+        `Group` instance
+    sorted_blocks : list[Block]
+        blocks in group with the block connecting the group arrows first
+    image : str | None, default=None
+        path of precompiled .pdf image included instead of the child nodes
+
+    Returns
+    -------
+    list[str]
+        TikZ string fragments before, between and after child nodes, a single fragment
+        if the group is included as precompiled image
+    """
+
+    node = f"\n% Group\n\\node[{group.node_options}] ({group.id})\n{_position(group)}"
+    if image is not None:
+        return [f"{node}{{\\includegraphics{{{image}}}}};\n{_group_tail(group)}"]
+
+    head = (
+        f"{node}{{\\begin{{tikzpicture}}[remember picture]\n"
+        f"    \\coordinate({group.id}) at (0, 0);\n    "
+    )
+    arrow_length = group.end_arrow_scaling * group.internal_arrow_length
+    arrows = "".join(
+        f"    \\draw[{group.arrow_options}, rectangle line={arrow_length}cm] "
+        f"({sorted_blocks[0].id}.east) to ({block.id}.east);\n    "
+        for block in sorted_blocks[1:]
+    )
+    tail = f"\n    % Connecting arrows\n    {arrows}\\end{{tikzpicture}}}};\n"
+
+    return [head, *[""] * (len(group.blocks) - 1), tail + _group_tail(group)]
@@ -0,0 +1,251 @@
+"""Module containing component importance measures of block structures.
+
+All measures of all leaf blocks are computed in two passes over the block structure. The
+first pass evaluates the reliability of every block bottom-up. The second pass propagates
+partial derivatives of the system reliability top-down, where the derivative of a series
+or group with respect to one of its blocks is the product of the values of the other
+blocks, computed with prefix and suffix products. The derivative of a k-out-of-n group
+is the probability that exactly `k - 1` of its other blocks are functioning.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .block import Block, Group, KofN, Series, _count_distributions
+
+
+class Importance(NamedTuple):
+    """Importance measures of a leaf block.
+
+    All measures have the shape of the mission time array they are evaluated at.
+
+    Attributes
+    ----------
+    birnbaum : NDArray[np.float64]
+        Birnbaum importance, i.e. the partial derivative of system reliability with
+        respect to block reliability
+    criticality : NDArray[np.float64]
+        criticality importance, i.e. the probability that the block is failed and
+        critical, given that the system is failed
+    fussell_vesely : NDArray[np.float64]
+        Fussell–Vesely importance, i.e. the probability that a failed minimal cut set
+        contains the block, given that the system is failed
+    """
+
+    birnbaum: NDArray[np.float64]
+    criticality: NDArray[np.float64]
+    fussell_vesely: NDArray[np.float64]
+
+
+def _others(values: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Get products of all values but one along the first axis, without division."""
+
+    ones = np.ones((1, *values.shape[1:]))
+    prefix = np.cumprod(np.concatenate([ones, values[:-1]]), axis=0)
+    suffix = np.cumprod(np.concatenate([ones, values[:0:-1]]), axis=0)[::-1]
+
+    return prefix * suffix
+
+
+def _others_functioning(values: list[NDArray[np.float64]], k: int) -> list[NDArray[np.float64]]:
+    """Get distributions of the number of functioning blocks but one, truncated at `k - 1`.
+
+    Returns
+    -------
+    list[NDArray[np.float64]]
+        probabilities that exactly `0, ..., k - 1` of the other blocks are functioning,
+        for each block
+    """
+
+    prefixes = _count_distributions(values, k)
+    suffixes = _count_distributions(values[::-1], k)[::-1]
+    distributions: list[NDArray[np.float64]] = []
+    for prefix, suffix in zip(prefixes[:-1], suffixes[1:], strict=True):
+        distributions.append(
+            np.stack([(prefix[: j + 1] * suffix[j::-1]).sum(axis=0) for j in range(k)])
+        )
+
+    return distributions
+
+
+_Occurrences = tuple[list[Block | None], list[list[int]]]
+
+
+def _occurrences(blocks: list[Block]) -> _Occurrences:
+    """Get pre-order list of block occurrences and child indices of each occurrence.
+
+    The blocks in series are children of a virtual root occurrence `None` at index 0.
+    """
+
+    nodes: list[Block | None] = [None]
+    children: list[list[int]] = [[]]
+    stack = [(block, 0) for block in reversed(blocks)]
+    while stack:
+        block, parent = stack.pop()
+        children[parent].append(len(nodes))
+        nodes.append(block)
+        children.append([])
+        if isinstance(block, (Series, Group)):
+            stack.extend((child, len(nodes) - 1) for child in reversed(block.blocks))
+
+    return nodes, children
+
+
+def _reliabilities(
+    nodes: list[Block | None], children: list[list[int]], t: NDArray[np.float64]
+) -> list[NDArray[np.float64]]:
+    """Get reliabilities of all block occurrences bottom-up."""
+
+    # Children always follow their parents in pre-order
+    reliabilities: list[NDArray[np.float64]] = [np.ones(t.shape)] * len(nodes)
+    for index in reversed(range(len(nodes))):
+        node = nodes[index]
+        if not children[index]:
+            reliabilities[index] = node.reliability(t) if node is not None else np.ones(t.shape)
+        elif isinstance(node, KofN):
+            values = [reliabilities[child] for child in children[index]]
+            reliabilities[index] = _count_distributions(values, node.k)[-1][node.k]
+        elif isinstance(node, Group):
+            failed = np.stack([1.0 - reliabilities[child] for child in children[index]])
+            reliabilities[index] = 1.0 - failed.prod(axis=0)
+        else:
+            reliabilities[index] = np.stack(
+                [reliabilities[child] for child in children[index]]
+            ).prod(axis=0)
+
+    return reliabilities
+
+
+def _partials(
+    block: Block | None, values: list[NDArray[np.float64]]
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Get partial derivatives of series, group or k-out-of-n group by each of its blocks.
+
+    Returns
+    -------
+    tuple[NDArray[np.float64], NDArray[np.float64]]
+        partial derivatives, and probabilities that the other blocks are failed as needed
+        for a minimal cut set through each block, stacked along the first axis
+    """
+
+    if isinstance(block, KofN):
+        # Exactly k - 1 and at most k - 1 other blocks functioning
+        functioning = np.stack(_others_functioning(values, block.k))
+        return functioning[:, -1], functioning.sum(axis=1)
+    if isinstance(block, Group):
+        others = _others(1.0 - np.stack(values))
+        return others, others
+
+    return _others(np.stack(values)), np.ones((len(values), *values[0].shape))
+
+
+def _derivatives(
+    nodes: list[Block | None],
+    children: list[list[int]],
+    reliabilities: list[NDArray[np.float64]],
+) -> tuple[list[NDArray[np.float64]], list[NDArray[np.float64]]]:
+    """Get derivatives of system reliability with respect to all block occurrences top-down.
+
+    Returns
+    -------
+    tuple[list[NDArray[np.float64]], list[NDArray[np.float64]]]
+        derivatives, and probabilities that all other blocks of a minimal cut set through
+        the block occurrence are failed
+    """
+
+    derivatives = [np.ones_like(reliabilities[0])] * len(nodes)
+    cut_factors = [np.ones_like(reliabilities[0])] * len(nodes)
+    for index, node in enumerate(nodes):
+        if not children[index]:
+            continue
+        partials, cut_partials = _partials(
+            node, [reliabilities[child] for child in children[index]]
+        )
+        for child, partial, cut_partial in zip(
+            children[index], partials, cut_partials, strict=True
+        ):
+            derivatives[child] = derivatives[index] * partial
+            cut_factors[child] = cut_factors[index] * cut_partial
+
+    return derivatives, cut_factors
+
+
+def importance(blocks: list[Block], t: ArrayLike) -> dict[str, Importance]:
+    """Get importance measures of all leaf blocks of blocks in series.
+
+    Leaf blocks appearing more than once in the structure, or sharing their id, e.g.
+    copies in a multiplied `Series`, are evaluated as independent blocks in each place,
+    as in `Block.reliability()`, and their measures are summed. Likewise, leaf blocks of
+    shared components, see `Block.shared_copy()`, are evaluated as independent blocks.
+
+    Parameters
+    ----------
+    blocks : list[Block]
+        list of `Block` instances in series
+    t : ArrayLike
+        mission time or array of mission times
+
+    Returns
+    -------
+    dict[str, Importance]
+        importance measures by leaf block id, in `get_blocks()` order
+    """
+
+    t = np.asarray(t, dtype=np.float64)
+
+    nodes, children = _occurrences(blocks)
+    reliabilities = _reliabilities(nodes, children, t)
+    derivatives, cut_factors = _derivatives(nodes, children, reliabilities)
+
+    # Measures of all leaf blocks at once, summed over leaf blocks appearing more than
+    # once or sharing their id
+    leaves = [
+        (index, node)
+        for index, node in enumerate(nodes)
+        if node is not None and not children[index]
+    ]
+    failed = 1.0 - np.stack([reliabilities[index] for index, _ in leaves])
+    leaf_derivatives = np.stack([derivatives[index] for index, _ in leaves])
+    measures = np.stack(
+        [
+            leaf_derivatives,
+            leaf_derivatives * failed,
+            np.stack([cut_factors[index] for index, _ in leaves]) * failed,
+        ]
+    )
+    rows, measures = _sum_by_id([node for _, node in leaves], measures)
+
+    unreliability = 1.0 - reliabilities[0]
+    measures[1:] = np.divide(
+        measures[1:], unreliability, out=np.zeros_like(measures[1:]), where=unreliability > 0.0
+    )
+
+    return {key: Importance(*measures[:, row]) for key, row in rows.items()}
+
+
+def _sum_by_id(
+    leaves: list[Block], measures: NDArray[np.float64]
+) -> tuple[dict[str, int], NDArray[np.float64]]:
+    """Sum measures of `leaves` with shape `(3, len(leaves), ...)` over equal block ids.
+
+    Returns
+    -------
+    tuple[dict[str, int], NDArray[np.float64]]
+        row index of each block id, and summed measures
+    """
+
+    rows: dict[str, int] = {}
+    for leaf in leaves:
+        rows.setdefault(leaf.id, len(rows))
+    if len(rows) == len(leaves):
+        return rows, measures
+
+    inverse = np.array([rows[leaf.id] for leaf in leaves])
+    order = np.argsort(inverse, kind="stable")
+    starts = np.flatnonzero(np.diff(inverse[order], prepend=-1))
+
+    return rows, np.add.reduceat(measures[:, order], starts, axis=1)
@@ -0,0 +1,367 @@
+"""Module containing manifests for building many diagrams from a single data file.
+
+A manifest is a JSON, TOML or YAML file with an optional `config` table of `config`
+options, given by their lowercase names, and a list of `diagrams`. Each diagram is
+either defined by data, e.g. in TOML
+
+```toml
+[config]
+arrow_style = "-latex"
+cache_dir = ".pyrbd-cache"
+
+[[diagrams]]
+name = "simple_RBD"
+output = ["svg", "png"]
+colors = { myblue = "8888ff" }
+blocks = [
+    { text = "Start", color = "myblue" },
+    { text = "Parallel blocks", color = "gray", parallel = 2 },
+    { series = [{ text = "A", color = "white" }, { text = "B", color = "white" }] },
+    { group = [{ text = "C", color = "white" }, { text = "D", color = "white" }] },
+]
+```
+
+or by a `factory = "module:function"` reference to a Python function returning a
+`Diagram` instance. Diagram names, relative paths and factory modules are resolved
+relative to the manifest directory.
+
+Block definitions are tables with either `series` or `group` lists of block definitions
+and optional `text` and `color`, or leaf blocks with `text`, `color` and optional `shift`,
+`fixed_reliability`, `failure_rate`, `weibull = { shape, scale }` and `repair_rate`.
+Groups with `k` set, e.g. `k = 2` for 2-out-of-n voting, are `KofN` groups.
+Any block definition may set `parallel = n` for a group of `n` copies of the block.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import itertools
+import json
+import os
+import sys
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+from . import config
+from .block import Block, Group, KofN, Series
+from .diagram import Diagram
+from .distributions import Weibull
+
+_CONFIG_OPTIONS = (
+    "ARROW_STYLE",
+    "SERIF_FONT",
+    "FAST_RENDER",
+    "CACHE_DIR",
+    "CACHE_SIZE_LIMIT",
+    "SUBTREE_CACHE",
+    "PNG_DPI",
+    "PNG_ALPHA",
+    "FORMAT_DIR",
+)
+_PATH_OPTIONS = ("CACHE_DIR", "FORMAT_DIR")
+
+_LEAF_KEYS = frozenset(
+    ["text", "color", "shift", "fixed_reliability", "failure_rate", "weibull", "repair_rate"]
+)
+_CONTAINER_KEYS = {
+    "series": frozenset(["text", "color"]),
+    "group": frozenset(["text", "color", "k"]),
+}
+_DIAGRAM_KEYS = frozenset(["name", "blocks", "hazard", "colors", "output", "factory"])
+
+
+class ManifestEntry(NamedTuple):
+    """Diagram defined in a manifest.
+
+    Attributes
+    ----------
+    diagram : Diagram
+        `Diagram` instance
+    output : list[str]
+        list of output formats, see `Diagram.compile()`
+    signature : str
+        hash of the diagram definition, manifest `config` table and factory source,
+        which changes when any input of the diagram changes
+    sources : list[str]
+        list of factory module source files the diagram depends on
+    """
+
+    diagram: Diagram
+    output: list[str]
+    signature: str
+    sources: list[str]
+
+
+def load_manifest(filename: str) -> dict[str, Any]:
+    """Load manifest data from JSON, TOML or YAML file.
+
+    TOML manifests require Python 3.11 or later, and YAML manifests the `pyyaml` package.
+
+    Parameters
+    ----------
+    filename : str
+        manifest filename with `.json`, `.toml`, `.yaml` or `.yml` extension
+
+    Returns
+    -------
+    dict[str, Any]
+        manifest data
+
+    Raises
+    ------
+    ValueError
+        If the file extension is not supported or the file content is invalid
+    ImportError
+        If the TOML or YAML parser is not available
+    """
+
+    extension = os.path.splitext(filename)[1].lower()
+    if extension == ".json":
+        with open(filename, encoding="utf-8") as file:
+            data = json.load(file)
+    elif extension == ".toml":
+        try:
+            import tomllib  # pylint: disable=import-outside-toplevel
+        except ModuleNotFoundError as err:
+            raise ImportError("TOML manifests require Python 3.11 or later") from err
+        with open(filename, mode="rb") as file:
+            data = tomllib.load(file)
+    elif extension in (".yaml", ".yml"):
+        try:
+            import yaml  # type: ignore[import-untyped]  # pylint: disable=import-outside-toplevel
+        except ModuleNotFoundError as err:
+            raise ImportError("YAML manifests require the `pyyaml` package") from err
+        with open(filename, encoding="utf-8") as file:
+            try:
+                data = yaml.safe_load(file)
+            except yaml.YAMLError as err:
+                raise ValueError(f"Invalid YAML manifest {filename}: {err}") from err
+    else:
+        raise ValueError(
+            f"Unsupported manifest format {extension=}, expected .json, .toml, .yaml or .yml"
+        )
+
+    if not isinstance(data, dict) or not isinstance(data.get("diagrams"), list):
+        raise ValueError(f"Manifest {filename} must define a list of `diagrams`")
+
+    return data
+
+
+def apply_config(options: dict[str, Any], directory: str = ".") -> None:
+    """Set `config` options from manifest `config` table.
+
+    Parameters
+    ----------
+    options : dict[str, Any]
+        option values by lowercase option name, e.g. `{'arrow_style': '-latex'}`
+    directory : str, default="."
+        directory relative paths of `cache_dir` and `format_dir` are resolved against
+
+    Raises
+    ------
+    ValueError
+        If an option is not a valid `config` option
+    """
+
+    for name, value in options.items():
+        option = name.upper()
+        if option not in _CONFIG_OPTIONS:
+            raise ValueError(f"Invalid config option {name=}")
+        if option in _PATH_OPTIONS and value is not None:
+            value = os.path.join(directory, value)
+        setattr(config, option, value)
+
+
+def block_from_spec(spec: dict[str, Any]) -> Block:
+    """Create block from manifest block definition.
+
+    Parameters
+    ----------
+    spec : dict[str, Any]
+        block definition, see module documentation
+
+    Returns
+    -------
+    Block
+        `Block`, `Series` or `Group` instance
+
+    Raises
+    ------
+    ValueError
+        If the block definition is invalid
+    """
+
+    if not isinstance(spec, dict):
+        raise ValueError(f"Invalid block definition {spec!r}, expected a table")
+
+    options = dict(spec)
+    parallel: int = options.pop("parallel", 1)
+    kinds = [kind for kind in ("series", "group") if kind in options]
+    if len(kinds) > 1:
+        raise ValueError(f"Block definition {spec!r} must not define both `series` and `group`")
+
+    if kinds:
+        blocks = options.pop(kinds[0])
+        if not isinstance(blocks, list) or not blocks:
+            raise ValueError(f"`{kinds[0]}` of block definition {spec!r} must be a list")
+        if invalid := options.keys() - _CONTAINER_KEYS[kinds[0]]:
+            raise ValueError(f"Invalid keys {sorted(invalid)} in block definition {spec!r}")
+        cls: type[Series | Group] = (
+            Series if kinds[0] == "series" else KofN if "k" in options else Group
+        )
+        try:
+            block: Block = cls([block_from_spec(child) for child in blocks], **options)
+        except TypeError as err:
+            raise ValueError(f"Invalid block definition {spec!r}: {err}") from err
+    else:
+        if invalid := options.keys() - _LEAF_KEYS:
+            raise ValueError(f"Invalid keys {sorted(invalid)} in block definition {spec!r}")
+        if "shift" in options:
+            options["shift"] = tuple(options["shift"])
+        try:
+            if "weibull" in options:
+                options["distribution"] = Weibull(**options.pop("weibull"))
+            block = Block(options.pop("text"), options.pop("color"), **options)
+        except KeyError as err:
+            raise ValueError(f"Block definition {spec!r} must define {err}") from err
+        except TypeError as err:
+            raise ValueError(f"Invalid block definition {spec!r}: {err}") from err
+
+    return parallel * block
+
+
+def diagram_from_spec(spec: dict[str, Any], directory: str = ".") -> Diagram:
+    """Create diagram from manifest diagram definition.
+
+    Parameters
+    ----------
+    spec : dict[str, Any]
+        diagram definition, see module documentation
+    directory : str, default="."
+        directory diagram names and factory modules are resolved against
+
+    Returns
+    -------
+    Diagram
+        `Diagram` instance
+
+    Raises
+    ------
+    ValueError
+        If the diagram definition is invalid
+    """
+
+    if not isinstance(spec, dict):
+        raise ValueError(f"Invalid diagram definition {spec!r}, expected a table")
+    if invalid := spec.keys() - _DIAGRAM_KEYS:
+        raise ValueError(f"Invalid keys {sorted(invalid)} in diagram definition")
+
+    if "factory" in spec:
+        diagram = _factory(spec["factory"], directory)[0]()
+        if not isinstance(diagram, Diagram):
+            raise ValueError(f"Factory {spec['factory']} did not return a `Diagram` instance")
+        diagram.filename = os.path.join(directory, spec.get("name", diagram.filename))
+        diagram.stats.name = diagram.filename
+        return diagram
+
+    if "name" not in spec or not spec.get("blocks"):
+        raise ValueError("Diagram definition must define `name` and a list of `blocks`")
+
+    # Diagram blocks are connected in the order of definition
+    blocks = [block_from_spec(block) for block in spec["blocks"]]
+    for parent, block in itertools.pairwise(blocks):
+        block.parent = parent
+
+    return Diagram(
+        os.path.join(directory, spec["name"]),
+        blocks,
+        hazard=spec.get("hazard", ""),
+        colors=spec.get("colors"),
+    )
+
+
+def read_manifest(
+    filename: str, output: str | list[str] = "pdf", reload: bool = False
+) -> list[ManifestEntry]:
+    """Load manifest, apply its `config` table and create its diagrams.
+
+    Parameters
+    ----------
+    filename : str
+        manifest filename, see `load_manifest()`
+    output : str | list[str], default='pdf'
+        output formats of diagrams without `output` in their definition
+    reload : bool, default=False
+        reload factory modules if `True`, e.g. after their source files changed
+
+    Returns
+    -------
+    list[ManifestEntry]
+        diagrams in manifest order
+
+    Raises
+    ------
+    ValueError
+        If the manifest or any of its definitions is invalid
+    """
+
+    data = load_manifest(filename)
+    directory = os.path.dirname(os.path.abspath(filename))
+    config_options = data.get("config", {})
+    apply_config(config_options, directory)
+
+    entries: list[ManifestEntry] = []
+    for spec in data["diagrams"]:
+        sources: list[str] = []
+        if isinstance(spec, dict) and "factory" in spec:
+            sources.append(_factory(spec["factory"], directory, reload)[1])
+        diagram = diagram_from_spec(spec, directory)
+
+        digest = hashlib.sha256(json.dumps([config_options, spec], sort_keys=True).encode())
+        for source in sources:
+            with open(source, mode="rb") as file:
+                digest.update(file.read())
+        diagram_output = spec.get("output", output)
+        entries.append(
+            ManifestEntry(
+                diagram,
+                diagram_output if isinstance(diagram_output, list) else [diagram_output],
+                digest.hexdigest(),
+                sources,
+            )
+        )
+
+    names = [entry.diagram.filename for entry in entries]
+    if len(set(names)) < len(names):
+        raise ValueError(f"Manifest {filename} defines diagrams with equal names")
+
+    return entries
+
+
+def _factory(
+    reference: str, directory: str, reload: bool = False
+) -> tuple[Callable[[], Any], str]:
+    """Import diagram factory function from `'module:function'` reference.
+
+    Returns
+    -------
+    tuple[Callable[[], Any], str]
+        factory function and module source filename
+    """
+
+    module_name, _, function_name = reference.partition(":")
+    if not module_name or not function_name:
+        raise ValueError(f"Invalid factory {reference=}, expected 'module:function'")
+
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+    module = importlib.import_module(module_name)
+    if reload:
+        module = importlib.reload(module)
+
+    function = getattr(module, function_name, None)
+    if not callable(function) or module.__file__ is None:
+        raise ValueError(f"Factory {reference} is not a function")
+
+    return function, module.__file__
@@ -0,0 +1,164 @@
+"""Module containing precompiled LaTeX preamble formats for fast compilation.
+
+The fixed part of the diagram preamble, loading `tikz`, `xcolor`, fonts and TikZ
+libraries, is dumped to a LuaLaTeX format file using the `mylatexformat` package.
+Compiling with the format skips the preamble up to the `\\endofdump` marker written by
+`Diagram.write()`.
+"""
+
+import hashlib
+import os
+import stat
+import subprocess
+import tempfile
+
+DUMP_MARKER: str = r"\csname endofdump\endcsname"
+"""Marker ending the precompiled part of the .tex preamble."""
+
+
+def split_preamble(content: str) -> str:
+    """Get fixed preamble of .tex file content.
+
+    Parameters
+    ----------
+    content : str
+        .tex file content
+
+    Returns
+    -------
+    str
+        preamble up to and including `DUMP_MARKER`
+
+    Raises
+    ------
+    ValueError
+        If `content` has no `DUMP_MARKER`
+    """
+
+    index = content.find(DUMP_MARKER)
+    if index < 0:
+        raise ValueError("No precompiled preamble marker found in .tex content")
+
+    return content[: index + len(DUMP_MARKER)] + "\n"
+
+
+def format_name(preamble: str) -> str:
+    """Get format name from preamble content hash.
+
+    Parameters
+    ----------
+    preamble : str
+        fixed preamble
+
+    Returns
+    -------
+    str
+        format name
+    """
+
+    return "pyrbd-" + hashlib.sha256(preamble.encode("utf-8")).hexdigest()[:16]
+
+
+def private_directory(directory: str) -> None:
+    """Create directory accessible only by the current user, or check an existing one.
+
+    Format files are loaded by LuaLaTeX as trusted code, so a format directory writable by
+    other users would let them plant formats.
+
+    Parameters
+    ----------
+    directory : str
+        directory, created with mode `0o700` if missing
+
+    Raises
+    ------
+    PermissionError
+        If `directory` is not owned by the current user or is writable by other users
+    """
+
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    if not hasattr(os, "getuid"):
+        return
+
+    status = os.stat(directory)
+    if status.st_uid != os.getuid() or status.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise PermissionError(
+            f"Format directory {directory} must be owned by the current user and not "
+            "writable by other users"
+        )
+
+
+def build_format(preamble: str, directory: str) -> str:
+    """Build LuaLaTeX format file for `preamble` unless it exists.
+
+    Parameters
+    ----------
+    preamble : str
+        fixed preamble
+    directory : str
+        format directory, created if missing, see `private_directory()`
+
+    Returns
+    -------
+    str
+        format name
+
+    Raises
+    ------
+    PermissionError
+        If `directory` is not owned by the current user or is writable by other users
+    """
+
+    private_directory(directory)
+
+    name = format_name(preamble)
+    if os.path.isfile(os.path.join(directory, f"{name}.fmt")):
+        return name
+
+    # Build in a private directory and move format in place, so concurrent builds never
+    # use a partially written format file
+    with tempfile.TemporaryDirectory(dir=directory) as build_dir:
+        with open(os.path.join(build_dir, f"{name}.tex"), "w", encoding="utf-8") as file:
+            file.write(preamble)
+        subprocess.check_call(
+            [
+                "lualatex",
+                "-ini",
+                "-interaction=batchmode",
+                f"-jobname={name}",
+                "&lualatex",
+                "mylatexformat.ltx",
+                f"{name}.tex",
+            ],
+            cwd=build_dir,
+            stdout=subprocess.DEVNULL,
+        )
+        os.replace(os.path.join(build_dir, f"{name}.fmt"), os.path.join(directory, f"{name}.fmt"))
+
+    return name
+
+
+def latexmk_options(tex_file: str, directory: str) -> tuple[list[str], dict[str, str]]:
+    """Get `latexmk` options and environment for compiling with precompiled preamble.
+
+    Parameters
+    ----------
+    tex_file : str
+        .tex filename
+    directory : str
+        format directory
+
+    Returns
+    -------
+    tuple[list[str], dict[str, str]]
+        `latexmk` options and environment variables
+    """
+
+    with open(tex_file, encoding="utf-8") as file:
+        name = build_format(split_preamble(file.read()), directory)
+
+    environment = os.environ | {
+        "TEXFORMATS": os.path.abspath(directory) + os.pathsep + os.environ.get("TEXFORMATS", "")
+    }
+
+    return [f"-lualatex=lualatex -fmt={name} %O %S"], environment
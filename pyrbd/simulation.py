@@ -0,0 +1,176 @@
+"""Module containing Monte Carlo simulation of reliability block diagrams."""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .block import Block
+
+
+class SimulationResult(NamedTuple):
+    """Result of Monte Carlo simulation of a reliability block diagram.
+
+    Attributes
+    ----------
+    n_samples : int
+        number of simulated samples
+    reliability : float
+        estimated probability of no system failure in the interval `[0, horizon]`
+    availability : float
+        estimated probability of a functioning system at time `horizon`,
+        taking block repairs into account
+    """
+
+    n_samples: int
+    reliability: float
+    availability: float
+
+
+def _sample_failure_times(
+    block: Block, size: int, rng: np.random.Generator
+) -> NDArray[np.float64]:
+    """Sample failure times of leaf `Block` instance with failure rate or distribution."""
+
+    if block.distribution is not None:
+        return np.asarray(block.distribution.isf(rng.random(size)), dtype=np.float64)
+    if block.failure_rate:
+        return rng.exponential(1.0 / block.failure_rate, size)
+
+    return np.full(size, np.inf)
+
+
+def _sample_states(
+    block: Block, horizon: float, size: int, rng: np.random.Generator
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Sample states of leaf `Block` instance.
+
+    Returns
+    -------
+    tuple[NDArray[np.float64], NDArray[np.float64]]
+        arrays with ones for samples where the block has not failed before `horizon`, and
+        where the block is functioning at `horizon`, respectively
+    """
+
+    if block.fixed_reliability is not None:
+        state = (rng.random(size) < block.fixed_reliability).astype(np.float64)
+        return state, state
+
+    clock = _sample_failure_times(block, size, rng)
+    survived = (clock > horizon).astype(np.float64)
+    if block.repair_rate is None:
+        return survived, survived
+
+    # Alternate repair and failure times for samples still failed at `horizon`
+    functioning = survived.copy()
+    active = np.flatnonzero(clock <= horizon)
+    while active.size > 0:
+        clock[active] += rng.exponential(1.0 / block.repair_rate, active.size)
+        active = active[clock[active] <= horizon]
+        clock[active] += _sample_failure_times(block, active.size, rng)
+        repaired = clock[active] > horizon
+        functioning[active[repaired]] = 1.0
+        active = active[~repaired]
+
+    return survived, functioning
+
+
+def _simulate_batch(
+    blocks: list[Block], horizon: float, size: int, seed: np.random.SeedSequence
+) -> tuple[float, float]:
+    """Simulate batch of samples of blocks in series.
+
+    Returns
+    -------
+    tuple[float, float]
+        number of samples without system failure before `horizon`, and number of
+        samples with functioning system at `horizon`
+    """
+
+    rng = np.random.default_rng(seed)
+
+    # Leaf blocks of shared components share their sampled states
+    leaves = {id(leaf.component): leaf for block in blocks for leaf in block.get_blocks()}
+    survived: dict[int, NDArray[np.float64]] = {}
+    functioning: dict[int, NDArray[np.float64]] = {}
+    for key, leaf in leaves.items():
+        survived[key], functioning[key] = _sample_states(leaf, horizon, size, rng)
+
+    system_survived = np.ones(size)
+    system_functioning = np.ones(size)
+    for block in blocks:
+        system_survived *= block.structure(lambda leaf: survived[id(leaf.component)])
+        system_functioning *= block.structure(lambda leaf: functioning[id(leaf.component)])
+
+    return float(system_survived.sum()), float(system_functioning.sum())
+
+
+def simulate(  # pylint: disable=too-many-arguments
+    blocks: list[Block],
+    n_samples: int,
+    horizon: float,
+    seed: int | None = None,
+    *,
+    batch_size: int = 100_000,
+    max_workers: int = 1,
+) -> SimulationResult:
+    """Monte Carlo simulation of `Block` instances in series.
+
+    Samples are drawn in batches with independent random generators spawned from `seed`,
+    giving identical results regardless of the number of worker processes.
+
+    Parameters
+    ----------
+    blocks : list[Block]
+        list of `Block` instances in series
+    n_samples : int
+        number of samples
+    horizon : float
+        mission time
+    seed : int | None, default=None
+        random seed for reproducible results
+    batch_size : int, default=100_000
+        number of samples per batch
+    max_workers : int, default=1
+        number of worker processes. Batches are simulated in the current process if `1`
+
+    Returns
+    -------
+    SimulationResult
+        estimated system reliability and availability
+
+    Raises
+    ------
+    ValueError
+        If `n_samples`, `batch_size` or `max_workers` is not a positive integer
+    """
+
+    if min(n_samples, batch_size, max_workers) <= 0:
+        raise ValueError("`n_samples`, `batch_size` and `max_workers` must be positive")
+
+    n_batches = -(-n_samples // batch_size)
+    sizes = [min(batch_size, n_samples - i * batch_size) for i in range(n_batches)]
+    seeds = np.random.SeedSequence(seed).spawn(n_batches)
+
+    if max_workers == 1:
+        counts = [
+            _simulate_batch(blocks, horizon, *args) for args in zip(sizes, seeds, strict=True)
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            counts = list(
+                executor.map(
+                    _simulate_batch, [blocks] * n_batches, [horizon] * n_batches, sizes, seeds
+                )
+            )
+
+    n_survived, n_functioning = np.sum(counts, axis=0)
+
+    return SimulationResult(
+        n_samples=n_samples,
+        reliability=float(n_survived / n_samples),
+        availability=float(n_functioning / n_samples),
+    )
@@ -0,0 +1,123 @@
+"""Module containing per-stage timing statistics of the diagram pipeline.
+
+Each stage of writing and compiling a diagram, e.g. rendering the .tex file, running
+`latexmk` and converting the pdf, is recorded as a `StageTiming` in `Diagram.stats`.
+Recorded stages do not overlap, so their durations add up to the total wall time. Stages
+nested in another stage, e.g. compiling a cached group image in a `'subtree'` stage, are
+listed in the `stages` detail of the enclosing stage instead.
+Stage timings are also logged at debug level to the `pyrbd.stats` logger, with the
+timing as `pyrbd_stage` log record attribute, and passed to `config.STAGE_HOOK` if set,
+e.g. to export them as tracing spans.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, NamedTuple
+
+from . import config
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class StageTiming(NamedTuple):
+    """Timing of a single pipeline stage.
+
+    Attributes
+    ----------
+    name : str
+        diagram name
+    stage : str
+        stage name, e.g. `'write'`, `'latexmk'` or `'export_png'`
+    start : float
+        stage start time (in seconds since the epoch)
+    duration : float
+        stage wall time (in seconds)
+    details : dict[str, Any]
+        stage details, e.g. output sizes (in bytes) and node counts
+    """
+
+    name: str
+    stage: str
+    start: float
+    duration: float
+    details: dict[str, Any]
+
+
+class Stats:
+    """Recorder of pipeline stage timings of a single diagram.
+
+    Parameters
+    ----------
+    name : str
+        diagram name
+
+    Attributes
+    ----------
+    stages : list[StageTiming]
+        recorded stage timings, in order of completion
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.stages: list[StageTiming] = []
+
+    @contextmanager
+    def stage(self, stage: str, **details: Any) -> Iterator[dict[str, Any]]:
+        """Record wall time of the enclosed code as pipeline stage.
+
+        Parameters
+        ----------
+        stage : str
+            stage name
+        **details : Any
+            initial stage details
+
+        Yields
+        ------
+        dict[str, Any]
+            stage details, which may be updated by the enclosed code
+        """
+
+        start, counter = time.time(), time.perf_counter()
+        try:
+            yield details
+        finally:
+            timing = StageTiming(self.name, stage, start, time.perf_counter() - counter, details)
+            self.stages.append(timing)
+
+            _LOGGER.debug(
+                "%s: %s took %.3f s",
+                self.name,
+                stage,
+                timing.duration,
+                extra={"pyrbd_stage": timing},
+            )
+            if config.STAGE_HOOK is not None:
+                config.STAGE_HOOK(timing)  # pylint: disable=not-callable
+
+    @property
+    def total(self) -> float:
+        """Total wall time of all recorded stages (in seconds).
+
+        Returns
+        -------
+        float
+            total wall time
+        """
+
+        return sum(timing.duration for timing in self.stages)
+
+    def as_dicts(self) -> list[dict[str, Any]]:
+        """Get recorded stage timings as JSON serializable dictionaries.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            list of stage timing dictionaries
+        """
+
+        return [timing._asdict() for timing in self.stages]
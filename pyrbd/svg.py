@@ -0,0 +1,457 @@
+"""Module containing pure Python SVG rendering of diagrams without LaTeX.
+
+Node sizes and positions are computed from the `Block`, `Series` and `Group` layout
+attributes following the TikZ templates, with block text sizes estimated from the number
+of characters. The result closely resembles, but is not identical to, the compiled
+LaTeX diagram.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, NamedTuple
+from xml.sax.saxutils import escape
+
+from . import config
+from .block import Block, Group, Series
+
+if TYPE_CHECKING:
+    from .diagram import Diagram
+
+CM: float = 72 / 2.54
+"""SVG user units (PostScript points) per cm."""
+
+_PT: float = 2.54 / 72.27
+_FONT_SIZE: float = 10 * _PT
+_CHAR_WIDTH: float = 0.45 * _FONT_SIZE
+_LINE_HEIGHT: float = 1.2 * _FONT_SIZE
+_INNER_SEP: float = 4 * _PT
+_MIN_HEIGHT: float = 1.0
+_THICK: float = 0.8 * _PT
+_CORNER_RADIUS: float = 0.03
+_MARGIN: float = 0.1
+
+_BASE_COLORS: dict[str, tuple[float, float, float]] = {
+    "red": (1, 0, 0),
+    "green": (0, 1, 0),
+    "blue": (0, 0, 1),
+    "cyan": (0, 1, 1),
+    "magenta": (1, 0, 1),
+    "yellow": (1, 1, 0),
+    "black": (0, 0, 0),
+    "white": (1, 1, 1),
+    "gray": (0.5, 0.5, 0.5),
+    "darkgray": (0.25, 0.25, 0.25),
+    "lightgray": (0.75, 0.75, 0.75),
+    "brown": (0.75, 0.5, 0.25),
+    "lime": (0.75, 1, 0),
+    "olive": (0.5, 0.5, 0),
+    "orange": (1, 0.5, 0),
+    "pink": (1, 0.75, 0.75),
+    "purple": (0.75, 0, 0.25),
+    "teal": (0, 0.5, 0.5),
+    "violet": (0.5, 0, 0.5),
+}
+
+
+class _Box(NamedTuple):
+    """Bounding box `(x0, y0, x1, y1)` in cm, with y-axis pointing up as in TikZ."""
+
+    x0: float
+    y0: float
+    x1: float
+    y1: float
+
+    @property
+    def west(self) -> tuple[float, float]:
+        """West anchor."""
+        return (self.x0, (self.y0 + self.y1) / 2)
+
+    @property
+    def east(self) -> tuple[float, float]:
+        """East anchor."""
+        return (self.x1, (self.y0 + self.y1) / 2)
+
+    def shift(self, dx: float, dy: float) -> _Box:
+        """Translate box by `(dx, dy)`."""
+        return _Box(self.x0 + dx, self.y0 + dy, self.x1 + dx, self.y1 + dy)
+
+
+class _Frame:
+    """Picture frame collecting named node boxes and SVG elements in local coordinates."""
+
+    def __init__(self) -> None:
+        self.nodes: dict[str, _Box] = {}
+        self.background: list[str] = []
+        self.parts: list[str] = []
+        self.bbox: _Box | None = None
+
+    def extend(self, *points: tuple[float, float]) -> None:
+        """Extend frame bounding box to include `points`."""
+
+        xs = [x for x, _ in points]
+        ys = [y for _, y in points]
+        if self.bbox is not None:
+            xs += [self.bbox.x0, self.bbox.x1]
+            ys += [self.bbox.y0, self.bbox.y1]
+        self.bbox = _Box(min(xs), min(ys), max(xs), max(ys))
+
+    def rect(self, box: _Box, style: str, background: bool = False, radius: float = 0) -> None:
+        """Add rectangle element."""
+
+        self.extend((box.x0, box.y0), (box.x1, box.y1))
+        (self.background if background else self.parts).append(
+            f'<rect x="{_u(box.x0)}" y="{_u(-box.y1)}" width="{_u(box.x1 - box.x0)}" '
+            f'height="{_u(box.y1 - box.y0)}" rx="{_u(radius)}" {style}/>'
+        )
+
+    def path(self, points: list[tuple[float, float]], style: str) -> None:
+        """Add polyline element."""
+
+        self.extend(*points)
+        coordinates = " ".join(f"{_u(x)},{_u(-y)}" for x, y in points)
+        self.parts.append(f'<polyline points="{coordinates}" fill="none" {style}/>')
+
+    def text(self, point: tuple[float, float], text: str) -> None:
+        """Add centered text element."""
+
+        lines = _text_lines(text)
+        x, y = point
+        y += (len(lines) - 1) * _LINE_HEIGHT / 2
+        for i, line in enumerate(lines):
+            self.parts.append(
+                f'<text x="{_u(x)}" y="{_u(-(y - i * _LINE_HEIGHT))}" '
+                'text-anchor="middle" dominant-baseline="central">'
+                f"{escape(line)}</text>"
+            )
+
+    def place(self, frame: _Frame, offset: tuple[float, float]) -> None:
+        """Place inner `frame` translated by `offset`."""
+
+        dx, dy = offset
+        transform = f'transform="translate({_u(dx)},{_u(-dy)})"'
+        if frame.background:
+            self.background.append(f"<g {transform}>{''.join(frame.background)}</g>")
+        self.parts.append(f"<g {transform}>{''.join(frame.parts)}</g>")
+        for name, box in frame.nodes.items():
+            self.nodes[name] = box.shift(dx, dy)
+
+
+def _u(value: float) -> str:
+    """Format length in cm as SVG user units."""
+
+    return f"{value * CM:.2f}"
+
+
+def _text_lines(text: str) -> list[str]:
+    """Split LaTeX text into lines and strip simple formatting commands."""
+
+    lines = re.split(r"\\\\", text)
+    return [re.sub(r"\\[a-zA-Z]+\s*|[{}$]", "", line).strip() for line in lines]
+
+
+def color(name: str, custom_colors: dict[str, str]) -> str:
+    """Convert xcolor color expression to SVG color.
+
+    Supports base xcolor names, custom hex colors and mixing expressions like
+    `'yellow!50'` and `'black!70!gray'`. Other color names are assumed to be valid
+    SVG color names.
+
+    Parameters
+    ----------
+    name : str
+        xcolor color expression
+    custom_colors : dict[str, str]
+        custom color definitions in HEX format
+
+    Returns
+    -------
+    str
+        SVG color string
+    """
+
+    def rgb(base: str) -> tuple[float, float, float] | None:
+        if base in custom_colors:
+            code = custom_colors[base]
+            return (int(code[0:2], 16) / 255, int(code[2:4], 16) / 255, int(code[4:6], 16) / 255)
+        return _BASE_COLORS.get(base)
+
+    parts = name.split("!")
+    names, percentages = parts[0::2], parts[1::2]
+    if len(names) == len(percentages):
+        names.append("white")
+    colors = [rgb(base) for base in names]
+    known_colors = [rgb_color for rgb_color in colors if rgb_color is not None]
+    if len(known_colors) < len(colors):
+        # Unknown colors are not mixed
+        return names[colors.index(None)].lower()
+
+    mixed: tuple[float, ...] = known_colors[0]
+    for other, percentage in zip(known_colors[1:], percentages, strict=True):
+        weight = float(percentage) / 100
+        mixed = tuple(weight * a + (1 - weight) * b for a, b in zip(mixed, other, strict=True))
+
+    return "#" + "".join(f"{round(255 * value):02x}" for value in mixed)
+
+
+class _Renderer:
+    """Layout and SVG rendering of `Block` instances."""
+
+    def __init__(self, colors: dict[str, str]) -> None:
+        self.colors = colors
+        self.arrow_head = any(style in config.ARROW_STYLE for style in (">", "latex", "stealth"))
+        arrow_color = color("arrowcolor", colors)
+        if arrow_color == "#4c4d4c":
+            arrow_color = "var(--color)"
+        self.arrow_style = f'stroke="{arrow_color}" stroke-width="{_u(_THICK)}"'
+
+    def _position(self, block: Block, frame: _Frame) -> tuple[float, float] | None:
+        """Get reference point `parent.last.east`, `None` for blocks without parent."""
+
+        if block.parent is None:
+            return None
+        reference = frame.nodes.get(block.parent.last.id)
+
+        return reference.east if reference is not None else (0.0, 0.0)
+
+    def _west(self, block: Block, reference: tuple[float, float] | None) -> tuple[float, float]:
+        """Get west anchor of block placed right of `reference`."""
+
+        if reference is None:
+            return (0.0, 0.0)
+
+        return (
+            reference[0] + block.arrow_length + block.shift[0],
+            reference[1] + block.shift[1],
+        )
+
+    def _connector(
+        self,
+        frame: _Frame,
+        start: tuple[float, float],
+        end: tuple[float, float],
+        connector_position: float,
+        arrow: bool = True,
+    ) -> None:
+        """Draw rectangle connector from `start` to `end`."""
+
+        bend = start[0] + connector_position
+        marker = ' marker-end="url(#arrowhead)"' if arrow and self.arrow_head else ""
+        frame.path([start, (bend, start[1]), (bend, end[1]), end], self.arrow_style + marker)
+
+    def _decorate(self, block: Series | Group, frame: _Frame, box: _Box, label: str) -> None:
+        """Draw background frame and `label` of `Series` and `Group` instances."""
+
+        pad = block.pad
+        stroke = color(block.color, self.colors) if block.color else "none"
+        if block.color not in ("white", ""):
+            frame.rect(
+                _Box(
+                    box.x0 - pad.w / 10,
+                    box.y0 - pad.s / 10,
+                    box.x1 + pad.e / 10,
+                    box.y1 + pad.n / 10,
+                ),
+                f'fill="none" stroke="{stroke}" stroke-width="{_u(_THICK)}"',
+                background=True,
+            )
+        if label:
+            label_height = block.label_height / 10
+            top = box.y1 + pad.n / 10
+            fill = color(f"{block.color}!50", self.colors) if block.color else "none"
+            frame.rect(
+                _Box(box.x0 - pad.w / 10, top, box.x1 + pad.e / 10, top + label_height),
+                f'fill="{fill}" stroke="{stroke}" stroke-width="{_u(_THICK)}"',
+            )
+            frame.text(((box.x0 + box.x1) / 2, top + label_height / 2), label)
+
+    def place(self, block: Block, frame: _Frame, connector_position: float | None = None) -> None:
+        """Place `block` in `frame` following the TikZ templates.
+
+        Nested blocks are placed with an explicit stack, not by recursion. The blocks of
+        each `Series` or `Group` instance are placed in an inner frame first, which is
+        then placed in the frame of the series or group.
+
+        Parameters
+        ----------
+        block : Block
+            `Block` instance
+        frame : _Frame
+            picture frame to place block in
+        connector_position : float | None, default=None
+            distance in cm to right angle bend in connector
+        """
+
+        # Blocks with their frame, connector position and, once their blocks are
+        # placed, the inner frame of series and groups
+        stack: list[tuple[Block, _Frame, float | None, _Frame | None]] = [
+            (block, frame, connector_position, None)
+        ]
+        while stack:
+            block, frame, connector_position, inner = stack.pop()
+            if not isinstance(block, (Series, Group)):
+                self._place_block(block, frame, connector_position)
+            elif inner is None:
+                inner = _Frame()
+                if isinstance(block, Group):
+                    inner.nodes[block.id] = _Box(0, 0, 0, 0)
+                    inner.extend((0.0, 0.0))
+                elif connector_position is None:
+                    connector_position = block.arrow_length / 2
+                stack.append((block, frame, connector_position, inner))
+                position = 0.0 if isinstance(block, Group) else connector_position
+                stack.extend((child, inner, position, None) for child in reversed(block.blocks))
+            elif isinstance(block, Series):
+                self._place_series(block, frame, inner, connector_position)
+            else:
+                self._place_group(block, frame, inner)
+
+    def _place_block(self, block: Block, frame: _Frame, connector_position: float | None) -> None:
+        """Place leaf `Block` instance, following `block.tex.jinja`."""
+
+        if connector_position is None:
+            connector_position = block.arrow_length / 2
+
+        lines = _text_lines(block.text)
+        width = max(len(line) for line in lines) * _CHAR_WIDTH + 2 * _INNER_SEP
+        height = max(_MIN_HEIGHT, len(lines) * _LINE_HEIGHT + 2 * _INNER_SEP)
+
+        reference = self._position(block, frame)
+        x, y = self._west(block, reference)
+        box = _Box(x, y - height / 2, x + width, y + height / 2)
+        frame.nodes[block.id] = box
+
+        frame.rect(
+            box,
+            f'fill="{color(block.color, self.colors)}" '
+            f'stroke="{color("black!70!gray", self.colors)}" stroke-width="{_u(0.4 * _PT)}"',
+            radius=_CORNER_RADIUS,
+        )
+        frame.text(((box.x0 + box.x1) / 2, y), block.text)
+
+        if reference is not None:
+            self._connector(frame, reference, box.west, connector_position)
+
+    def _place_inner(self, block: Block, frame: _Frame, inner: _Frame) -> _Box:
+        """Place inner picture of `Series` or `Group` as node in `frame`."""
+
+        reference = self._position(block, frame)
+        inner_box = inner.bbox or _Box(0, 0, 0, 0)
+        x, y = self._west(block, reference)
+        offset = (x - inner_box.x0, y - (inner_box.y0 + inner_box.y1) / 2)
+
+        frame.place(inner, offset)
+        box = inner_box.shift(*offset)
+        frame.extend((box.x0, box.y0), (box.x1, box.y1))
+        frame.nodes[block.id] = box
+
+        return box
+
+    def _place_series(
+        self, series: Series, frame: _Frame, inner: _Frame, connector_position: float | None
+    ) -> None:
+        """Place `Series` instance with blocks placed in `inner`, following `series.tex.jinja`."""
+
+        if connector_position is None:
+            connector_position = series.arrow_length / 2
+
+        box = self._place_inner(series, frame, inner)
+
+        reference = self._position(series, frame)
+        if reference is not None:
+            self._connector(
+                frame, reference, frame.nodes[series.blocks[0].id].west, connector_position
+            )
+        self._decorate(series, frame, box, series.text)
+
+    def _place_group(self, group: Group, frame: _Frame, inner: _Frame) -> None:
+        """Place `Group` instance with blocks placed in `inner`, following `group.tex.jinja`."""
+
+        # Connecting lines
+        sorted_blocks = group.sorted_blocks
+        start = inner.nodes[sorted_blocks[0].id].east
+        for block in sorted_blocks[1:]:
+            self._connector(
+                inner,
+                start,
+                inner.nodes[block.id].east,
+                group.end_arrow_scaling * group.internal_arrow_length,
+                arrow=False,
+            )
+
+        reference = self._position(group, frame)
+        box = self._place_inner(group, frame, inner)
+
+        if reference is not None:
+            frame.path([reference, box.west], self.arrow_style)
+        self._decorate(group, frame, box, group.label)
+
+    def render(self, diagram: Diagram) -> str:
+        """Render diagram as SVG string.
+
+        Parameters
+        ----------
+        diagram : Diagram
+            `Diagram` instance
+
+        Returns
+        -------
+        str
+            SVG image
+        """
+
+        frame = _Frame()
+        for block in [diagram.head, *diagram.blocks]:
+            self.place(block, frame)
+
+        final_block = diagram.blocks[-1] if diagram.blocks else diagram.head
+        if isinstance(final_block, Group):
+            east = frame.nodes[final_block.id].east
+            length = final_block.end_arrow_scaling * final_block.internal_arrow_length
+            frame.path([east, (east[0] + length, east[1])], self.arrow_style)
+
+        bbox = frame.bbox or _Box(0, 0, 0, 0)
+        x0, y1 = bbox.x0 - _MARGIN, bbox.y1 + _MARGIN
+        width, height = bbox.x1 - bbox.x0 + 2 * _MARGIN, bbox.y1 - bbox.y0 + 2 * _MARGIN
+        font = "serif" if config.SERIF_FONT else "Helvetica, Arial, sans-serif"
+
+        return "\n".join(
+            [
+                '<svg xmlns="http://www.w3.org/2000/svg" version="1.1" '
+                f'width="{_u(width)}pt" height="{_u(height)}pt" '
+                f'viewBox="{_u(x0)} {_u(-y1)} {_u(width)} {_u(height)}">',
+                "<style>",
+                "   @media (prefers-color-scheme: light) { :root { --color: #000000; } }",
+                "   @media (prefers-color-scheme: dark) { :root { --color: #DDDDDD; } }",
+                "</style>",
+                "<defs>",
+                '<marker id="arrowhead" viewBox="0 0 10 10" refX="10" refY="5" '
+                'markerWidth="6" markerHeight="6" orient="auto-start-reverse">',
+                '<path d="M 0 0 L 10 5 L 0 10 z" fill="var(--color)"/>',
+                "</marker>",
+                "</defs>",
+                f'<g font-family="{font}" font-size="{_u(_FONT_SIZE)}">',
+                *frame.background,
+                *frame.parts,
+                "</g>",
+                "</svg>",
+                "",
+            ]
+        )
+
+
+def render_svg(diagram: Diagram) -> str:
+    """Render diagram as SVG string without LaTeX.
+
+    Parameters
+    ----------
+    diagram : Diagram
+        `Diagram` instance
+
+    Returns
+    -------
+    str
+        SVG image
+    """
+
+    return _Renderer(diagram.colors).render(diagram)
@@ -0,0 +1,170 @@
+"""Module containing batched parameter sweeps of reliability block diagrams.
+
+The failure rates of selected leaf blocks are swept over a grid of all combinations of
+the given parameter values. Instead of evaluating the diagram once per grid point, the
+leaf reliabilities of a batch of grid points are broadcast through the block structure
+as arrays with shape `(n_points, *t.shape)`, so each batch takes a single evaluation.
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .bdd import build, has_shared_components
+from .block import Block
+
+
+def _evaluate_batch(
+    blocks: list[Block], rates: dict[str, NDArray[np.float64]], t: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    """Evaluate blocks in series for a batch of failure rates by leaf block id.
+
+    Returns
+    -------
+    NDArray[np.float64]
+        reliability with shape `(n_points, *t.shape)`
+    """
+
+    n_points = len(next(iter(rates.values()))) if rates else 1
+    shape = (n_points, *t.shape)
+    leaves = itertools.chain.from_iterable(block.get_blocks() for block in blocks)
+    # Swept failure rates apply to all leaf blocks of the same component
+    swept = {id(leaf.component): rates[leaf.id] for leaf in leaves if leaf.id in rates}
+
+    def values(leaf: Block) -> NDArray[np.float64]:
+        """Get leaf reliability broadcast to the batch shape, without copying."""
+
+        rate = swept.get(id(leaf.component))
+        if rate is None:
+            return np.broadcast_to(leaf.reliability(t), shape)
+
+        return np.exp(-rate.reshape(-1, *[1] * t.ndim) * t)
+
+    if has_shared_components(blocks):
+        bdd, root, components = build(blocks)
+        return bdd.probability(root, [values(component) for component in components])
+
+    result = np.ones(shape)
+    for block in blocks:
+        result *= block.structure(values)
+
+    return result
+
+
+def _batch(
+    arrays: dict[str, NDArray[np.float64]], start: int, stop: int
+) -> dict[str, NDArray[np.float64]]:
+    """Get parameter values of flattened grid points `start` to `stop`.
+
+    The grid point values are computed from their flat indices, so only the values of a
+    single batch are held in memory instead of the full grid of all parameter values.
+    """
+
+    if not arrays:
+        return {}
+
+    indices = np.unravel_index(
+        np.arange(start, stop), tuple(array.size for array in arrays.values())
+    )
+
+    return {
+        key: array.ravel()[index]
+        for (key, array), index in zip(arrays.items(), indices, strict=True)
+    }
+
+
+def _evaluate_chunk(
+    blocks: list[Block],
+    arrays: dict[str, NDArray[np.float64]],
+    t: NDArray[np.float64],
+    start: int,
+    stop: int,
+) -> NDArray[np.float64]:
+    """Evaluate blocks in series for flattened grid points `start` to `stop`."""
+
+    return _evaluate_batch(blocks, _batch(arrays, start, stop), t)
+
+
+def sweep(
+    blocks: list[Block],
+    params: Mapping[str, ArrayLike],
+    t: ArrayLike,
+    *,
+    chunk_size: int | None = None,
+    max_workers: int = 1,
+) -> NDArray[np.float64]:
+    """Evaluate reliability of blocks in series over a grid of leaf block failure rates.
+
+    Parameters
+    ----------
+    blocks : list[Block]
+        list of `Block` instances in series
+    params : Mapping[str, ArrayLike]
+        failure rate values by leaf block id. The failure rates replace the failure data
+        of all leaf blocks with the given id, and of leaf blocks of the same component
+    t : ArrayLike
+        mission time or array of mission times
+    chunk_size : int | None, default=None
+        maximum number of grid points evaluated at once, bounding memory use to arrays
+        of `chunk_size * t.size` values. Defaults to all grid points at once
+    max_workers : int, default=1
+        number of worker processes evaluating chunks. Chunks are evaluated in the
+        current process if `1`
+
+    Returns
+    -------
+    NDArray[np.float64]
+        reliability with shape `(*shape_1, ..., *shape_n, *t.shape)`, where `shape_i` is
+        the shape of the `i`-th parameter array
+
+    Raises
+    ------
+    ValueError
+        If a parameter is not the id of a leaf block, a failure rate is negative, or
+        `chunk_size` or `max_workers` is not a positive integer
+    """
+
+    t = np.asarray(t, dtype=np.float64)
+    arrays = {key: np.asarray(value, dtype=np.float64) for key, value in params.items()}
+    if (chunk_size is not None and chunk_size <= 0) or max_workers <= 0:
+        raise ValueError("`chunk_size` and `max_workers` must be positive")
+
+    ids = {leaf.id for block in blocks for leaf in block.get_blocks()}
+    if invalid := arrays.keys() - ids:
+        raise ValueError(f"Parameters {sorted(invalid)} are not ids of leaf blocks")
+    if any(np.any(array < 0.0) for array in arrays.values()):
+        raise ValueError("Failure rates must be non-negative")
+
+    grid_shape = tuple(itertools.chain.from_iterable(array.shape for array in arrays.values()))
+    n_points = int(np.prod(grid_shape, dtype=int))
+
+    # Chunks are passed as ranges of flat grid point indices, and their parameter values
+    # are computed where the chunk is evaluated
+    size = chunk_size or max(n_points, 1)
+    starts = range(0, max(n_points, 1), size)
+    stops = [min(start + size, n_points) for start in starts]
+
+    if max_workers == 1:
+        results = [
+            _evaluate_chunk(blocks, arrays, t, start, stop)
+            for start, stop in zip(starts, stops, strict=True)
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(
+                executor.map(
+                    _evaluate_chunk,
+                    itertools.repeat(blocks),
+                    itertools.repeat(arrays),
+                    itertools.repeat(t),
+                    starts,
+                    stops,
+                )
+            )
+
+    return np.concatenate(results).reshape(*grid_shape, *t.shape)
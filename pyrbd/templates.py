@@ -1,8 +1,9 @@
 """Templates subpackage."""
 
+from functools import cache
 from os.path import abspath, dirname, join
 
-from jinja2 import Environment, FileSystemLoader, StrictUndefined
+from jinja2 import Environment, FileSystemLoader, StrictUndefined, Template
 
 _TEMPLATE_DIR = abspath(join(dirname(__file__), "templates/"))
 JINJA_ENV: Environment = Environment(
@@ -19,4 +20,27 @@ JINJA_ENV: Environment = Environment(
     autoescape=False,
     keep_trailing_newline=True,
     undefined=StrictUndefined,
+    auto_reload=False,
 )
+
+
+@cache
+def get_template(name: str) -> Template:
+    """Get compiled template by name.
+
+    Templates ship with the package and never change at runtime, so each template is
+    loaded and compiled once and then cached. No up-to-date checks of the template
+    files are made on later calls.
+
+    Parameters
+    ----------
+    name : str
+        template filename
+
+    Returns
+    -------
+    Template
+        compiled template
+    """
+
+    return JINJA_ENV.get_template(name)
@@ -0,0 +1,251 @@
+"""Benchmarks of diagram construction, writing, compilation and export.
+
+Requires the `pytest-benchmark` plugin. Run and save results as JSON with
+
+    pytest tests/benchmarks --benchmark-json=benchmark.json
+
+and compare saved runs across versions with `pytest-benchmark compare`. Compilation
+benchmarks are skipped unless `latexmk` is installed.
+"""
+
+import io
+import shutil
+from collections.abc import Callable
+from os import chdir
+from typing import TypeVar
+
+import pytest
+
+from pyrbd import Block, Diagram, Group, Series, config
+
+pytest.importorskip("pytest_benchmark")
+
+T = TypeVar("T")
+
+SIZES = [10, 100, 1000]
+DEPTHS = [10, 100, 1000]
+CACHES = ["off", "cold", "warm"]
+
+requires_latex = pytest.mark.skipif(shutil.which("latexmk") is None, reason="requires latexmk")
+
+
+def wide_diagram(n_series: int) -> Diagram:
+    """Diagram with a group of `n_series` series of 5 blocks each."""
+
+    block = Block("Block", "gray!20", failure_rate=1e-3)
+    group = Group(
+        [Series([block.copy() for _ in range(5)], "Series", "orange") for _ in range(n_series)],
+        "Group",
+        "red",
+    )
+
+    return Diagram("wide_diagram", [Block("Start", "white"), group, Block("End", "white")])
+
+
+def deep_block(depth: int) -> Block:
+    """Block with alternating series and groups nested `depth` levels deep."""
+
+    nested = Block("Block", "gray!20", failure_rate=1e-3)
+    for i in range(depth):
+        if i % 2:
+            nested = Series([nested, Block("Block", "white")])
+        else:
+            nested = Group([nested, Block("Block", "white")])
+
+    return nested
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_mul(benchmark, n: int) -> None:
+    """Benchmark `Block` multiplication to groups and series."""
+
+    block = Block("Block", "white") * 3
+
+    group = benchmark(lambda: n * block)
+    assert len(group.blocks) == n
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_get_blocks_wide(benchmark, n: int) -> None:
+    """Benchmark `get_blocks` of wide group."""
+
+    group = wide_diagram(n).blocks[0]
+
+    assert len(benchmark(lambda: list(group.get_blocks()))) == 5 * n
+
+
+@pytest.mark.parametrize("depth", DEPTHS)
+def test_get_blocks_deep(benchmark, depth: int) -> None:
+    """Benchmark `get_blocks` of deeply nested block."""
+
+    block = deep_block(depth)
+
+    assert len(benchmark(lambda: list(block.get_blocks()))) == depth + 1
+
+
+def clear_rendered(blocks: list[Block]) -> None:
+    """Clear cached rendered fragments of blocks and all their nested blocks."""
+
+    stack = list(blocks)
+    while stack:
+        block = stack.pop()
+        block._rendered = None  # pylint: disable=protected-access
+        if isinstance(block, (Series, Group)):
+            stack.extend(block.blocks)
+
+
+def render(benchmark, blocks: list[Block], function: Callable[[], T], cache: str) -> T:
+    """Benchmark rendering `function` of `blocks` with fragment cache mode `cache`.
+
+    Rendered fragments are not kept for `"off"`, cleared before each round for `"cold"`,
+    and reused from the first round for `"warm"`.
+    """
+
+    if cache == "cold":
+        result: T = benchmark.pedantic(function, setup=lambda: clear_rendered(blocks), rounds=10)
+    else:
+        result = benchmark(function)
+
+    return result
+
+
+@pytest.fixture(name="cache", params=CACHES)
+def cache_fixture(request, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Fragment cache mode, keeping rendered fragments unless `"off"`."""
+
+    monkeypatch.setattr(config, "INCREMENTAL_RENDER", request.param != "off")
+
+    return str(request.param)
+
+
+@pytest.mark.parametrize("fast_render", [False, True])
+@pytest.mark.parametrize("n", SIZES)
+def test_get_node_wide(
+    benchmark, monkeypatch: pytest.MonkeyPatch, n: int, fast_render: bool, cache: str
+) -> None:
+    """Benchmark `get_node` of wide group."""
+
+    monkeypatch.setattr(config, "FAST_RENDER", fast_render)
+    group = wide_diagram(n).blocks[0]
+
+    assert render(benchmark, [group], group.get_node, cache).count("% Block") == 5 * n
+
+
+@pytest.mark.parametrize("depth", DEPTHS)
+def test_get_node_deep(benchmark, depth: int, cache: str) -> None:
+    """Benchmark `get_node` of deeply nested block."""
+
+    block = deep_block(depth)
+
+    assert render(benchmark, [block], block.get_node, cache).count("% Block") == depth + 1
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_write(benchmark, tmp_path, n: int, cache: str) -> None:
+    """Benchmark `Diagram` `write` to .tex file."""
+
+    chdir(tmp_path)
+    diagram = wide_diagram(n)
+
+    render(benchmark, [diagram.head, *diagram.blocks], diagram.write, cache)
+    assert (tmp_path / f"{diagram.filename}.tex").is_file()
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_write_stream(benchmark, n: int, cache: str) -> None:
+    """Benchmark `Diagram` `write` to in-memory text stream."""
+
+    diagram = wide_diagram(n)
+
+    render(benchmark, [diagram.head, *diagram.blocks], lambda: diagram.write(io.StringIO()), cache)
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_render_svg(benchmark, n: int) -> None:
+    """Benchmark pure Python SVG rendering."""
+
+    diagram = wide_diagram(n)
+
+    assert benchmark(diagram.render_svg).startswith("<svg")
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_evaluate(benchmark, n: int) -> None:
+    """Benchmark `Diagram` `evaluate` at 1000 mission times."""
+
+    diagram = wide_diagram(n)
+    t = [float(i) for i in range(1000)]
+
+    assert benchmark(lambda: diagram.evaluate(t)).shape == (1000,)
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_evaluate_shared(benchmark, n: int) -> None:
+    """Benchmark `Diagram` `evaluate` of `n` bridge structures of shared components."""
+
+    bridges: list[Block] = []
+    for _ in range(n):
+        a, b, c, d, e = (Block("Block", "gray!20", failure_rate=1e-3) for _ in range(5))
+        bridges.append(
+            Group(
+                [
+                    Series([a, c]),
+                    Series([b, d]),
+                    Series([a.shared_copy(), e, d.shared_copy()]),
+                    Series([b.shared_copy(), e.shared_copy(), c.shared_copy()]),
+                ]
+            )
+        )
+    diagram = Diagram("shared_diagram", [Block("Start", "white"), *bridges])
+    t = [float(i) for i in range(1000)]
+
+    assert benchmark(lambda: diagram.evaluate(t)).shape == (1000,)
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_importance(benchmark, n: int) -> None:
+    """Benchmark `Diagram` `importance` of all blocks at 1000 mission times."""
+
+    diagram = wide_diagram(n)
+    t = [float(i) for i in range(1000)]
+
+    assert len(benchmark(lambda: diagram.importance(t))) == 5 * n + 2
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_sweep(benchmark, n: int) -> None:
+    """Benchmark `Diagram` `sweep` of two failure rates over a 20 x 20 grid at 100 times."""
+
+    diagram = wide_diagram(n)
+    leaves = list(diagram.blocks[0].get_blocks())
+    params = {
+        leaves[0].id: [1e-3 * i for i in range(20)],
+        leaves[5].id: [1e-3 * i for i in range(20)],
+    }
+    t = [10.0 * i for i in range(100)]
+
+    assert benchmark(lambda: diagram.sweep(params, t)).shape == (20, 20, 100)
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_path_sets(benchmark, n: int) -> None:
+    """Benchmark `Diagram` `path_sets` with one path set per series."""
+
+    diagram = wide_diagram(n)
+
+    assert len(benchmark(diagram.path_sets)) == n
+
+
+@requires_latex
+@pytest.mark.parametrize("output", ["pdf", "svg", "png"])
+def test_compile(benchmark, tmp_path, output: str) -> None:
+    """Benchmark `Diagram` `compile` including export to `output` format."""
+
+    chdir(tmp_path)
+    diagram = wide_diagram(10)
+
+    def write_compile() -> list[str]:
+        diagram.write()
+        return diagram.compile(output)
+
+    assert benchmark.pedantic(write_compile, rounds=3) == [f"{diagram.filename}.{output}"]
@@ -1,10 +1,11 @@
 """Tests for `Diagram` class."""
 
+import subprocess
 from os import chdir
 
 import pytest
 
-from pyrbd import Block, Diagram
+from pyrbd import Block, Diagram, compile_many, config
 
 
 @pytest.fixture(name="diagram")
@@ -33,3 +34,96 @@ def test_diagram_compile(tmp_path, diagram: Diagram) -> None:
     assert ".png" in "\n".join(diagram.compile("png", clear_source=False))
     assert ".pdf" not in "\n".join(diagram.compile(["svg", "png"], clear_source=False))
     assert ".pdf" in "\n".join(diagram.compile(["pdf", "svg"]))
+
+
+def test_diagram_compile_cache(tmp_path, monkeypatch, diagram: Diagram) -> None:
+    """Test `Diagram` `compile` with cached output files."""
+
+    temp_dir = tmp_path / "test_diagram_compile_cache"
+    temp_dir.mkdir()
+    chdir(temp_dir)
+    monkeypatch.setattr(config, "CACHE_DIR", str(temp_dir / "cache"))
+
+    diagram.write()
+    output_files = diagram.compile(["pdf", "svg"])
+
+    # Cache hit does not call latexmk
+    monkeypatch.setattr(subprocess, "check_call", None)
+    diagram.write()
+    assert diagram.compile(["pdf", "svg"]) == output_files
+
+
+def test_compile_many(tmp_path) -> None:
+    """Test `compile_many` with concurrent LaTeX jobs."""
+
+    chdir(tmp_path)
+
+    diagrams = [
+        Diagram(f"diagram_{i}", [Block("block1", "white"), Block("block2", "white")])
+        for i in range(4)
+    ]
+    results = compile_many(diagrams, ["pdf", "png"], max_workers=4)
+
+    for result in results:
+        assert result.error is None
+        assert result.files == [f"{result.diagram.filename}.png", f"{result.diagram.filename}.pdf"]
+        assert all((tmp_path / file).is_file() for file in result.files)
+
+
+def test_diagram_compile_precompiled_preamble(tmp_path, monkeypatch, diagram: Diagram) -> None:
+    """Test `Diagram` `compile` with precompiled preamble format."""
+
+    chdir(tmp_path)
+    monkeypatch.setattr(config, "FORMAT_DIR", str(tmp_path / "formats"))
+
+    diagram.write()
+    assert diagram.compile("pdf", precompiled_preamble=True) == [f"{diagram.filename}.pdf"]
+    assert len(list((tmp_path / "formats").glob("*.fmt"))) == 1
+
+    with pytest.raises(FileNotFoundError):
+        diagram.compile(precompiled_preamble=True)
+
+
+def test_diagram_compile_combined(tmp_path) -> None:
+    """Test `Diagram` `compile_combined` in a single LaTeX run."""
+
+    chdir(tmp_path)
+
+    diagrams = [
+        Diagram(
+            f"diagram_{i}",
+            [Block("block1", "mycolor"), Block("block2", "white")],
+            colors={"mycolor": f"{i}{i}{i}{i}{i}{i}"},
+        )
+        for i in range(3)
+    ]
+    output_files = Diagram.compile_combined(diagrams, ["pdf", "svg"])
+
+    assert output_files == [[f"diagram_{i}.svg", f"diagram_{i}.pdf"] for i in range(3)]
+    assert all((tmp_path / file).is_file() for files in output_files for file in files)
+
+
+def test_diagram_render(tmp_path, diagram: Diagram) -> None:
+    """Test `Diagram` `render` to bytes without files in working directory."""
+
+    chdir(tmp_path)
+
+    assert diagram.render("pdf").startswith(b"%PDF")
+    assert b"<svg" in diagram.render("svg")
+    assert diagram.render("png").startswith(b"\x89PNG")
+    assert not list(tmp_path.iterdir())
+
+
+def test_diagram_subtree_cache(tmp_path, monkeypatch) -> None:
+    """Test `Diagram` `compile` with groups included as cached standalone images."""
+
+    chdir(tmp_path)
+    monkeypatch.setattr(config, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(config, "SUBTREE_CACHE", True)
+
+    group = 2 * (Block("Pump", "white") + Block("Valve", "white"))
+    diagram = Diagram("diagram", [Block("Start", "white"), group, Block("End", "white")])
+    diagram.write()
+
+    assert diagram.compile(["pdf", "png"]) == ["diagram.png", "diagram.pdf"]
+    assert [timing.stage for timing in diagram.stats.stages].count("subtree") == 1
@@ -0,0 +1,64 @@
+"""Shared pytest fixtures of unit tests."""
+
+from typing import NamedTuple
+
+import pymupdf
+import pytest
+
+from pyrbd import diagram as diagram_module
+from pyrbd.stats import Stats
+
+
+class LatexmkCall(NamedTuple):
+    """Arguments of a faked `latexmk` compilation and the compiled .tex source."""
+
+    filename: str
+    clear_source: bool
+    precompiled_preamble: bool
+    clean_up: bool
+    stats: Stats | None
+    source: str
+
+
+class FakeLatexmk:  # pylint: disable=too-few-public-methods
+    """Fake `_run_latexmk` recording its calls and creating pdf documents.
+
+    The pdf document has a `width` by `height` pt page, or one page per `pyrbdpage`
+    environment of combined documents, each 1 pt wider than the previous page.
+    """
+
+    width: float = 72.0
+    height: float = 36.0
+
+    def __init__(self) -> None:
+        self.calls: list[LatexmkCall] = []
+
+    def __call__(
+        self,
+        filename: str,
+        clear_source: bool,
+        precompiled_preamble: bool,
+        clean_up: bool = True,
+        stats: Stats | None = None,
+    ) -> None:
+        with open(f"{filename}.tex", encoding="utf-8") as file:
+            source = file.read()
+        self.calls.append(
+            LatexmkCall(filename, clear_source, precompiled_preamble, clean_up, stats, source)
+        )
+
+        with (stats or Stats(filename)).stage("latexmk"):
+            pdf_document = pymupdf.open()
+            for i in range(max(source.count(r"\begin{pyrbdpage}"), 1)):
+                pdf_document.new_page(width=self.width + i, height=self.height)
+            pdf_document.save(f"{filename}.pdf")
+
+
+@pytest.fixture(name="fake_latexmk")
+def fake_latexmk_fixture(monkeypatch: pytest.MonkeyPatch) -> FakeLatexmk:
+    """Replace LaTeX compilation of diagrams with `FakeLatexmk`."""
+
+    fake = FakeLatexmk()
+    monkeypatch.setattr(diagram_module, "_run_latexmk", fake)
+
+    return fake
@@ -0,0 +1,120 @@
+"""Tests for `compile_many` in batch.py"""
+
+import os
+import threading
+import time
+from os import chdir
+
+import pymupdf
+import pytest
+
+from pyrbd import Block, CompileResult, Diagram, compile_many, config
+
+
+def fake_compile(
+    self: Diagram,
+    output: str | list[str] = "pdf",
+    clear_source: bool = True,
+    precompiled_preamble: bool = False,
+):
+    """Fake `Diagram.compile` creating empty output files next to the .tex file."""
+
+    assert not precompiled_preamble
+
+    if self.filename.endswith("broken"):
+        raise RuntimeError("LaTeX error")
+
+    assert os.path.isfile(f"{self.filename}.tex")
+    if clear_source:
+        os.remove(f"{self.filename}.tex")
+
+    output_files = []
+    for fmt in output if isinstance(output, list) else [output]:
+        with open(output_file := f"{self.filename}.{fmt}", "w", encoding="utf-8") as file:
+            file.write(self.filename)
+        output_files.append(output_file)
+
+    return output_files
+
+
+def test_compile_many(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test `compile_many` with isolated working directories."""
+
+    chdir(tmp_path)
+    monkeypatch.setattr(Diagram, "compile", fake_compile)
+
+    names = ["diagram_1", "broken", "diagram_2"]
+    diagrams = [
+        Diagram(name, [Block("block1", "white"), Block("block2", "white")]) for name in names
+    ]
+
+    results = compile_many(diagrams, ["pdf", "svg"], max_workers=2, clear_source=False)
+
+    assert all(isinstance(result, CompileResult) for result in results)
+    assert [result.diagram for result in results] == diagrams
+
+    assert isinstance(results[1].error, RuntimeError)
+    assert not results[1].files
+
+    for result in [results[0], results[2]]:
+        assert result.error is None
+        assert result.diagram.stats.name == result.diagram.filename
+        assert [timing.stage for timing in result.diagram.stats.stages] == ["write"]
+        assert result.files == [
+            f"{result.diagram.filename}.{ext}" for ext in ["pdf", "svg", "tex"]
+        ]
+        for file in result.files:
+            assert os.path.isfile(file)
+
+    # Output files are compiled in a private working directory
+    assert (tmp_path / "diagram_1.pdf").read_text() != str(tmp_path / "diagram_1")
+
+
+@pytest.mark.usefixtures("fake_latexmk")
+def test_compile_many_png_sizes(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test `compile_many` keeps the resolution suffix of png files in many sizes."""
+
+    chdir(tmp_path)
+    monkeypatch.setattr(config, "PNG_DPI", [36, 144])
+
+    diagram = Diagram("diagram", [Block("block1", "white"), Block("block2", "white")])
+    (result,) = compile_many([diagram], ["pdf", "png"])
+
+    assert result.error is None
+    assert result.files == ["diagram_36dpi.png", "diagram_144dpi.png", "diagram.pdf"]
+    for dpi in [36, 144]:
+        assert pymupdf.Pixmap(f"diagram_{dpi}dpi.png").width == dpi
+
+
+@pytest.mark.usefixtures("fake_latexmk")
+def test_compile_many_serializes_pymupdf(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that concurrent `compile_many` jobs never use pymupdf at the same time."""
+
+    chdir(tmp_path)
+    export_page = Diagram._export_page  # pylint: disable=protected-access
+    lock = threading.Lock()
+    active: list[int] = [0, 0]
+
+    def tracked_export_page(self: Diagram, page: pymupdf.Page, output: list[str]) -> list[str]:
+        """Record the maximum number of concurrent page exports."""
+
+        with lock:
+            active[0] += 1
+            active[1] = max(active)
+        time.sleep(0.01)
+        try:
+            return export_page(self, page, output)
+        finally:
+            with lock:
+                active[0] -= 1
+
+    monkeypatch.setattr(Diagram, "_export_page", tracked_export_page)
+
+    diagrams = [
+        Diagram(f"diagram_{i}", [Block("block1", "white"), Block("block2", "white")])
+        for i in range(8)
+    ]
+    results = compile_many(diagrams, ["svg", "png"], max_workers=4)
+
+    assert all(result.error is None for result in results)
+    assert active[1] == 1
@@ -0,0 +1,172 @@
+"""Tests for binary decision diagram evaluation in bdd.py"""
+
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+from pyrbd import Block, Diagram, Group, Series
+from pyrbd.bdd import BDD, build, exact_reliability, has_shared_components
+
+from .test_cutsets import _random_block
+
+
+def _bridge() -> tuple[list[Block], Group]:
+    """Bridge structure of five components, as paths of shared copies."""
+
+    a, b, c, d, e = [
+        Block(name, "white", failure_rate=rate)
+        for name, rate in zip("ABCDE", [0.1, 0.2, 0.3, 0.4, 0.5], strict=True)
+    ]
+    bridge = Group(
+        [
+            Series([a, c]),
+            Series([b, d]),
+            Series([a.shared_copy(), e, d.shared_copy()]),
+            Series([b.shared_copy(), e.shared_copy(), c.shared_copy()]),
+        ]
+    )
+
+    return [a, b, c, d, e], bridge
+
+
+def _system(blocks: list[Block], values: dict[int, np.ndarray]) -> np.ndarray:
+    """System value of blocks in series from component values by `id()` of component."""
+
+    result = np.ones(next(iter(values.values())).shape)
+    for block in blocks:
+        result = result * block.structure(lambda leaf: values[id(leaf.component)])
+
+    return result
+
+
+def _enumerate(blocks: list[Block], t: np.ndarray) -> np.ndarray:
+    """Exact reliability of blocks in series by enumerating all component states."""
+
+    leaves = list(itertools.chain.from_iterable(block.get_blocks() for block in blocks))
+    components = list({id(leaf.component): leaf for leaf in leaves}.values())
+    result = np.zeros(t.shape)
+    for states in itertools.product([0.0, 1.0], repeat=len(components)):
+        values = {
+            id(component.component): np.full(t.shape, state)
+            for component, state in zip(components, states, strict=True)
+        }
+        system = _system(blocks, values)
+        probability = np.ones(t.shape)
+        for component, state in zip(components, states, strict=True):
+            reliability = component.reliability(t)
+            probability *= reliability if state else 1.0 - reliability
+        result += system * probability
+
+    return result
+
+
+def test_bdd() -> None:
+    """Test unique nodes, reduction and memoized operations of `BDD`."""
+
+    bdd = BDD(3)
+    x, y, z = (bdd.variable(variable) for variable in range(3))
+
+    assert bdd.variable(0) == x
+    assert bdd.node(1, x, x) == x
+    assert bdd.apply("and", x, x) == x
+    assert bdd.apply("or", x, 0) == x
+    assert bdd.apply("and", x, 1) == x
+
+    xy = bdd.apply("and", x, y)
+    n_nodes = len(bdd)
+    assert bdd.apply("and", y, x) == xy
+    assert len(bdd) == n_nodes
+    assert bdd.apply("or", bdd.apply("and", x, z), bdd.apply("and", y, z)) == bdd.apply(
+        "and", bdd.apply("or", x, y), z
+    )
+    assert bdd.at_least(2, [x, y, z]) == bdd.apply(
+        "or", xy, bdd.apply("and", bdd.apply("or", x, y), z)
+    )
+
+    p = [np.array([0.5, 0.9]), np.array([0.5, 0.8]), np.array([1.0, 0.0])]
+    assert np.allclose(bdd.probability(xy, p), [0.25, 0.72])
+    assert np.allclose(bdd.probability(1, p), 1.0)
+
+
+def test_bridge() -> None:
+    """Test exact reliability of bridge structure."""
+
+    (a, b, c, d, e), bridge = _bridge()
+    t = np.linspace(0.0, 5.0, 6)
+    r_a, r_b, r_c, r_d, r_e = (block.reliability(t) for block in [a, b, c, d, e])
+
+    # Pivotal decomposition on the bridge component E
+    expected = r_e * (1 - (1 - r_a) * (1 - r_b)) * (1 - (1 - r_c) * (1 - r_d)) + (1 - r_e) * (
+        1 - (1 - r_a * r_c) * (1 - r_b * r_d)
+    )
+
+    assert has_shared_components([bridge])
+    assert np.allclose(exact_reliability([bridge], t), expected)
+    assert exact_reliability([bridge], 1.0).shape == ()
+    assert len(build([bridge])[2]) == 5
+
+    diagram = Diagram("bridge", [Block("Start", "white"), bridge])
+    assert np.allclose(diagram.evaluate(t), expected)
+    # The tree model counts shared components once in each place
+    assert not np.allclose(bridge.reliability(t)[1:], expected[1:])
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_exact_reliability(seed: int) -> None:
+    """Test exact reliability against enumeration of all component states."""
+
+    rng = random.Random(seed)
+    pool = [Block(f"{i}", "white", failure_rate=rng.uniform(0.1, 1.0)) for i in range(6)]
+    blocks = [_random_block(rng, 3, lambda: rng.choice(pool).shared_copy()) for _ in range(2)]
+    t = np.array([0.5, 1.0, 2.0])
+
+    assert np.allclose(exact_reliability(blocks, t), _enumerate(blocks, t))
+
+
+def test_exact_reliability_independent() -> None:
+    """Test that exact reliability equals tree evaluation without shared components."""
+
+    rng = random.Random(0)
+    blocks = [_random_block(rng, 5) for _ in range(3)]
+    t = np.array([0.5, 1.0])
+
+    assert not has_shared_components(blocks)
+    assert np.allclose(
+        exact_reliability(blocks, t), np.prod([block.reliability(t) for block in blocks], axis=0)
+    )
+
+
+def test_shared_power_supply() -> None:
+    """Test diagram with a power supply shared by many redundant branches."""
+
+    supply = Block("Power supply", "white", failure_rate=0.01)
+    branches = [
+        Group(
+            [
+                Series([supply.shared_copy(), Block("A", "white", failure_rate=0.1)]),
+                supply.shared_copy(),
+            ]
+        )
+        for _ in range(300)
+    ]
+    diagram = Diagram("shared", [Block("Start", "white"), *branches])
+
+    # All branches fail with the power supply
+    assert np.allclose(diagram.evaluate([0.0, 10.0]), [1.0, np.exp(-0.1)])
+    assert len(diagram.cut_sets()) == 1
+
+
+def test_deep_nesting() -> None:
+    """Test building binary decision diagrams of deeply nested blocks without recursion."""
+
+    block: Block = Block("Block", "white", fixed_reliability=0.9)
+    shared = block
+    for i in range(3000):
+        other = Block("Block", "white", fixed_reliability=0.9)
+        block = Series([block, other]) if i % 2 else Group([block, other])
+
+    reliability = exact_reliability([block, shared.shared_copy()], 0.0)
+
+    assert 0.0 < reliability < 0.9
@@ -1,10 +1,17 @@
 """Tests for classes in block.py"""
 
+import itertools
+import pickle
+import sys
+from collections.abc import Callable
 from copy import deepcopy
+from typing import Any
 
+import numpy as np
 import pytest
 
-from pyrbd import Block, Group, Series
+from pyrbd import Block, Group, KofN, Series, Weibull, config
+from pyrbd.block import Padding
 
 
 def test_block() -> None:
@@ -92,6 +99,31 @@ def test_group() -> None:
     assert "Group label" in tikz_node
 
 
+def test_kofn() -> None:
+    """Test `KofN` __init__, label and rendering."""
+
+    blocks = [Block(f"Block {i}", "white") for i in range(3)]
+    voting = KofN(blocks, 2)
+
+    assert isinstance(voting, Group)
+    assert voting.k == 2
+    assert voting.label == "2/3"
+    assert blocks[2].id == f"{voting.id}-2"
+    assert "{2/3}; % label text" in voting.get_node()
+
+    labelled = KofN([block.copy() for block in blocks], 3, "Pumps", "red")
+    assert labelled.label == "Pumps (3/3)"
+    assert "{Pumps (3/3)}; % label text" in labelled.get_node()
+
+    # The label changes with `k`
+    labelled.k = 1
+    assert "{Pumps (1/3)}; % label text" in labelled.get_node()
+
+    for k in [0, 4]:
+        with pytest.raises(ValueError):
+            KofN([block.copy() for block in blocks], k)
+
+
 def test_add() -> None:
     """Tests for __add__ for `Block` class."""
 
@@ -137,6 +169,183 @@ def test_mul_rmul() -> None:
     assert isinstance(lblock, Block)
 
 
+def test_copy() -> None:
+    """Test lightweight `copy` of `Block`, `Series` and `Group` instances."""
+
+    parent = Block("parent", "white")
+    block = Block("block", "white", parent=parent, failure_rate=0.1)
+    nested = Series([block, 2 * Block("inner", "white")], parent=parent)
+
+    copied = nested.copy()
+    assert copied.blocks[0].failure_rate == 0.1
+    assert copied is not nested and copied.id == nested.id
+    assert copied.parent is parent
+    assert copied.last is copied.blocks[-1]
+    assert all(a is not b for a, b in zip(copied.get_blocks(), nested.get_blocks(), strict=True))
+    assert [leaf.id for leaf in copied.get_blocks()] == [leaf.id for leaf in nested.get_blocks()]
+    assert copied.blocks[1].parent is copied.blocks[0]
+    assert isinstance(inner := copied.blocks[1], Group)
+    assert all(leaf.parent is inner for leaf in inner.blocks)
+    assert copied.get_node() == nested.get_node()
+    assert copied.get_node() == deepcopy(nested).get_node()
+
+
+def test_shared_copy() -> None:
+    """Test components of `copy` and `shared_copy` of blocks."""
+
+    supply = Block("supply", "white", failure_rate=0.1)
+    assert supply.component is supply
+
+    shared = supply.shared_copy()
+    assert shared is not supply and shared.component is supply
+    assert shared.copy().component is supply
+    assert supply.copy().component is not supply
+
+    series = Series([supply, Block("other", "white"), shared])
+    copied = series.copy()
+    assert copied.blocks[0].component is copied.blocks[0]
+    assert copied.blocks[2].component is copied.blocks[0]
+    assert copied.blocks[1].component is copied.blocks[1]
+
+    # Components outside the copied tree remain shared
+    outside = Group([shared.shared_copy(), Block("other", "white")]).copy()
+    assert outside.blocks[0].component is supply
+
+    shared_series = series.shared_copy()
+    assert [leaf.component for leaf in shared_series.get_blocks()] == [
+        leaf.component for leaf in series.get_blocks()
+    ]
+    assert deepcopy(supply).component is not supply
+
+
+def test_slots() -> None:
+    """Test slotted `Block`, `Series` and `Group` instances with per-instance overrides."""
+
+    block = Block("block", "white", failure_rate=0.1)
+    series = Series([block, Block("other", "white")])
+    group = 2 * series
+
+    for instance in [block, series, group]:
+        assert not vars(instance)
+        assert pickle.loads(pickle.dumps(instance)).get_node() == instance.get_node()
+
+    assert block.arrow_length == 0.5
+    assert series.blocks[1].arrow_length == series.internal_arrow_length
+
+    block.node_options = "fill={fill_color}"
+    block.arrow_options = "thin"
+    series.pad = Padding(2, 2, 2, 2)
+    series.label_height = 3.0
+    group.internal_arrow_length = 0.5
+    block.note = "custom attribute"  # type: ignore[attr-defined]
+
+    assert "fill=white" in block.get_node()
+    assert Block("block", "white").node_options == Block.node_options
+    assert series.pad == Padding(2, 2, 2, 2) and Series.pad != series.pad
+    assert pickle.loads(pickle.dumps(block)).note == "custom attribute"
+
+
+def test_class_arrow_length(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test class level `arrow_length` defaults and per-instance overrides."""
+
+    class LongArrowBlock(Block):
+        """Block with longer arrows."""
+
+        __slots__ = ()
+        arrow_length = 1.5
+
+    assert LongArrowBlock("block", "white").arrow_length == 1.5
+
+    block = Block("block", "white")
+    monkeypatch.setattr(Block, "arrow_length", 1.0)
+    assert block.arrow_length == 1.0
+    assert Block("other", "white").arrow_length == 1.0
+    block.arrow_length = 2.0
+    assert block.arrow_length == 2.0
+    assert Block.arrow_length == 1.0
+    assert Series([Block("other", "white"), block]).blocks[1].arrow_length == 0.3
+
+
+def test_sorted_blocks() -> None:
+    """Test cached `sorted_blocks` of `Group` instances."""
+
+    block = Block("block", "white")
+    group = Group([block * 2, block * 3, block.copy()])
+
+    assert group.sorted_blocks == [group.blocks[1], group.blocks[0], group.blocks[2]]
+    group.sorted_blocks.pop()
+    assert len(group.sorted_blocks) == 3
+
+    group.blocks = group.blocks[2:]
+    assert group.sorted_blocks == group.blocks
+
+    large_group = 500 * (block * 4)
+    assert len(large_group.get_node()) > 0
+    assert len(large_group.sorted_blocks) == 500
+
+
+def test_sorted_blocks_nested() -> None:
+    """Test that nested groups count as their number of blocks in the longest series."""
+
+    block = Block("block", "white")
+    nested = Series([block.copy(), Group([block * 4, block.copy()])])
+    longest = block * 4
+    group = Group([nested, longest])
+
+    assert group.sorted_blocks == [longest, nested]
+    assert f"({longest.id}.east) to ({nested.id}.east);" in group.get_node()
+
+
+def test_incremental_render(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that only blocks with changed render keys are rendered again."""
+
+    monkeypatch.setattr(config, "INCREMENTAL_RENDER", True)
+    leaf = Block("leaf", "white")
+    nested = Series([Block("start", "white"), 2 * (leaf * 3), leaf.copy()], "Label", "red")
+    node = nested.get_node()
+
+    rendered: list[Block] = []
+
+    def spy(render: Callable[..., Any]) -> Callable[..., Any]:
+        def fragments(self: Block, position: float | None) -> Any:
+            rendered.append(self)
+            return render(self, position)
+
+        return fragments
+
+    for cls in (Block, Series, Group):
+        monkeypatch.setattr(cls, "_fragments", spy(cls._fragments))  # pylint: disable=protected-access
+
+    assert nested.get_node() == node
+    assert not rendered
+
+    group = nested.blocks[1]
+    assert isinstance(group, Group)
+    assert isinstance(series := group.blocks[0], Series)
+    changed = series.blocks[0]
+    changed.text = "changed"
+    nested.text = "New label"
+    assert nested.get_node() == node.replace("{leaf};", "{changed};", 1).replace(
+        "Label", "New label"
+    )
+    assert rendered == [nested, changed]
+
+    rendered.clear()
+    group.shift = (0.5, 0.0)
+    nested.get_node()
+    assert rendered == [group]
+
+    # Without incremental rendering, all blocks are rendered and nothing is kept
+    rendered.clear()
+    monkeypatch.setattr(config, "INCREMENTAL_RENDER", False)
+    nested.get_node()
+    assert len(rendered) == 12
+    assert all(
+        block._rendered is None  # pylint: disable=protected-access
+        for block in [nested, group, series, changed]
+    )
+
+
 def test_get_blocks() -> None:
     """Test get_blocks generator function."""
 
@@ -148,3 +357,90 @@ def test_get_blocks() -> None:
 
     group = 5 * block
     assert list(group.get_blocks()) == group.blocks
+
+    nested = 2 * (block * 3)
+    assert len(list(nested.get_blocks())) == 6
+    assert not any(isinstance(leaf, (Series, Group)) for leaf in nested.get_blocks())
+
+
+def test_deep_nesting() -> None:
+    """Test traversal and rendering of blocks nested deeper than the recursion limit."""
+
+    leaf = Block("leaf", "white")
+    nested: Block = leaf
+    for i in range(sys.getrecursionlimit() + 100):
+        nested = Series([nested]) if i % 2 else Group([nested])
+
+    assert list(nested.get_blocks()) == [leaf]
+    node = nested.get_node()
+    assert node.count(r"\begin{tikzpicture}") == sys.getrecursionlimit() + 100
+    assert "{leaf};" in node
+
+    leaf.failure_rate = 0.1
+    assert np.allclose(nested.reliability([0.0, 1.0]), np.exp([0.0, -0.1]))
+    assert np.allclose((nested * 2).reliability(1.0), np.exp(-0.2))
+    copied = nested.copy()
+    assert [block.text for block in copied.get_blocks()] == ["leaf"]
+    assert next(copied.get_blocks()) is not leaf
+
+
+def test_reliability() -> None:
+    """Test `reliability` of `Block`, `Series` and `Group` instances."""
+
+    t = np.linspace(0.0, 100.0, 11)
+
+    assert np.all(Block("perfect", "white").reliability(t) == 1.0)
+    assert np.allclose(Block("fixed", "white", fixed_reliability=0.9).reliability(t), 0.9)
+    assert np.allclose(Block("rate", "white", failure_rate=0.01).reliability(t), np.exp(-0.01 * t))
+    assert np.allclose(
+        Block("weibull", "white", distribution=Weibull(1.0, 100.0)).reliability(t),
+        np.exp(-0.01 * t),
+    )
+    assert Block("scalar", "white", failure_rate=0.01).reliability(5.0).shape == ()
+
+    block_1 = Block("Block 1", "white", failure_rate=0.01)
+    block_2 = Block("Block 2", "white", fixed_reliability=0.5)
+    r_1 = np.exp(-0.01 * t)
+
+    assert np.allclose(Series([block_1, block_2]).reliability(t), 0.5 * r_1)
+    assert np.allclose(Group([block_1, block_2]).reliability(t), 1 - 0.5 * (1 - r_1))
+    assert np.allclose((3 * block_1).reliability(t), 1 - (1 - r_1) ** 3)
+    assert np.allclose((block_1 * 3).reliability(t), r_1**3)
+
+    with pytest.raises(ValueError):
+        Block("block", "white", fixed_reliability=0.9, failure_rate=0.1)
+    for kwargs in [{"fixed_reliability": 1.5}, {"failure_rate": -1.0}]:
+        with pytest.raises(ValueError):
+            Block("block", "white", **kwargs)  # type: ignore
+    with pytest.raises(ValueError):
+        Weibull(0.0, 1.0)
+
+
+def test_kofn_reliability() -> None:
+    """Test `KofN` reliability against enumeration of all block states."""
+
+    rng = np.random.default_rng(1)
+    t = np.linspace(0.0, 10.0, 4)
+    blocks: list[Block] = [
+        Block(f"Block {i}", "white", failure_rate=rate) for i, rate in enumerate(rng.random(5))
+    ]
+    blocks[4] = Series([blocks[4], Block("Block 5", "white", fixed_reliability=0.8)])
+    reliabilities = [block.reliability(t) for block in blocks]
+
+    for k in range(1, 6):
+        expected = np.zeros(t.shape)
+        for states in itertools.product([False, True], repeat=5):
+            if sum(states) >= k:
+                probability = np.ones(t.shape)
+                for state, reliability in zip(states, reliabilities, strict=True):
+                    probability *= reliability if state else 1.0 - reliability
+                expected += probability
+
+        assert np.allclose(KofN(blocks, k).reliability(t), expected)
+
+    assert np.allclose(KofN(blocks, 1).reliability(t), Group(blocks).reliability(t))
+    assert np.allclose(KofN(blocks, 5).reliability(t), Series(blocks).reliability(t))
+
+    # 20-way voting of non-identical blocks
+    many = [Block("Block", "white", fixed_reliability=p) for p in rng.uniform(0.5, 1.0, 20)]
+    assert 0.0 < KofN(many, 15).reliability(0.0) < 1.0
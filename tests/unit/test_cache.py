@@ -0,0 +1,74 @@
+"""Tests for `RenderCache` class in cache.py"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from pyrbd.cache import RenderCache
+
+
+def test_key() -> None:
+    """Test `RenderCache` `key` method."""
+
+    assert RenderCache.key("a", "b") == RenderCache.key("a", "b")
+    assert RenderCache.key("a", "b") != RenderCache.key("ab")
+    assert RenderCache.key("a", "b") != RenderCache.key("b", "a")
+
+
+def test_get_put(tmp_path) -> None:
+    """Test `RenderCache` `get` and `put` methods."""
+
+    os.chdir(tmp_path)
+    cache = RenderCache(str(tmp_path / "cache"))
+
+    assert cache.get("missing", "diagram") is None
+
+    (tmp_path / "diagram.pdf").write_bytes(b"pdf")
+    (tmp_path / "diagram.svg").write_text("svg")
+    (tmp_path / "diagram_72dpi.png").write_bytes(b"png")
+    cache.put("key", ["diagram.svg", "diagram_72dpi.png", "diagram.pdf"], "diagram")
+
+    os.remove("diagram.pdf")
+    os.remove("diagram.svg")
+
+    assert cache.get("key", "copy") == ["copy.svg", "copy_72dpi.png", "copy.pdf"]
+    assert (tmp_path / "copy.pdf").read_bytes() == b"pdf"
+    assert (tmp_path / "copy.svg").read_text() == "svg"
+
+    assert cache.path("missing", ".pdf") is None
+    assert cache.path("key", ".png") is None
+    cached_pdf = cache.path("key", ".pdf")
+    assert cached_pdf is not None
+    assert Path(cached_pdf).read_bytes() == b"pdf"
+
+
+def test_put_missing_file(tmp_path) -> None:
+    """Test that `RenderCache` `put` of missing files leaves no staging directory."""
+
+    cache = RenderCache(str(tmp_path / "cache"))
+
+    with pytest.raises(FileNotFoundError):
+        cache.put("key", [str(tmp_path / "diagram.pdf")], str(tmp_path / "diagram"))
+
+    assert not list((tmp_path / "cache").iterdir())
+
+
+def test_evict(tmp_path) -> None:
+    """Test least recently used eviction of `RenderCache` entries."""
+
+    os.chdir(tmp_path)
+    cache = RenderCache(str(tmp_path / "cache"), max_size=25)
+
+    (tmp_path / "diagram.pdf").write_bytes(b"x" * 10)
+    for i, key in enumerate(["first", "second"]):
+        cache.put(key, ["diagram.pdf"], "diagram")
+        os.utime(tmp_path / "cache" / key, (i, i))
+
+    # Using first entry makes second entry least recently used
+    assert cache.get("first", "diagram") is not None
+    cache.put("third", ["diagram.pdf"], "diagram")
+
+    assert cache.get("second", "diagram") is None
+    assert cache.get("first", "diagram") is not None
+    assert cache.get("third", "diagram") is not None
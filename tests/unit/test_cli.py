@@ -0,0 +1,132 @@
+"""Tests for the `pyrbd` command-line tool in cli.py"""
+
+import json
+import os
+import time
+
+import pytest
+
+from pyrbd import Diagram, cli, config
+
+from .test_batch import fake_compile
+from .test_manifest import FACTORY
+
+
+def _manifest(names: list[str], text: str = "Start") -> str:
+    """JSON manifest with two-block diagrams."""
+
+    return json.dumps(
+        {
+            "diagrams": [
+                {
+                    "name": name,
+                    "blocks": [
+                        {"text": text, "color": "white"},
+                        {"text": "End", "color": "white"},
+                    ],
+                }
+                for name in names
+            ]
+        }
+    )
+
+
+def test_main(tmp_path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture) -> None:
+    """Test building manifest diagrams with faked compilation."""
+
+    monkeypatch.setattr(Diagram, "compile", fake_compile)
+    monkeypatch.setattr(config, "CACHE_DIR", None)
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(_manifest(["diagram", "broken"]), encoding="utf-8")
+    assert cli.main([str(manifest), "--no-cache"]) == 1
+    assert not config.CACHE_DIR
+    assert "LaTeX error" in capsys.readouterr().err
+
+    manifest.write_text(_manifest(["diagram_1", "diagram_2"]), encoding="utf-8")
+    assert cli.main([str(manifest), "-o", "svg", "png", "-j", "2"]) == 0
+    assert str(tmp_path / ".pyrbd-cache") == config.CACHE_DIR
+    assert (tmp_path / "diagram_2.png").is_file()
+    output = capsys.readouterr().out.splitlines()
+    assert output[0] == f"{tmp_path / 'diagram_1'}: {tmp_path / 'diagram_1.svg'}, " + str(
+        tmp_path / "diagram_1.png"
+    )
+
+    manifest.write_text("{}", encoding="utf-8")
+    assert cli.main([str(manifest)]) == 1
+
+
+def test_watch(tmp_path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture) -> None:
+    """Test watch mode rebuilding only changed diagrams."""
+
+    monkeypatch.setattr(Diagram, "compile", fake_compile)
+    monkeypatch.setattr(config, "CACHE_DIR", None)
+    (manifest := tmp_path / "manifest.json").write_text(
+        _manifest(["diagram_1", "diagram_2"]), encoding="utf-8"
+    )
+
+    edits = [
+        _manifest(["diagram_1", "diagram_2"]),
+        "{",
+        json.dumps(
+            {
+                "diagrams": [
+                    json.loads(_manifest(["diagram_1"]))["diagrams"][0],
+                    json.loads(_manifest(["diagram_2"], text="Changed"))["diagrams"][0],
+                ]
+            }
+        ),
+    ]
+
+    def sleep(_: float) -> None:
+        """Edit manifest between polls and stop after last edit."""
+
+        if not edits:
+            raise KeyboardInterrupt
+        manifest.write_text(edits.pop(0), encoding="utf-8")
+        modified = time.time_ns() + (3 - len(edits)) * 10**9
+        os.utime(manifest, ns=(modified, modified))
+
+    monkeypatch.setattr(cli.time, "sleep", sleep)
+    assert cli.main([str(manifest), "--watch", "--cache-dir", str(tmp_path / "cache")]) == 0
+
+    built = [line.split(":")[0] for line in capsys.readouterr().out.splitlines()[1:]]
+    assert built == [str(tmp_path / name) for name in ["diagram_1", "diagram_2", "diagram_2"]]
+
+
+def test_watch_factory_errors(
+    tmp_path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+) -> None:
+    """Test that errors in watched factory modules are reported and watching continues."""
+
+    monkeypatch.setattr(Diagram, "compile", fake_compile)
+    monkeypatch.setattr(config, "CACHE_DIR", None)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    (factory := tmp_path / "watched_diagrams.py").write_text(FACTORY, encoding="utf-8")
+    (manifest := tmp_path / "manifest.json").write_text(
+        json.dumps({"diagrams": [{"name": "factory", "factory": "watched_diagrams:build"}]}),
+        encoding="utf-8",
+    )
+
+    edits = [
+        FACTORY.replace("def build():", "def build(:"),
+        FACTORY.replace("    return", "    raise RuntimeError('broken factory')\n    return"),
+        FACTORY + "\n# fixed\n",
+    ]
+
+    def sleep(_: float) -> None:
+        """Edit factory module between polls and stop after last edit."""
+
+        if not edits:
+            raise KeyboardInterrupt
+        factory.write_text(edits.pop(0), encoding="utf-8")
+        modified = time.time_ns() + (4 - len(edits)) * 10**9
+        os.utime(factory, ns=(modified, modified))
+
+    monkeypatch.setattr(cli.time, "sleep", sleep)
+    assert cli.main([str(manifest), "--watch", "--no-cache"]) == 0
+
+    output = capsys.readouterr()
+    built = [line.split(":")[0] for line in output.out.splitlines()[1:]]
+    assert built == [str(tmp_path / "factory")] * 2
+    assert "SyntaxError" in output.err
+    assert "RuntimeError: broken factory" in output.err
@@ -0,0 +1,129 @@
+"""Tests for minimal cut sets and path sets in cutsets.py"""
+
+import itertools
+import random
+import sys
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+
+from pyrbd import Block, Diagram, Group, KofN, Series
+from pyrbd.cutsets import minimal_sets, minimize
+
+
+def _random_block(
+    rng: random.Random, depth: int, leaf: Callable[[], Block] | None = None
+) -> Block:
+    """Random nested block structure with failing leaf blocks, or leaf blocks by `leaf`."""
+
+    if depth == 0 or rng.random() < 0.3:
+        if leaf is not None:
+            return leaf()
+        return Block("leaf", "white", failure_rate=rng.uniform(0.01, 1.0))
+
+    blocks = [_random_block(rng, depth - 1, leaf) for _ in range(rng.randint(1, 3))]
+    kind = rng.random()
+    if kind < 0.4:
+        return Series(blocks)
+    if kind < 0.8:
+        return Group(blocks)
+    return KofN(blocks, rng.randint(1, len(blocks)))
+
+
+def _brute_force(blocks: list[Block], kind: str) -> list[set[int]]:
+    """Minimal cut or path sets of leaf indices by enumerating all leaf states."""
+
+    leaves = list(itertools.chain.from_iterable(block.get_blocks() for block in blocks))
+    states = np.array(list(itertools.product([0.0, 1.0], repeat=len(leaves)))).T
+    values = {id(leaf): states[i] for i, leaf in enumerate(leaves)}
+    system = np.ones(states.shape[1])
+    for block in blocks:
+        system *= block.structure(lambda leaf: values[id(leaf)])
+
+    target, state = (0.0, 0.0) if kind == "cut" else (1.0, 1.0)
+    sets = [
+        {i for i in range(len(leaves)) if states[i, j] == state}
+        for j in range(states.shape[1])
+        if system[j] == target
+    ]
+    return [s for s in sets if not any(other < s for other in sets)]
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("kind", ["cut", "path"])
+def test_minimal_sets(seed: int, kind: str) -> None:
+    """Test minimal sets against enumeration of all leaf states."""
+
+    rng = random.Random(seed)
+    blocks = [_random_block(rng, 3) for _ in range(2)]
+    leaves = list(itertools.chain.from_iterable(block.get_blocks() for block in blocks))
+    if len(leaves) > 12:
+        pytest.skip("too many leaves for enumeration")
+
+    sets = minimal_sets(blocks, kind)  # type: ignore[arg-type]
+    indices = [{leaves.index(leaf) for leaf in blocks_set} for blocks_set in sets]
+    expected = _brute_force(blocks, kind)
+
+    assert sorted(map(sorted, indices)) == sorted(map(sorted, expected))
+    assert [len(s) for s in sets] == sorted(len(s) for s in sets)
+
+    max_order = 2
+    limited = minimal_sets(blocks, kind, max_order)  # type: ignore[arg-type]
+    assert limited == [s for s in sets if len(s) <= max_order]
+
+
+def test_diagram_cut_path_sets() -> None:
+    """Test `Diagram` cut and path sets with never failing and shared blocks."""
+
+    a, b, c, d = (Block(name, "white", failure_rate=0.1) for name in "abcd")
+    diagram = Diagram("diagram", [Block("Start", "white"), Group([a + b, c]), 2 * d], "Fire")
+
+    assert [[block.text for block in s] for s in diagram.cut_sets()] == [
+        ["a", "c"],
+        ["b", "c"],
+        ["d", "d"],
+    ]
+    assert diagram.cut_sets(max_order=1) == []
+    assert [[block.text for block in s] for s in diagram.path_sets()] == [
+        ["c", "d"],
+        ["c", "d"],
+        ["a", "b", "d"],
+        ["a", "b", "d"],
+    ]
+
+    shared = Block("shared", "white", fixed_reliability=0.9)
+    blocks: list[Block] = [Group([shared + a, shared + b])]
+    assert minimal_sets(blocks, "cut") == [[shared], [a, b]]
+    assert minimal_sets(blocks, "path") == [[shared, a], [shared, b]]
+
+    assert Diagram("perfect", [Block("A", "white"), Block("B", "white")]).cut_sets() == []
+    assert Diagram("perfect", [Block("A", "white"), Block("B", "white")]).path_sets() == [[]]
+
+    with pytest.raises(ValueError):
+        diagram.cut_sets(max_order=-1)
+    with pytest.raises(ValueError):
+        minimal_sets(blocks, "tie")  # type: ignore[arg-type]
+
+
+def test_minimize() -> None:
+    """Test bulk minimization of bitsets against pairwise comparison."""
+
+    rng = random.Random(0)
+    bitsets = [sum(1 << rng.randrange(200) for _ in range(rng.randint(1, 4))) for _ in range(500)]
+    expected = {a for a in bitsets if not any(b != a and b & a == b for b in bitsets)}
+
+    assert sorted(minimize(bitsets, 200)) == sorted(expected)
+    assert minimize([0b110, 0, 0b1], 3) == [0]
+    assert not minimize([], 0)
+
+
+def test_deep_nesting() -> None:
+    """Test cut sets of blocks nested deeper than the recursion limit."""
+
+    leaf = Block("leaf", "white", failure_rate=0.1)
+    nested: Block = leaf
+    for i in range(sys.getrecursionlimit() + 100):
+        nested = Series([nested]) if i % 2 else Group([nested])
+
+    assert minimal_sets([nested], "cut") == [[leaf]]
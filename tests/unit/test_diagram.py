@@ -1,12 +1,21 @@
 """Tests for `Diagram` class."""
 
+import io
+import shutil
+import sys
 from collections.abc import Generator
 from os import chdir
+from pathlib import Path
 
+import numpy as np
+import pymupdf
 import pytest
 from pytest import FixtureRequest
 
 from pyrbd import Block, Diagram, Group, Series, config
+from pyrbd import diagram as diagram_module
+
+from .conftest import FakeLatexmk
 
 
 @pytest.fixture(name="arrow_style", scope="module", params=["", "-latex"])
@@ -89,3 +98,241 @@ def test_diagram_write(tmp_path, diagram: Diagram) -> None:
         assert hex_code in tmp_file.read_text()
     assert config.ARROW_STYLE in tmp_file.read_text()
     assert diagram.head.text in tmp_file.read_text()
+
+
+def test_diagram_write_stream(tmp_path, diagram: Diagram) -> None:
+    """Test `Diagram` `write` to text stream in fragments."""
+
+    chdir(tmp_path)
+
+    class RecordingStream(io.StringIO):
+        """Text stream recording sizes of written fragments."""
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.sizes: list[int] = []
+
+        def write(self, s: str, /) -> int:
+            self.sizes.append(len(s))
+            return super().write(s)
+
+    diagram.write()
+    stream = RecordingStream()
+    diagram.write(stream)
+
+    content = (tmp_path / f"{diagram.filename}.tex").read_text(encoding="utf-8")
+    assert stream.getvalue() == content
+    assert max(stream.sizes) < len(diagram.blocks[2].get_node())
+
+
+def test_diagram_evaluate() -> None:
+    """Test `Diagram` `evaluate` method."""
+
+    block_1 = Block("block1", "white", failure_rate=1e-3)
+    group = 2 * Block("block2", "white", fixed_reliability=0.9)
+    diagram = Diagram("test_diagram", [block_1, group], "Hazard")
+
+    t = np.array([[0.0, 10.0], [100.0, 1000.0]])
+    reliability = diagram.evaluate(t)
+
+    assert reliability.shape == t.shape
+    assert np.allclose(reliability, np.exp(-1e-3 * t) * 0.99)
+
+
+def test_diagram_deep_nesting() -> None:
+    """Test evaluation and rendering of blocks nested deeper than the recursion limit."""
+
+    leaf = Block("leaf", "white", failure_rate=0.1)
+    nested: Block = leaf
+    for i in range(sys.getrecursionlimit() + 100):
+        nested = Series([nested]) if i % 2 else Group([nested])
+    diagram = Diagram("deep", [nested], "Hazard")
+
+    assert np.allclose(diagram.evaluate([0.0, 1.0]), np.exp([0.0, -0.1]))
+    assert diagram.simulate(100, 0.0, seed=1).reliability == 1.0
+    assert diagram.render_svg().count(">leaf</text>") == 1
+    assert isinstance(nested, Series) and isinstance(group := nested.blocks[0], Group)
+    content = diagram._subtree_content(group)  # pylint: disable=protected-access
+    assert content.count(r"\begin{tikzpicture}") > sys.getrecursionlimit()
+
+
+def test_diagram_compile_combined(tmp_path, fake_latexmk: FakeLatexmk) -> None:
+    """Test `Diagram` `compile_combined` with faked LaTeX compilation."""
+
+    chdir(tmp_path)
+
+    diagrams = [
+        Diagram(f"diagram_{i}", [Block("block1", "white"), Block("block2", "white")])
+        for i in range(3)
+    ]
+    output_files = Diagram.compile_combined(diagrams, ["pdf", "png"])
+
+    (call,) = fake_latexmk.calls
+    assert call.clear_source and not call.precompiled_preamble
+    assert call.source.startswith(r"\documentclass[multi=pyrbdpage]{standalone}")
+    assert output_files == [[f"diagram_{i}.png", f"diagram_{i}.pdf"] for i in range(3)]
+    for i in range(3):
+        with pymupdf.open(tmp_path / f"diagram_{i}.pdf") as pdf_document:
+            assert len(pdf_document) == 1
+            assert pdf_document[0].rect.width == fake_latexmk.width + i
+
+
+def test_diagram_render(
+    tmp_path, monkeypatch: pytest.MonkeyPatch, fake_latexmk: FakeLatexmk
+) -> None:
+    """Test `Diagram` `render` with faked LaTeX compilation."""
+
+    chdir(tmp_path)
+    svg_content = Diagram._svg_content  # pylint: disable=protected-access
+
+    def locked_svg_content(page: pymupdf.Page) -> str:
+        """Check that pymupdf conversion is serialized."""
+
+        assert diagram_module._PYMUPDF_LOCK.locked()  # pylint: disable=protected-access
+        return svg_content(page)
+
+    monkeypatch.setattr(Diagram, "_svg_content", staticmethod(locked_svg_content))
+
+    diagram = Diagram("diagram", [Block("block1", "white"), Block("block2", "white")])
+
+    assert diagram.render().startswith(b"%PDF")
+    assert diagram.render("png").startswith(b"\x89PNG")
+    assert b"<svg" in diagram.render("svg")
+    assert not list(tmp_path.iterdir())
+    assert len(fake_latexmk.calls) == 3
+    for call in fake_latexmk.calls:
+        assert tmp_path not in Path(call.filename).parents
+        assert not call.clear_source and not call.precompiled_preamble and not call.clean_up
+    assert fake_latexmk.calls[-1].stats is diagram.stats
+
+    with pytest.raises(ValueError):
+        diagram.render("jpg")
+
+
+def test_diagram_subtree_cache(
+    tmp_path, monkeypatch: pytest.MonkeyPatch, fake_latexmk: FakeLatexmk
+) -> None:
+    """Test writing diagrams with cached group images and faked LaTeX compilation."""
+
+    chdir(tmp_path)
+
+    def pump_train() -> Group:
+        """Group shared by many diagrams."""
+
+        return 2 * (Block("Pump", "white") + Block("Valve", "white"))
+
+    monkeypatch.setattr(config, "SUBTREE_CACHE", True)
+
+    diagram = Diagram("diagram", [Block("Start", "white"), pump_train()])
+    with pytest.raises(ValueError):
+        diagram.write()
+
+    monkeypatch.setattr(config, "CACHE_DIR", str(tmp_path / "cache"))
+    diagrams = [
+        Diagram("diagram_1", [Block("Start", "white"), pump_train(), Block("End", "white")]),
+        Diagram("diagram_2", [Block("Begin", "white"), Block("Other", "white") + pump_train()]),
+    ]
+    for diagram in diagrams:
+        diagram.write()
+
+    (call,) = fake_latexmk.calls
+    assert call.source.startswith(r"\documentclass[border=0pt]{standalone}")
+    assert not call.clear_source and not call.precompiled_preamble and not call.clean_up
+    assert "Pump" in call.source and "Start" not in call.source
+    for diagram in diagrams:
+        content = (tmp_path / f"{diagram.filename}.tex").read_text(encoding="utf-8")
+        image = content.split(r"\includegraphics{")[1].split("}")[0]
+        assert Path(image).is_file()
+        assert "Pump" not in content
+        assert [timing.stage for timing in diagram.stats.stages][-1] == "write"
+
+    assert [timing.details["hit"] for timing in diagrams[1].stats.stages[:-1]] == [True]
+    # Subtree compilation stages are nested in the subtree stage, not counted twice
+    assert [timing.stage for timing in diagrams[0].stats.stages] == ["subtree", "write"]
+    assert [stage["stage"] for stage in diagrams[0].stats.stages[0].details["stages"]] == [
+        "latexmk"
+    ]
+
+    # Images are copied next to the .tex file, safe from eviction until compilation
+    shutil.rmtree(tmp_path / "cache")
+    assert sorted(path.name for path in tmp_path.glob("*-subtree-*.pdf")) == [
+        f"{diagram.filename}-subtree-{diagrams[0].stats.stages[0].details['key'][:16]}.pdf"
+        for diagram in diagrams
+    ]
+
+    monkeypatch.setattr(config, "CACHE_DIR", None)
+    diagrams[0].compile()
+    assert not list(tmp_path.glob("diagram_1-subtree-*.pdf"))
+    assert list(tmp_path.glob("diagram_2-subtree-*.pdf"))
+    series = diagrams[1].blocks[0]
+    assert isinstance(series, Series)
+    groups = [diagrams[0].blocks[0], series.blocks[1]]
+    # Images are passed to rendering, not set on the groups
+    assert all(isinstance(group, Group) and "Pump" in group.get_node() for group in groups)
+    images = {id(group): "image.pdf" for group in groups}
+    assert all(r"\includegraphics{image.pdf}" in group.get_node(images=images) for group in groups)
+
+
+def test_diagram_subtree_cache_failure(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that groups failing to compile as standalone images are rendered in place."""
+
+    chdir(tmp_path)
+    monkeypatch.setattr(diagram_module, "_run_latexmk", lambda *args, **kwargs: None)
+    monkeypatch.setattr(config, "SUBTREE_CACHE", True)
+    monkeypatch.setattr(config, "CACHE_DIR", str(tmp_path / "cache"))
+
+    diagram = Diagram("diagram", [Block("Start", "white"), 2 * Block("Pump", "white")])
+    diagram.write()
+
+    assert "Pump" in (tmp_path / "diagram.tex").read_text(encoding="utf-8")
+    assert not list((tmp_path / "cache").iterdir())
+
+
+def test_diagram_compile_png_sizes(
+    tmp_path, monkeypatch: pytest.MonkeyPatch, fake_latexmk: FakeLatexmk
+) -> None:
+    """Test `Diagram` `compile` to many png sizes with faked LaTeX compilation."""
+
+    chdir(tmp_path)
+    pdf_open = pymupdf.open
+    opened: list[str] = []
+
+    def counting_open(*args, **kwargs) -> pymupdf.Document:
+        """Record opened pdf documents."""
+
+        opened.extend(str(arg) for arg in args)
+        return pdf_open(*args, **kwargs)
+
+    monkeypatch.setattr(pymupdf, "open", counting_open)
+    monkeypatch.setattr(config, "PNG_DPI", [36, 144])
+    monkeypatch.setattr(config, "PNG_ALPHA", True)
+
+    diagram = Diagram("diagram", [Block("block1", "white"), Block("block2", "white")])
+    diagram.write()
+    output_files = diagram.compile(["pdf", "svg", "png"])
+
+    assert output_files == [
+        "diagram.svg",
+        "diagram_36dpi.png",
+        "diagram_144dpi.png",
+        "diagram.pdf",
+    ]
+    (call,) = fake_latexmk.calls
+    assert call.clear_source and not call.precompiled_preamble
+    assert call.stats is diagram.stats
+    assert opened == ["diagram.pdf"]
+    assert [timing.stage for timing in diagram.stats.stages] == [
+        "write",
+        "latexmk",
+        "export_svg",
+        "export_png",
+    ]
+    assert diagram.stats.stages[0].details["nodes"] == 2
+    assert diagram.stats.stages[3].details["size"] == sum(
+        (tmp_path / f"diagram_{dpi}dpi.png").stat().st_size for dpi in [36, 144]
+    )
+
+    for dpi in [36, 144]:
+        image = pymupdf.Pixmap(f"diagram_{dpi}dpi.png")
+        assert (image.width, image.height) == (dpi, dpi // 2)
+        assert image.alpha
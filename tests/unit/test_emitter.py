@@ -0,0 +1,56 @@
+"""Golden tests for direct TikZ emission in emitter.py"""
+
+import itertools
+import random
+
+import pytest
+
+from pyrbd import Block, Diagram, Group, KofN, Series, config
+
+
+def _random_block(rng: random.Random, depth: int) -> Block:
+    """Random nested block with varied colors, labels and nesting."""
+
+    color = rng.choice(["white", "", "red", "blue!30"])
+    text = rng.choice(["", "Label", r"Two\\lines"])
+    if depth == 0 or rng.random() < 0.3:
+        return Block(text or "Leaf", color or "white", shift=(rng.random(), -rng.random()))
+
+    blocks = [_random_block(rng, depth - 1) for _ in range(rng.randint(1, 4))]
+    kind = rng.choice(["series", "group", "kofn", "mul", "rmul"])
+    if kind == "series":
+        return Series(blocks, text, color or "white")
+    if kind == "group":
+        return Group(blocks, text, color)
+    if kind == "kofn":
+        return KofN(blocks, rng.randint(1, len(blocks)), text, color)
+    if kind == "mul":
+        return blocks[0] * rng.randint(1, 3)
+
+    return rng.randint(1, 3) * blocks[0]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_emitter_golden(seed: int, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that fast rendering is byte-identical to template rendering."""
+
+    rng = random.Random(seed)
+    blocks = [Block("Start", "white"), *[_random_block(rng, 4) for _ in range(3)]]
+    diagram = Diagram(f"diagram_{seed}", blocks, hazard=rng.choice(["", "Fire"]))
+    for block, parent in itertools.pairwise([diagram.head, *diagram.blocks]):
+        block.parent = parent
+
+    monkeypatch.setattr(config, "FAST_RENDER", False)
+    template_nodes = [block.get_node() for block in [diagram.head, *diagram.blocks]]
+    monkeypatch.setattr(config, "FAST_RENDER", True)
+    fast_nodes = [block.get_node() for block in [diagram.head, *diagram.blocks]]
+
+    assert fast_nodes == template_nodes
+
+    # Groups included as precompiled images
+    images = {id(block): f"image_{i}.pdf" for i, block in enumerate(diagram.blocks)}
+    monkeypatch.setattr(config, "FAST_RENDER", False)
+    template_nodes = [block.get_node(images=images) for block in diagram.blocks]
+    monkeypatch.setattr(config, "FAST_RENDER", True)
+
+    assert [block.get_node(images=images) for block in diagram.blocks] == template_nodes
@@ -0,0 +1,135 @@
+"""Tests for component importance measures in importance.py"""
+
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+from pyrbd import Block, Diagram, Group, Series
+from pyrbd.cutsets import minimal_sets
+from pyrbd.importance import importance
+
+from .test_cutsets import _random_block
+
+
+def _system(blocks: list[Block], values: dict[int, np.ndarray]) -> np.ndarray:
+    """System value of blocks in series from leaf values by `id()` of leaf."""
+
+    result = np.ones(next(iter(values.values())).shape)
+    for block in blocks:
+        result = result * block.structure(lambda leaf: values[id(leaf)])
+
+    return result
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_importance(seed: int) -> None:
+    """Test importance measures against evaluation of all leaf states."""
+
+    rng = random.Random(seed)
+    blocks = [_random_block(rng, 3) for _ in range(2)]
+    leaves = list(itertools.chain.from_iterable(block.get_blocks() for block in blocks))
+    if len(leaves) > 10:
+        pytest.skip("too many leaves for enumeration")
+    t = np.array([0.5, 2.0])
+
+    measures = importance(blocks, t)
+
+    reliabilities = {id(leaf): leaf.reliability(t) for leaf in leaves}
+    unreliability = 1.0 - _system(blocks, reliabilities)
+    for leaf in leaves:
+        birnbaum = _system(blocks, reliabilities | {id(leaf): np.ones(2)}) - _system(
+            blocks, reliabilities | {id(leaf): np.zeros(2)}
+        )
+        cut_failed = _cut_failed(leaf, leaves, reliabilities, minimal_sets(blocks, "cut"))
+        measure = measures[leaf.id]
+        assert np.allclose(measure.birnbaum, birnbaum)
+        assert np.allclose(
+            measure.criticality, birnbaum * (1.0 - reliabilities[id(leaf)]) / unreliability
+        )
+        assert np.allclose(measure.fussell_vesely, cut_failed / unreliability)
+
+
+def _cut_failed(
+    leaf: Block,
+    leaves: list[Block],
+    reliabilities: dict[int, np.ndarray],
+    cut_sets: list[list[Block]],
+) -> np.ndarray:
+    """Probability that any minimal cut set containing `leaf` is failed, by enumeration."""
+
+    cuts = [{id(block) for block in cut_set} for cut_set in cut_sets if leaf in cut_set]
+    result = np.zeros(2)
+    for states in itertools.product([False, True], repeat=len(leaves)):
+        failed = {id(other) for other, state in zip(leaves, states, strict=True) if state}
+        if any(cut <= failed for cut in cuts):
+            probability = np.ones(2)
+            for other, state in zip(leaves, states, strict=True):
+                value = reliabilities[id(other)]
+                probability *= 1.0 - value if state else value
+            result += probability
+
+    return result
+
+
+def test_diagram_importance() -> None:
+    """Test `Diagram` `importance` method."""
+
+    a = Block("A", "white", failure_rate=0.1)
+    b = Block("B", "white", failure_rate=0.2)
+    c = Block("C", "white", fixed_reliability=0.9)
+    group = Group([a, b], parent=c)
+    diagram = Diagram("importance", [c, group], hazard="Hazard")
+
+    t = np.linspace(0.0, 10.0, 5)
+    measures = diagram.importance(t)
+    r_a, r_b = np.exp(-0.1 * t), np.exp(-0.2 * t)
+    r_group = 1.0 - (1.0 - r_a) * (1.0 - r_b)
+    unreliability = 1.0 - 0.9 * r_group
+
+    assert list(measures) == ["0", c.id, a.id, b.id]
+    assert measures[a.id].birnbaum.shape == t.shape
+    assert np.allclose(measures["0"].birnbaum, 0.9 * r_group)
+    assert np.allclose(measures["0"].criticality, 0.0)
+    assert np.allclose(measures[c.id].birnbaum, r_group)
+    assert np.allclose(measures[a.id].birnbaum, 0.9 * (1.0 - r_b))
+    assert np.allclose(measures[c.id].fussell_vesely[1:], 0.1 / unreliability[1:])
+    assert np.allclose(
+        measures[b.id].fussell_vesely[1:],
+        (1.0 - r_a[1:]) * (1.0 - r_b[1:]) / unreliability[1:],
+    )
+    # Measures conditional on system failure vanish where the system never fails
+    perfect = Diagram("perfect", [Block("A", "white"), Block("B", "white")])
+    assert all(
+        np.all(measure.criticality == 0.0) and np.all(measure.fussell_vesely == 0.0)
+        for measure in perfect.importance(1.0).values()
+    )
+
+
+def test_importance_shared_leaf() -> None:
+    """Test that measures of a leaf block in several places are summed."""
+
+    a = Block("A", "white", fixed_reliability=0.5)
+    b = Block("B", "white", fixed_reliability=0.5)
+    blocks: list[Block] = [Group([a, b]), Group([a, Block("C", "white", fixed_reliability=0.5)])]
+
+    measures = importance(blocks, 0.0)
+
+    assert np.isclose(measures[a.id].birnbaum, 2 * 0.5 * 0.75)
+    assert measures[a.id].birnbaum.shape == ()
+
+
+def test_importance_deep_nesting() -> None:
+    """Test importance measures of deeply nested blocks without recursion."""
+
+    block: Block = Block("Block", "white", failure_rate=0.1)
+    leaf = block
+    for i in range(5000):
+        other = Block("Block", "white", failure_rate=0.1)
+        block = Series([block, other]) if i % 2 else Group([block, other])
+
+    measures = importance([block], [1.0, 2.0])
+
+    assert len(measures) == 5001
+    assert np.all(measures[leaf.id].birnbaum >= 0.0)
@@ -0,0 +1,133 @@
+"""Tests for diagram manifests in manifest.py"""
+
+import json
+
+import pytest
+
+from pyrbd import Group, KofN, Series, config
+from pyrbd.manifest import block_from_spec, diagram_from_spec, load_manifest, read_manifest
+
+SPEC = {
+    "config": {"arrow_style": "-latex", "cache_dir": "cache"},
+    "diagrams": [
+        {
+            "name": "simple",
+            "hazard": "Fire",
+            "colors": {"myblue": "8888ff"},
+            "blocks": [
+                {"text": "Start", "color": "myblue", "failure_rate": 0.1},
+                {"text": "Parallel", "color": "gray", "parallel": 2},
+                {"series": [{"text": "A", "color": "white"}, {"text": "B", "color": "white"}]},
+            ],
+        },
+        {"name": "factory", "factory": "diagrams:build", "output": "svg"},
+    ],
+}
+
+FACTORY = """
+from pyrbd import Block, Diagram
+
+
+def build():
+    return Diagram("ignored", [Block("Start", "white"), Block("End", "white")])
+"""
+
+
+def test_block_from_spec() -> None:
+    """Test blocks created from block definitions."""
+
+    block = block_from_spec({"text": "A", "color": "red", "shift": [0.5, 1.0]})
+    assert not isinstance(block, (Series, Group)) and block.shift == (0.5, 1.0)
+
+    group = block_from_spec({"group": [{"text": "A", "color": "red"}], "text": "G", "parallel": 2})
+    assert isinstance(group, Group) and len(group.blocks) == 2
+    assert all(isinstance(member, Group) for member in group.blocks)
+
+    series = block_from_spec(
+        {"series": [{"text": "A", "color": "red", "weibull": {"shape": 2, "scale": 10}}]}
+    )
+    assert isinstance(series, Series) and series.blocks[0].distribution is not None
+
+    voting = block_from_spec({"group": [{"text": "A", "color": "red"}] * 3, "k": 2})
+    assert isinstance(voting, KofN) and voting.k == 2 and len(voting.blocks) == 3
+
+    for invalid in [
+        {"text": "A"},
+        {"group": [{"text": "A", "color": "red"}], "k": 2},
+        {"group": [{"text": "A", "color": "red"}], "k": "2"},
+        {"series": [{"text": "A", "color": "red"}], "k": 1},
+        {"text": "A", "color": "red", "size": 2},
+        {"text": "A", "color": "red", "weibull": [2, 10]},
+        {"series": [], "text": "S"},
+        {"series": [{"text": "A", "color": "red"}], "group": []},
+        ["text", "A"],
+    ]:
+        with pytest.raises(ValueError):
+            block_from_spec(invalid)  # type: ignore[arg-type]
+
+
+def test_read_manifest(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test reading JSON manifest with data and factory diagrams."""
+
+    monkeypatch.setattr(config, "ARROW_STYLE", "")
+    monkeypatch.setattr(config, "CACHE_DIR", None)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    (tmp_path / "diagrams.py").write_text(FACTORY, encoding="utf-8")
+    (manifest := tmp_path / "manifest.json").write_text(json.dumps(SPEC), encoding="utf-8")
+
+    entries = read_manifest(str(manifest), ["pdf", "png"])
+
+    assert config.ARROW_STYLE == "-latex"
+    assert str(tmp_path / "cache") == config.CACHE_DIR
+    assert [entry.diagram.filename for entry in entries] == [
+        str(tmp_path / "simple"),
+        str(tmp_path / "factory"),
+    ]
+    assert [entry.output for entry in entries] == [["pdf", "png"], ["svg"]]
+    assert entries[0].diagram.head.text == "Fire"
+    blocks = entries[0].diagram.blocks
+    assert [block.parent for block in blocks] == [entries[0].diagram.head, *blocks[:-1]]
+    assert entries[0].sources == [] and entries[1].sources == [str(tmp_path / "diagrams.py")]
+
+    assert [entry.signature for entry in read_manifest(str(manifest))] == [
+        entry.signature for entry in entries
+    ]
+    (tmp_path / "diagrams.py").write_text(FACTORY + "\n# changed\n", encoding="utf-8")
+    signatures = [entry.signature for entry in read_manifest(str(manifest), reload=True)]
+    assert signatures[0] == entries[0].signature and signatures[1] != entries[1].signature
+
+
+@pytest.mark.parametrize(
+    ("extension", "parser", "content"),
+    [
+        (
+            "toml",
+            "tomllib",
+            '[[diagrams]]\nname = "d"\nblocks = [{ text = "A", color = "red" }]\n',
+        ),
+        ("yaml", "yaml", "diagrams:\n  - name: d\n    blocks:\n      - {text: A, color: red}\n"),
+    ],
+)
+def test_load_manifest_formats(tmp_path, extension: str, parser: str, content: str) -> None:
+    """Test loading TOML and YAML manifests."""
+
+    pytest.importorskip(parser)
+    (manifest := tmp_path / f"manifest.{extension}").write_text(content, encoding="utf-8")
+
+    assert load_manifest(str(manifest)) == {
+        "diagrams": [{"name": "d", "blocks": [{"text": "A", "color": "red"}]}]
+    }
+
+
+def test_invalid_manifest(tmp_path) -> None:
+    """Test invalid manifests and diagram definitions."""
+
+    (invalid := tmp_path / "manifest.json").write_text('{"blocks": []}', encoding="utf-8")
+    for filename in [str(invalid), str(tmp_path / "manifest.xml")]:
+        with pytest.raises(ValueError):
+            load_manifest(filename)
+
+    with pytest.raises(ValueError):
+        diagram_from_spec({"name": "d", "blocks": [], "size": 1})
+    with pytest.raises(ValueError):
+        diagram_from_spec({"name": "d"})
@@ -0,0 +1,63 @@
+"""Tests for precompiled preamble formats in preamble.py"""
+
+import os
+import sys
+
+import pytest
+
+from pyrbd.preamble import (
+    DUMP_MARKER,
+    build_format,
+    format_name,
+    private_directory,
+    split_preamble,
+)
+from pyrbd.templates import JINJA_ENV
+
+
+def test_split_preamble() -> None:
+    """Test splitting of fixed preamble from .tex content."""
+
+    context = {
+        "serif_font": False,
+        "arrow_style": "-latex",
+        "color_defs": [{"name": "mycolor", "hex_code": "123456"}],
+        "blocks": [],
+        "final_block": None,
+    }
+    content = JINJA_ENV.get_template("diagram.tex.jinja").render(context)
+
+    preamble = split_preamble(content)
+    assert preamble.endswith(DUMP_MARKER + "\n")
+    assert r"\usepackage{tikz}" in preamble
+    assert "helvet" in preamble
+    assert "-latex" not in preamble
+    assert "mycolor" not in preamble
+
+    # Fixed preamble is independent of arrow style and colors
+    serif_content = JINJA_ENV.get_template("diagram.tex.jinja").render(
+        context | {"arrow_style": "", "color_defs": [], "serif_font": True}
+    )
+    assert format_name(split_preamble(serif_content)) != format_name(preamble)
+    assert format_name(split_preamble(content.replace("-latex", "->"))) == format_name(preamble)
+
+    with pytest.raises(ValueError):
+        split_preamble(r"\documentclass{standalone}")
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="requires POSIX permissions")
+def test_private_directory(tmp_path) -> None:
+    """Test that format directories are private to the current user."""
+
+    directory = tmp_path / "formats"
+    private_directory(str(directory))
+    assert directory.stat().st_mode & 0o777 == 0o700
+
+    preamble = r"\documentclass{standalone}" + DUMP_MARKER
+    (directory / f"{format_name(preamble)}.fmt").touch()
+    assert build_format(preamble, str(directory)) == format_name(preamble)
+
+    # Formats planted in a directory writable by other users are never used
+    os.chmod(directory, 0o777)
+    with pytest.raises(PermissionError):
+        build_format(preamble, str(directory))
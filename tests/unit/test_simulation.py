@@ -0,0 +1,74 @@
+"""Tests for Monte Carlo simulation in simulation.py"""
+
+import numpy as np
+import pytest
+
+from pyrbd import Block, Diagram, Group, Series, Weibull
+from pyrbd.simulation import simulate
+
+
+@pytest.fixture(name="diagram")
+def diagram_fixture() -> Diagram:
+    """Diagram pytest fixture."""
+
+    pump = Block("Pump", "white", failure_rate=1e-3, repair_rate=1e-1)
+    valves = Group(
+        [
+            Block("Valve 1", "white", distribution=Weibull(2.0, 1000.0)),
+            Block("Valve 2", "white", fixed_reliability=0.9),
+        ]
+    )
+    return Diagram("test_diagram", [pump, valves], "Hazard")
+
+
+def test_simulate(diagram: Diagram) -> None:
+    """Test `Diagram` `simulate` method."""
+
+    horizon = 500.0
+    result = diagram.simulate(200_000, horizon, seed=1, batch_size=50_000)
+
+    assert result.n_samples == 200_000
+    assert result.reliability == pytest.approx(diagram.evaluate(horizon), abs=5e-3)
+
+    pump_availability = 1e-1 / (1e-3 + 1e-1) + 1e-3 / (1e-3 + 1e-1) * np.exp(-0.101 * horizon)
+    valves_reliability = diagram.blocks[1].reliability(horizon)
+    assert result.availability == pytest.approx(pump_availability * valves_reliability, abs=5e-3)
+    assert result.availability > result.reliability
+
+
+def test_simulate_shared_components() -> None:
+    """Test that leaf blocks of a shared component share their sampled states."""
+
+    supply = Block("Supply", "white", failure_rate=1e-3)
+    branches = Group(
+        [
+            Series([supply.shared_copy(), Block("Pump", "white", failure_rate=1e-3)])
+            for _ in range(3)
+        ]
+    )
+    diagram = Diagram("shared", [supply, branches])
+
+    result = diagram.simulate(100_000, 500.0, seed=1)
+
+    assert result.reliability == pytest.approx(diagram.evaluate(500.0), abs=5e-3)
+    assert diagram.evaluate(500.0) < np.exp(-0.5)
+
+
+def test_simulate_reproducible(diagram: Diagram) -> None:
+    """Test that simulation results are independent of the number of workers."""
+
+    serial = diagram.simulate(20_000, 500.0, seed=2, batch_size=5_000)
+    parallel = diagram.simulate(20_000, 500.0, seed=2, batch_size=5_000, max_workers=2)
+
+    assert serial == parallel
+    assert serial != diagram.simulate(20_000, 500.0, seed=3, batch_size=5_000)
+
+
+def test_simulate_invalid() -> None:
+    """Test invalid arguments to `simulate`."""
+
+    for kwargs in [{"batch_size": 0}, {"max_workers": 0}]:
+        with pytest.raises(ValueError):
+            simulate([Block("block", "white")], 10, 1.0, **kwargs)  # type: ignore
+    with pytest.raises(ValueError):
+        simulate([Block("block", "white")], 0, 1.0)
@@ -0,0 +1,33 @@
+"""Tests for pipeline stage timings in stats.py"""
+
+import json
+import logging
+
+import pytest
+
+from pyrbd import config
+from pyrbd.stats import StageTiming, Stats
+
+
+def test_stats(monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture) -> None:
+    """Test `Stats` recording, hook and logging of stage timings."""
+
+    hooked: list[StageTiming] = []
+    monkeypatch.setattr(config, "STAGE_HOOK", hooked.append)
+    caplog.set_level(logging.DEBUG, logger="pyrbd.stats")
+
+    stats = Stats("diagram")
+    with stats.stage("write", nodes=3) as details:
+        details["tex_chars"] = 100
+    with pytest.raises(RuntimeError), stats.stage("latexmk"):
+        raise RuntimeError("LaTeX error")
+
+    assert [timing.stage for timing in stats.stages] == ["write", "latexmk"]
+    assert stats.stages[0].details == {"nodes": 3, "tex_chars": 100}
+    assert all(timing.name == "diagram" and timing.duration >= 0 for timing in stats.stages)
+    assert stats.total == sum(timing.duration for timing in stats.stages)
+
+    assert hooked == stats.stages
+    assert [record.__dict__["pyrbd_stage"] for record in caplog.records] == stats.stages
+
+    assert json.loads(json.dumps(stats.as_dicts()))[0]["details"]["tex_chars"] == 100
@@ -0,0 +1,74 @@
+"""Tests for pure Python SVG rendering in svg.py"""
+
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from pyrbd import Block, Diagram, Group, KofN, Series, config
+from pyrbd.svg import color
+
+SVG = "{http://www.w3.org/2000/svg}"
+
+
+@pytest.fixture(name="diagram")
+def diagram_fixture() -> Diagram:
+    """Diagram pytest fixture."""
+
+    start_block = Block("Start", "myblue")
+    parallel = 2 * Block("Parallel & blocks", "gray", parent=start_block)
+    group = Group(
+        [Block("Block 1", "yellow!50") + Block("Block 2", "yellow!50"), Block("Block 3", "red")],
+        parent=parallel,
+        text="Group",
+        color="yellow",
+    )
+    series = Series([Block("A", "orange!50"), Block("B", "orange!50")], "Series", parent=group)
+
+    return Diagram(
+        "test_diagram", [start_block, parallel, group, series], "Fire", {"myblue": "8888ff"}
+    )
+
+
+def test_color() -> None:
+    """Test conversion of xcolor colors to SVG colors."""
+
+    assert color("yellow!50", {}) == "#ffff80"
+    assert color("black!70!gray", {}) == "#262626"
+    assert color("myblue!100", {"myblue": "8888ff"}) == "#8888ff"
+    assert color("RoyalBlue", {}) == "royalblue"
+
+
+def test_render_svg(diagram: Diagram, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test `Diagram` `render_svg` method."""
+
+    monkeypatch.setattr(config, "ARROW_STYLE", "")
+    svg = ET.fromstring(diagram.render_svg())
+
+    texts = [text.text for text in svg.iter(f"{SVG}text")]
+    for text in ["Fire", "Start", "Parallel & blocks", "Block 3", "Group", "Series"]:
+        assert text in texts
+
+    fills = [rect.get("fill") for rect in svg.iter(f"{SVG}rect")]
+    assert "#8888ff" in fills
+    assert "#ff6666" in fills
+    assert fills.count("#ffff80") == 2 + 1  # two blocks and group label
+
+    # Head and first block are placed from left to right
+    positions = {text.text: float(text.get("x", 0)) for text in svg.iter(f"{SVG}text")}
+    assert positions["Fire"] < positions["Start"]
+
+    assert "url(#arrowhead)" not in ET.tostring(svg, encoding="unicode")
+    monkeypatch.setattr(config, "ARROW_STYLE", "-latex")
+    assert "url(#arrowhead)" in diagram.render_svg()
+
+
+def test_render_svg_kofn() -> None:
+    """Test `k/n` label of `KofN` instances in SVG output."""
+
+    voting = KofN([Block(f"Block {i}", "white") for i in range(3)], 2)
+    diagram = Diagram("kofn_diagram", [Block("Start", "white"), voting])
+    voting.parent = diagram.head
+
+    texts = [text.text for text in ET.fromstring(diagram.render_svg()).iter(f"{SVG}text")]
+
+    assert "2/3" in texts
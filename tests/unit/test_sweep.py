@@ -0,0 +1,137 @@
+"""Tests for batched parameter sweeps in sweep.py"""
+
+import itertools
+
+import numpy as np
+import pytest
+from numpy.typing import ArrayLike
+
+from pyrbd import Block, Diagram, Group, KofN, Series
+from pyrbd.sweep import _batch, sweep
+
+from .test_bdd import _bridge
+
+
+@pytest.fixture(name="diagram")
+def diagram_fixture() -> Diagram:
+    """Diagram pytest fixture."""
+
+    pump = Block("Pump", "white", failure_rate=1e-3)
+    valves = KofN(
+        [
+            Block("Valve 1", "white", failure_rate=2e-3),
+            Block("Valve 2", "white", fixed_reliability=0.9),
+            Block("Valve 3", "white", failure_rate=2e-3),
+        ],
+        2,
+    )
+    return Diagram("test_diagram", [pump, valves, Group([Block("Tank", "white") * 2])], "Hazard")
+
+
+def _pointwise(blocks: list[Block], params: dict[str, list[float]], t: np.ndarray) -> np.ndarray:
+    """Reliability of blocks in series over the grid, one evaluation per grid point."""
+
+    leaves = list(itertools.chain.from_iterable(block.get_blocks() for block in blocks))
+    results = []
+    for rates in itertools.product(*params.values()):
+        for key, rate in zip(params, rates, strict=True):
+            for leaf in leaves:
+                if leaf.id == key:
+                    leaf.fixed_reliability, leaf.failure_rate = None, rate
+        diagram = Diagram("pointwise", [block.copy() for block in blocks])
+        results.append(diagram.evaluate(t))
+
+    return np.reshape(results, (*(len(values) for values in params.values()), *t.shape))
+
+
+def test_diagram_sweep(diagram: Diagram) -> None:
+    """Test `Diagram` `sweep` method against evaluation at each grid point."""
+
+    pump, valve = diagram.blocks[0], list(diagram.blocks[1].get_blocks())[1]
+    params = {pump.id: [0.0, 1e-3, 1e-2], valve.id: [1e-4, 1e-3, 1e-2, 1e-1]}
+    t = np.linspace(0.0, 1000.0, 5)
+
+    result = diagram.sweep(params, t)
+
+    assert result.shape == (3, 4, 5)
+    assert np.allclose(result, _pointwise([diagram.head, *diagram.blocks], params, t))
+    assert diagram.sweep({}, t).shape == t.shape
+    assert np.allclose(diagram.sweep({}, t), diagram.evaluate(t))
+    assert diagram.sweep({pump.id: np.zeros((2, 3))}, 1.0).shape == (2, 3)
+
+
+def test_sweep_shared_components() -> None:
+    """Test that swept failure rates apply to all leaf blocks of a shared component."""
+
+    (a, *_), bridge = _bridge()
+    leaves = [leaf for leaf in bridge.get_blocks() if leaf.component is a]
+    t = np.array([0.5, 1.0, 2.0])
+
+    result = sweep([bridge], {a.id: [0.1, 1.0]}, t)
+
+    for rate, expected in zip([0.1, 1.0], result, strict=True):
+        for leaf in leaves:
+            leaf.failure_rate = rate
+        assert np.allclose(
+            Diagram("bridge", [Block("Start", "white"), bridge]).evaluate(t), expected
+        )
+
+
+def test_sweep_chunks(diagram: Diagram) -> None:
+    """Test that results are independent of chunk size and number of workers."""
+
+    blocks = [diagram.head, *diagram.blocks]
+    valve = next(blocks[2].get_blocks())
+    params: dict[str, ArrayLike] = {
+        blocks[1].id: np.linspace(0.0, 1e-2, 7),
+        valve.id: [1e-3, 1e-2],
+    }
+    t = np.linspace(0.0, 1000.0, 3)
+
+    result = sweep(blocks, params, t)
+
+    assert np.array_equal(sweep(blocks, params, t, chunk_size=3), result)
+    assert np.array_equal(sweep(blocks, params, t, chunk_size=3, max_workers=2), result)
+    assert sweep(blocks, {blocks[1].id: []}, t).shape == (0, 3)
+
+
+def test_batch() -> None:
+    """Test parameter values of chunks of flattened grid points."""
+
+    arrays = {"a": np.array([1.0, 2.0, 3.0]), "b": np.array([[4.0, 5.0], [6.0, 7.0]])}
+    grid = np.meshgrid(*(array.ravel() for array in arrays.values()), indexing="ij")
+
+    for start, stop in [(0, 12), (0, 5), (5, 10), (10, 12), (3, 3)]:
+        batch = _batch(arrays, start, stop)
+        for key, values in zip(arrays, grid, strict=True):
+            assert np.array_equal(batch[key], values.ravel()[start:stop])
+    assert not _batch({}, 0, 1)
+
+
+def test_sweep_invalid(diagram: Diagram) -> None:
+    """Test invalid arguments to `sweep`."""
+
+    blocks = [diagram.head, *diagram.blocks]
+    invalid: list[dict[str, list[float]]] = [
+        {"unknown": [1.0]},
+        {blocks[2].id: [1.0]},
+        {blocks[1].id: [-1.0]},
+    ]
+    for params in invalid:
+        with pytest.raises(ValueError):
+            sweep(blocks, params, 1.0)
+    for kwargs in [{"chunk_size": 0}, {"max_workers": 0}]:
+        with pytest.raises(ValueError):
+            sweep(blocks, {}, 1.0, **kwargs)  # type: ignore
+
+
+def test_sweep_series() -> None:
+    """Test sweep of a leaf block in a multiplied series, applied to all its copies."""
+
+    series = Series([Block("A", "white", failure_rate=1.0)]) * 3
+    rates = np.array([0.5, 2.0])
+    leaf = next(series.get_blocks())
+
+    result = sweep([series], {leaf.id: rates}, 1.0)
+
+    assert np.allclose(result, np.exp(-3 * rates))
@@ -0,0 +1,11 @@
+"""Tests for template loading in templates.py"""
+
+from pyrbd.templates import JINJA_ENV, get_template
+
+
+def test_get_template() -> None:
+    """Test that `get_template` compiles each template once."""
+
+    assert not JINJA_ENV.auto_reload
+    assert get_template("block.tex.jinja") is get_template("block.tex.jinja")
+    assert get_template("block.tex.jinja") is not get_template("group.tex.jinja")